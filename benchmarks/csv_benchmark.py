@@ -0,0 +1,59 @@
+"""
+Compares the default pandas CSV wing with the pyarrow CSV wing.
+
+    python benchmarks/csv_benchmark.py --rows 5000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from kedro.extras.datasets.pandas import CSVDataSet
+
+from kedro_wings.datasets.arrow import ArrowCSVDataSet
+
+
+def _timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "id": np.arange(args.rows),
+            "value": rng.random(args.rows),
+            "count": rng.integers(0, 1000, args.rows),
+            "label": rng.choice(["setosa", "versicolor", "virginica"], args.rows),
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        datasets = {
+            "pandas.CSVDataSet": CSVDataSet(os.path.join(tmp_dir, "pandas.csv")),
+            "ArrowCSVDataSet": ArrowCSVDataSet(
+                os.path.join(tmp_dir, "arrow.csv"), threads=args.threads
+            ),
+        }
+        print(f"{args.rows} rows, best of {args.repeat}")
+        for name, dataset in datasets.items():
+            save_time = _timed(lambda: dataset.save(data), args.repeat)
+            load_time = _timed(dataset.load, args.repeat)
+            print(f"{name:>20}: save {save_time:.3f}s, load {load_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
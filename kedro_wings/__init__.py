@@ -1 +1,10 @@
-from .kedro_wings import KedroWings
+def __getattr__(name):
+    # KedroWings is imported on first use, so that importing kedro_wings stays cheap
+    if name == "KedroWings":
+        from .kedro_wings import KedroWings
+
+        return KedroWings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["KedroWings"]
@@ -0,0 +1,23 @@
+from typing import Any, Dict
+
+from .sampling import dataset_type_name
+
+APPEND_SUFFIX = "+"
+
+APPEND_TYPES = {
+    "CSVDataSet": {"type": "kedro_wings.datasets.pandas.AppendCSVDataSet"},
+    "ParquetDataSet": {"type": "kedro_wings.datasets.pandas.AppendParquetDataSet"},
+    "JSONLinesDataSet": {"append": True},
+}  # type: Dict[str, Dict[str, Any]]
+
+
+def append_config(dataset_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rewrites a dataset config so that saves are added to the existing data, instead of replacing it
+    """
+    type_name = dataset_type_name(dataset_config["type"])
+    if type_name not in APPEND_TYPES:
+        raise ValueError(
+            f"{type_name} can't be appended to, only {sorted(APPEND_TYPES)} can."
+        )
+    return {**dataset_config, **APPEND_TYPES[type_name]}
@@ -0,0 +1,32 @@
+from typing import Any, Dict, Union
+
+DEFAULT_BACKEND = "pandas"
+
+_POLARS_TYPE = {"type": "kedro_wings.datasets.polars.LazyPolarsDataSet"}
+_ARROW_TYPE = {"type": "kedro_wings.datasets.arrow.ArrowTableDataSet"}
+
+# The dataset configs replacing the default configs of the tabular extensions, per backend
+BACKEND_TYPES = {
+    "pandas": {},
+    "polars": {".csv": _POLARS_TYPE, ".parquet": _POLARS_TYPE, ".feather": _POLARS_TYPE},
+    "arrow": {".csv": _ARROW_TYPE, ".parquet": _ARROW_TYPE, ".feather": _ARROW_TYPE},
+}  # type: Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def verify_backend(backend: Union[str, Dict[str, str]]):
+    """
+    Verifies a backend, or a mapping of layers to backends
+    """
+    layer_backends = backend if isinstance(backend, dict) else {"": backend}
+    for layer, layer_backend in layer_backends.items():
+        if layer_backend not in BACKEND_TYPES:
+            raise ValueError(
+                f"Backend of {layer or 'all layers'} should be one of {sorted(BACKEND_TYPES)}, got {layer_backend}"
+            )
+
+
+def backend_config(backend: str, extension: str) -> Dict[str, Any]:
+    """
+    The dataset config of an extension's wings for a backend, if it replaces the default config
+    """
+    return BACKEND_TYPES[backend].get(extension)
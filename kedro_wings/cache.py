@@ -0,0 +1,234 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    import fsspec
+
+WRITE_MODES = ("through", "back")
+_INDEX_NAME = "index.json"
+# Seconds between index writes, which are otherwise batched until the next flush or exit
+_INDEX_SAVE_INTERVAL = 1.0
+_VALIDATOR_KEYS = (
+    "ETag",
+    "etag",
+    "md5Hash",
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "created",
+    "size",
+)
+
+
+def _validator(info: Dict[str, Any]) -> str:
+    """
+    The ETag, modification time and size of a remote file, used to check a cached copy
+    """
+    return json.dumps(
+        {k: info[k] for k in _VALIDATOR_KEYS if k in info}, sort_keys=True, default=str
+    )
+
+
+class LocalCache:
+    """
+    A local disk cache of remote files, bounded by a byte budget with LRU eviction.
+    Writes are uploaded on close (write-through) or when flushed (write-back).
+
+    Transfers of a file are serialized by a lock of its own, so different files download in parallel.
+    The shared lock only guards the index, which is written to disk at most once per second.
+    """
+
+    def __init__(
+        self, directory: str, max_bytes: int = None, write: str = "through",
+    ):
+        if write not in WRITE_MODES:
+            raise ValueError(f"Cache write mode must be one of {WRITE_MODES}, got {write}")
+        self._directory = os.path.expanduser(directory)
+        self._max_bytes = max_bytes
+        self._write = write
+        self._lock = threading.RLock()
+        self._key_locks = {}  # type: Dict[str, threading.Lock]
+        self._pending = {}
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self._directory, exist_ok=True)
+        self._index_path = os.path.join(self._directory, _INDEX_NAME)
+        self._index = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path) as f:
+                self._index = json.load(f)
+        atexit.register(self.save_index)
+
+    @staticmethod
+    def _key(fs: "fsspec.AbstractFileSystem", path: str) -> str:
+        protocol = fs.protocol if isinstance(fs.protocol, str) else fs.protocol[0]
+        return f"{protocol}://{path}"
+
+    def _local_path(self, key: str) -> str:
+        _, ext = os.path.splitext(key)
+        return os.path.join(self._directory, hashlib.sha1(key.encode()).hexdigest() + ext)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def save_index(self):
+        """
+        Writes the index to disk, if it changed since it was last written
+        """
+        with self._lock:
+            if not self._index_dirty:
+                return
+            tmp_path = f"{self._index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self._index_path)
+            self._index_dirty = False
+            self._index_saved_at = time.monotonic()
+
+    def _touch(self, key: str, local_path: str, validator: Optional[str]):
+        with self._lock:
+            self._index[key] = {
+                "local_path": local_path,
+                "validator": validator,
+                "size": os.path.getsize(local_path),
+                "atime": time.time(),
+            }
+            self._evict(keep=key)
+            self._index_dirty = True
+            if time.monotonic() - self._index_saved_at >= _INDEX_SAVE_INTERVAL:
+                self.save_index()
+
+    def _evict(self, keep: str):
+        if self._max_bytes is None:
+            return
+        total = sum(entry["size"] for entry in self._index.values())
+        by_last_access = sorted(self._index.items(), key=lambda kv: kv[1]["atime"])
+        for key, entry in by_last_access:
+            if total <= self._max_bytes:
+                break
+            if key == keep or key in self._pending:
+                continue
+            if os.path.exists(entry["local_path"]):
+                os.unlink(entry["local_path"])
+            del self._index[key]
+            total -= entry["size"]
+
+    def fetch(self, fs: "fsspec.AbstractFileSystem", path: str) -> str:
+        """
+        Returns a local copy of a remote file, downloading it if the cached copy is missing or stale
+        """
+        key = self._key(fs, path)
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._index.get(key)
+                pending = key in self._pending
+            validator = entry["validator"] if pending else _validator(fs.info(path))
+
+            hit = (
+                entry is not None
+                and entry["validator"] == validator
+                and os.path.exists(entry["local_path"])
+            )
+            if hit:
+                local_path = entry["local_path"]
+            else:
+                local_path = self._local_path(key)
+                tmp_path = f"{local_path}.part"
+                fs.get(path, tmp_path)
+                os.replace(tmp_path, local_path)
+            with self._lock:
+                if hit:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                self._touch(key, local_path, validator)
+            return local_path
+
+    def commit(self, fs: "fsspec.AbstractFileSystem", path: str, staged_path: str):
+        """
+        Moves a written file into the cache, uploading it now or on the next flush
+        """
+        key = self._key(fs, path)
+        with self._key_lock(key):
+            local_path = self._local_path(key)
+            os.replace(staged_path, local_path)
+            if self._write == "through":
+                fs.put(local_path, path)
+                fs.invalidate_cache(path)
+                validator = _validator(fs.info(path))
+            else:
+                validator = None
+            with self._lock:
+                if self._write == "through":
+                    self._pending.pop(key, None)
+                else:
+                    self._pending[key] = (fs, path)
+                self._touch(key, local_path, validator)
+
+    def is_pending(self, fs: "fsspec.AbstractFileSystem", path: str) -> bool:
+        return self._key(fs, path) in self._pending
+
+    def pending_path(self, fs: "fsspec.AbstractFileSystem", path: str) -> Optional[str]:
+        """
+        The local copy of a file written in write-back mode and not uploaded yet
+        """
+        key = self._key(fs, path)
+        with self._lock:
+            if key not in self._pending:
+                return None
+            return self._index[key]["local_path"]
+
+    def discard(self, fs: "fsspec.AbstractFileSystem", prefix: str):
+        """
+        Drops the cached copies of the files of a filesystem under a path prefix, once they are moved or removed
+        """
+        prefix_key = self._key(fs, prefix)
+        with self._lock:
+            for key in [k for k in self._index if k.startswith(prefix_key) and k not in self._pending]:
+                local_path = self._index.pop(key)["local_path"]
+                if os.path.exists(local_path):
+                    os.unlink(local_path)
+                self._index_dirty = True
+
+    def flush(self, fs: "fsspec.AbstractFileSystem" = None, prefix: str = None):
+        """
+        Uploads the files written in write-back mode, or only those of a filesystem under a path prefix
+        """
+        prefix_key = None if fs is None else self._key(fs, prefix or "")
+        with self._lock:
+            pending = [
+                (key, value)
+                for key, value in self._pending.items()
+                if prefix_key is None or key.startswith(prefix_key)
+            ]
+        for key, (fs, path) in pending:
+            with self._key_lock(key):
+                with self._lock:
+                    local_path = self._index[key]["local_path"]
+                fs.put(local_path, path)
+                fs.invalidate_cache(path)
+                validator = _validator(fs.info(path))
+                with self._lock:
+                    self._index[key]["validator"] = validator
+                    self._pending.pop(key, None)
+                    self._index_dirty = True
+        self.save_index()
+
+
+def __getattr__(name):
+    # The fsspec wrapper is imported on first use, so that importing the hook doesn't import fsspec
+    if name == "CachedFileSystem":
+        from .cached_filesystem import CachedFileSystem
+
+        return CachedFileSystem
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,173 @@
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Any, Dict
+
+import fsspec
+
+from .cache import LocalCache
+
+
+class _StagedFile:
+    """
+    A locally written file which is committed to the cache when closed without error
+    """
+
+    def __init__(self, staged_file, on_commit, on_discard):
+        self._file = staged_file
+        self._on_commit = on_commit
+        self._on_discard = on_discard
+
+    def __getattr__(self, item):
+        return getattr(self._file, item)
+
+    def __iter__(self):
+        return iter(self._file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self._file.close()
+            self._on_discard()
+            return
+        self.close()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        self._on_commit()
+
+
+class CachedFileSystem(fsspec.AbstractFileSystem):
+    """
+    Wraps a remote filesystem so that opened files are served from, and written through, a LocalCache.
+    It is an fsspec filesystem itself, so that it can be handed to pyarrow like the one it wraps.
+    Everything but opening files is done by the wrapped filesystem.
+    Files held back by a write-back cache are uploaded before the paths above them are listed,
+    moved, copied or removed, so that the wrapped filesystem sees them.
+    """
+
+    cachable = False
+    _TEXT_OPEN_ARGS = ("encoding", "errors", "newline")
+
+    def __init__(self, fs: "fsspec.AbstractFileSystem", cache: LocalCache):
+        super().__init__()
+        self._fs = fs
+        self._cache = cache
+        self.protocol = fs.protocol
+
+    def __getattr__(self, item):
+        if item in ("_fs", "_cache"):
+            raise AttributeError(item)
+        return getattr(self._fs, item)
+
+    def _strip_protocol(self, path: str) -> str:
+        return self._fs._strip_protocol(path)
+
+    def _prefixes(self, paths):
+        for path in [paths] if isinstance(paths, str) else paths:
+            # Globs cover everything under their literal prefix
+            yield re.split(r"[*?\[]", self._fs._strip_protocol(path), maxsplit=1)[0]
+
+    def _upload_pending(self, paths):
+        for prefix in self._prefixes(paths):
+            self._cache.flush(self._fs, prefix)
+
+    def _discard(self, paths):
+        for prefix in self._prefixes(paths):
+            self._cache.discard(self._fs, prefix)
+
+    def open(self, path: str, mode: str = "rb", **kwargs):
+        path = self._fs._strip_protocol(path)
+        open_args = {k: v for k, v in kwargs.items() if k in self._TEXT_OPEN_ARGS}
+        if "r" in mode and "+" not in mode:
+            return open(self._cache.fetch(self._fs, path), mode, **open_args)
+
+        staged_path = os.path.join(
+            self._cache._directory, f"{threading.get_ident()}-{time.time_ns()}.staged"
+        )
+        if "a" in mode and self.exists(path):
+            shutil.copyfile(self._cache.fetch(self._fs, path), staged_path)
+
+        def _discard():
+            if os.path.exists(staged_path):
+                os.unlink(staged_path)
+
+        return _StagedFile(
+            open(staged_path, mode, **open_args),
+            lambda: self._cache.commit(self._fs, path, staged_path),
+            _discard,
+        )
+
+    def exists(self, path: str, **kwargs) -> bool:
+        path = self._fs._strip_protocol(path)
+        return self._cache.is_pending(self._fs, path) or self._fs.exists(path, **kwargs)
+
+    def info(self, path: str, **kwargs) -> Dict[str, Any]:
+        path = self._fs._strip_protocol(path)
+        pending_path = self._cache.pending_path(self._fs, path)
+        if pending_path is not None:
+            return {"name": path, "size": os.path.getsize(pending_path), "type": "file"}
+        return self._fs.info(path, **kwargs)
+
+    def isfile(self, path: str) -> bool:
+        path = self._fs._strip_protocol(path)
+        return self._cache.is_pending(self._fs, path) or self._fs.isfile(path)
+
+    def isdir(self, path: str) -> bool:
+        self._upload_pending(path)
+        return self._fs.isdir(path)
+
+    def ls(self, path: str, detail: bool = True, **kwargs):
+        self._upload_pending(path)
+        return self._fs.ls(path, detail=detail, **kwargs)
+
+    def find(self, path: str, **kwargs):
+        self._upload_pending(path)
+        return self._fs.find(path, **kwargs)
+
+    def glob(self, path: str, **kwargs):
+        self._upload_pending(path)
+        return self._fs.glob(path, **kwargs)
+
+    def walk(self, path: str, **kwargs):
+        self._upload_pending(path)
+        return self._fs.walk(path, **kwargs)
+
+    def mkdir(self, path: str, create_parents: bool = True, **kwargs):
+        return self._fs.mkdir(path, create_parents=create_parents, **kwargs)
+
+    def makedirs(self, path: str, exist_ok: bool = False):
+        return self._fs.makedirs(path, exist_ok=exist_ok)
+
+    def rm(self, path, recursive: bool = False, maxdepth: int = None):
+        self._upload_pending(path)
+        self._fs.rm(path, recursive=recursive, maxdepth=maxdepth)
+        self._discard(path)
+
+    def rm_file(self, path: str):
+        self._upload_pending(path)
+        self._fs.rm_file(path)
+        self._discard(path)
+
+    def rmdir(self, path: str):
+        self._upload_pending(path)
+        self._fs.rmdir(path)
+        self._discard(path)
+
+    def mv(self, path1, path2, recursive: bool = False, maxdepth: int = None, **kwargs):
+        self._upload_pending(path1)
+        self._fs.mv(path1, path2, recursive=recursive, maxdepth=maxdepth, **kwargs)
+        self._discard(path1)
+
+    def copy(self, path1, path2, recursive: bool = False, **kwargs):
+        self._upload_pending(path1)
+        return self._fs.copy(path1, path2, recursive=recursive, **kwargs)
+
+    def invalidate_cache(self, path: str = None):
+        return self._fs.invalidate_cache(path)
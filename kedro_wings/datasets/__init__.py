@@ -0,0 +1,4 @@
+"""
+Datasets shipped with KedroWings.
+They are imported only when a wing that uses them is created.
+"""
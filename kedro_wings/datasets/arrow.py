@@ -0,0 +1,419 @@
+import logging
+import random
+import threading
+from typing import Any, Dict, List
+
+import pandas as pd
+from kedro.io.core import DataSetError, Version
+
+from .core import FileDataSet, temp_path
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import dataset as pa_dataset
+    from pyarrow import ipc as pa_ipc
+    from pyarrow import parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pa_csv = None
+    pa_dataset = None
+    pa_ipc = None
+    pq = None
+
+TABLE_FORMATS = {".csv": "csv", ".parquet": "parquet", ".feather": "feather", ".arrow": "feather"}
+
+logger = logging.getLogger("KedroWings")
+
+# pyarrow's CPU thread pool is process-wide, so loads limiting it take turns and restore it
+_CPU_COUNT_LOCK = threading.Lock()
+
+# The pandas arguments of the pyarrow.csv options, used when pyarrow is not installed
+_PANDAS_CSV_ARGS = {
+    "read_options": {
+        "skip_rows": "skiprows",
+        "column_names": "names",
+        "encoding": "encoding",
+        "block_size": None,
+        "use_threads": None,
+    },
+    "parse_options": {
+        "delimiter": "sep",
+        "quote_char": "quotechar",
+        "double_quote": "doublequote",
+        "escape_char": "escapechar",
+    },
+    "convert_options": {
+        "column_types": "dtype",
+        "null_values": "na_values",
+        "true_values": "true_values",
+        "false_values": "false_values",
+        "include_columns": "usecols",
+    },
+    "write_options": {"include_header": "header", "delimiter": "sep"},
+}
+
+
+def _pandas_csv_args(args: Dict[str, Any], option_keys: List[str]) -> Dict[str, Any]:
+    """
+    Maps pyarrow.csv options to pandas arguments, raising for the options pandas has no equivalent of
+    """
+    pandas_args = {}
+    for option_key in option_keys:
+        for key, value in args.get(option_key, {}).items():
+            if key not in _PANDAS_CSV_ARGS[option_key]:
+                raise DataSetError(
+                    f"{option_key} '{key}' is not supported without pyarrow installed."
+                )
+            pandas_key = _PANDAS_CSV_ARGS[option_key][key]
+            if pandas_key is not None:
+                pandas_args[pandas_key] = value
+    if "names" in pandas_args:
+        pandas_args["header"] = None
+    return pandas_args
+
+
+class ArrowCSVDataSet(FileDataSet):
+    """
+    Loads and saves CSV files with pyarrow's multithreaded reader and writer.
+    Falls back to pandas when pyarrow is not installed.
+
+    load_args may contain `read_options`, `parse_options` and `convert_options`,
+    and save_args may contain `write_options`, as accepted by ``pyarrow.csv``.
+    Without pyarrow, the options with a pandas equivalent are passed to pandas, and the others raise.
+    """
+
+    DEFAULT_LOAD_ARGS = {}  # type: Dict[str, Any]
+    DEFAULT_SAVE_ARGS = {}  # type: Dict[str, Any]
+
+    def __init__(
+        self,
+        filepath: str,
+        threads: int = None,
+        block_size: int = None,
+        to_pandas: bool = True,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param threads: Number of threads used by pyarrow. Default: all cores
+        :param block_size: Bytes processed by each thread at a time. Default: pyarrow's default
+        :param to_pandas: Load a pandas DataFrame instead of a pyarrow Table.
+        """
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._threads = threads
+        self._block_size = block_size
+        self._to_pandas = to_pandas
+        if pa is None:
+            if not to_pandas:
+                raise DataSetError("'to_pandas' can only be disabled with pyarrow installed.")
+            logger.warning(
+                f"pyarrow is not installed, {filepath} will be read and written with pandas"
+            )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            **super()._describe(),
+            threads=self._threads,
+            block_size=self._block_size,
+            to_pandas=self._to_pandas,
+        )
+
+    def _read_options(self):
+        read_options = dict(self._load_args.get("read_options", {}))
+        read_options.setdefault("use_threads", self._threads != 1)
+        if self._block_size:
+            read_options.setdefault("block_size", self._block_size)
+        return pa_csv.ReadOptions(**read_options)
+
+    def _load(self) -> Any:
+        load_path = self._load_path()
+        with self._fs.open(load_path, mode="rb", **self._fs_open_args_load) as fs_file:
+            if pa is None:
+                return pd.read_csv(
+                    fs_file,
+                    **_pandas_csv_args(
+                        self._load_args, ["read_options", "parse_options", "convert_options"]
+                    ),
+                )
+
+            if not self._threads or self._threads == 1:
+                return self._read_table(fs_file)
+            with _CPU_COUNT_LOCK:
+                cpu_count = pa.cpu_count()
+                pa.set_cpu_count(self._threads)
+                try:
+                    return self._read_table(fs_file)
+                finally:
+                    pa.set_cpu_count(cpu_count)
+
+    def _read_table(self, fs_file) -> Any:
+        table = pa_csv.read_csv(
+            fs_file,
+            read_options=self._read_options(),
+            parse_options=pa_csv.ParseOptions(**self._load_args.get("parse_options", {})),
+            convert_options=pa_csv.ConvertOptions(**self._load_args.get("convert_options", {})),
+        )
+        if self._to_pandas:
+            return table.to_pandas(use_threads=self._threads != 1)
+        return table
+
+    def _save(self, data: Any) -> None:
+        save_path = self._save_path()
+        if pa is None:
+            with self._fs.open(save_path, mode="w", **self._fs_open_args_save) as fs_file:
+                data.to_csv(
+                    fs_file, index=False, **_pandas_csv_args(self._save_args, ["write_options"])
+                )
+            self._invalidate_cache()
+            return
+
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False, nthreads=self._threads)
+        with self._fs.open(save_path, mode="wb", **self._fs_open_args_save) as fs_file:
+            pa_csv.write_csv(
+                data,
+                fs_file,
+                write_options=pa_csv.WriteOptions(**self._save_args.get("write_options", {})),
+            )
+        self._invalidate_cache()
+
+
+class SampledParquetDataSet(FileDataSet):
+    """
+    Loads the first rows, or a seeded random fraction of the row groups, of a parquet file.
+    Only the sampled row groups are read from disk.
+    Sampled datasets are read-only.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        rows: int = None,
+        fraction: float = None,
+        seed: int = 0,
+        load_args: Dict[str, Any] = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        if (rows is None) == (fraction is None):
+            raise ValueError("Exactly one of 'rows' and 'fraction' must be given.")
+        super().__init__(filepath, load_args, None, None, credentials, fs_args)
+        self._rows = rows
+        self._fraction = fraction
+        self._seed = seed
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            **super()._describe(), rows=self._rows, fraction=self._fraction, seed=self._seed
+        )
+
+    def _read_table(self, parquet_file) -> "pa.Table":
+        columns = self._load_args.get("columns")
+        if self._rows is not None:
+            batches = []
+            remaining = self._rows
+            for batch in parquet_file.iter_batches(
+                batch_size=min(max(remaining, 1), 65536), columns=columns
+            ):
+                batches.append(batch.slice(0, remaining))
+                remaining -= batches[-1].num_rows
+                if remaining <= 0:
+                    break
+            if not batches:
+                return parquet_file.schema_arrow.empty_table()
+            return pa.Table.from_batches(batches)
+
+        n_row_groups = parquet_file.num_row_groups
+        rng = random.Random(self._seed)
+        n_sampled = max(int(round(n_row_groups * self._fraction)), 1)
+        row_groups = sorted(rng.sample(range(n_row_groups), min(n_sampled, n_row_groups)))
+        return parquet_file.read_row_groups(row_groups, columns=columns)
+
+    def _load(self) -> pd.DataFrame:
+        load_path = self._load_path()
+        with self._fs.open(load_path, mode="rb", **self._fs_open_args_load) as fs_file:
+            return self._read_table(pq.ParquetFile(fs_file)).to_pandas()
+
+    def _save(self, data: Any) -> None:
+        raise DataSetError(f"Sampled dataset {self._filepath} is read-only")
+
+
+def to_record_batches(data: Any) -> "pa.RecordBatchReader":
+    """
+    A reader of the record batches of a pyarrow Table or Dataset, a pandas DataFrame or a polars frame
+    """
+    if isinstance(data, pa.RecordBatchReader):
+        return data
+    if hasattr(data, "collect"):
+        data = data.collect()
+    if isinstance(data, pd.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    elif hasattr(data, "to_arrow"):
+        data = data.to_arrow()
+    if isinstance(data, pa_dataset.Dataset):
+        return data.scanner().to_reader()
+    return data.to_reader()
+
+
+class ArrowTableDataSet(FileDataSet):
+    """
+    Loads CSV, parquet and feather files as pyarrow Tables, without converting them to pandas.
+    The `columns` and `filters` load_args are pushed into the scan, so parquet and feather files
+    only read the columns and row groups selected.
+
+    Saves pyarrow Tables and RecordBatchReaders, pandas DataFrames and polars frames,
+    one record batch at a time.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        file_format: str = None,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param file_format: csv, parquet or feather. Default: from the file extension
+        :param load_args: columns, and filters in the disjunctive normal form of pyarrow.parquet.read_table
+        :param save_args: Passed to the pyarrow parquet, feather or CSV writer.
+        """
+        if pa is None:
+            raise ImportError("ArrowTableDataSet requires pyarrow to be installed.")
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        if file_format is None:
+            file_format = next(
+                (f for e, f in TABLE_FORMATS.items() if str(filepath).endswith(e)), None
+            )
+        if file_format not in ("csv", "parquet", "feather"):
+            raise ValueError(
+                f"'file_format' should be one of csv, parquet, feather, got '{file_format}'."
+            )
+        self._file_format = file_format
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(**super()._describe(), file_format=self._file_format)
+
+    def _load(self) -> "pa.Table":
+        load_args = dict(self._load_args)
+        filters = load_args.pop("filters", None)
+        dataset = pa_dataset.dataset(
+            self._load_path(), format=self._file_format, filesystem=self._fs, partitioning="hive"
+        )
+        return dataset.to_table(
+            filter=pq.filters_to_expression(filters) if filters else None, **load_args
+        )
+
+    def _writer(self, fs_file, schema: "pa.Schema"):
+        if self._file_format == "parquet":
+            return pq.ParquetWriter(fs_file, schema, **self._save_args)
+        if self._file_format == "feather":
+            return pa_ipc.new_file(fs_file, schema, **self._save_args)
+        return pa_csv.CSVWriter(
+            fs_file, schema, write_options=pa_csv.WriteOptions(**self._save_args)
+        )
+
+    def _save(self, data: Any) -> None:
+        reader = to_record_batches(data)
+        with self._fs.open(self._save_path(), mode="wb", **self._fs_open_args_save) as fs_file:
+            with self._writer(fs_file, reader.schema) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+        self._invalidate_cache()
+
+
+class PartitionedParquetDataSet(FileDataSet):
+    """
+    Loads and saves hive-partitioned parquet datasets, directories such as `sales.parquet/region=eu/part-0.parquet`.
+    Partitions are written in parallel, one record batch at a time.
+    The `filters` load_arg prunes the partitions read, and `columns` the columns.
+
+    Saving replaces the whole dataset. The new dataset is written to a directory next to it,
+    and swapped in once complete, so the data being saved may be read from the dataset it replaces.
+    """
+
+    DEFAULT_SAVE_ARGS = {"basename_template": "part-{i}.parquet"}  # type: Dict[str, Any]
+
+    def __init__(
+        self,
+        filepath: str,
+        partition_cols: List[str] = None,
+        to_pandas: bool = True,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param partition_cols: The columns the saved data is partitioned by.
+        :param to_pandas: Load a pandas DataFrame instead of a pyarrow Table.
+        :param load_args: columns, and filters in the disjunctive normal form of pyarrow.parquet.read_table
+        :param save_args: Passed to pyarrow.dataset.write_dataset, such as max_partitions
+        """
+        if pa is None:
+            raise ImportError("PartitionedParquetDataSet requires pyarrow to be installed.")
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._partition_cols = list(partition_cols or [])
+        self._to_pandas = to_pandas
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            **super()._describe(), partition_cols=self._partition_cols, to_pandas=self._to_pandas
+        )
+
+    def _load(self) -> Any:
+        load_args = dict(self._load_args)
+        filters = load_args.pop("filters", None)
+        dataset = pa_dataset.dataset(
+            self._load_path(), format="parquet", filesystem=self._fs, partitioning="hive"
+        )
+        table = dataset.to_table(
+            filter=pq.filters_to_expression(filters) if filters else None, **load_args
+        )
+        if self._to_pandas:
+            return table.to_pandas()
+        return table
+
+    def _save(self, data: Any) -> None:
+        save_path = self._save_path().rstrip("/")
+        write_path = temp_path(save_path)
+        try:
+            pa_dataset.write_dataset(
+                to_record_batches(data),
+                write_path,
+                format="parquet",
+                filesystem=self._fs,
+                partitioning=self._partition_cols or None,
+                partitioning_flavor="hive" if self._partition_cols else None,
+                existing_data_behavior="overwrite_or_ignore",
+                **self._save_args,
+            )
+            self._swap(write_path, save_path)
+        finally:
+            if self._fs.exists(write_path):
+                self._fs.rm(write_path, recursive=True)
+        self._invalidate_cache()
+
+    def _swap(self, write_path: str, save_path: str):
+        """
+        Replaces the dataset directory with the newly written one
+        """
+        if not self._fs.exists(save_path):
+            self._fs.mv(write_path, save_path, recursive=True)
+            return
+        if self._local_path(save_path) is None:
+            # Object stores have no directory renames, so the replaced objects are removed first
+            self._fs.rm(save_path, recursive=True)
+            self._fs.mv(write_path, save_path, recursive=True)
+            return
+        replaced_path = f"{write_path}.replaced"
+        self._fs.mv(save_path, replaced_path, recursive=True)
+        self._fs.mv(write_path, save_path, recursive=True)
+        self._fs.rm(replaced_path, recursive=True)
@@ -0,0 +1,105 @@
+import os
+import threading
+from copy import deepcopy
+from pathlib import PurePosixPath
+from typing import Any, Dict, Optional
+
+import fsspec
+from kedro.io.core import (
+    AbstractVersionedDataSet,
+    DataSetError,
+    Version,
+    get_filepath_str,
+    get_protocol_and_path,
+)
+
+LOCAL_PROTOCOLS = {"file", "local"}
+
+
+def temp_path(path: str) -> str:
+    """
+    A hidden path next to a file, where its replacement is written before being swapped in.
+    Swapping leaves the replaced file intact for anything still reading or memory-mapping it.
+    """
+    directory, basename = os.path.split(path.rstrip("/"))
+    return os.path.join(directory, f".{basename}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+class FileDataSet(AbstractVersionedDataSet):
+    """
+    Base of the KedroWings file datasets.
+    Handles the fsspec filesystem, versioning and load and save arguments, the same way the kedro datasets do.
+    """
+
+    DEFAULT_LOAD_ARGS = {}  # type: Dict[str, Any]
+    DEFAULT_SAVE_ARGS = {}  # type: Dict[str, Any]
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        _fs_args = deepcopy(fs_args) or {}
+        self._fs_open_args_load = _fs_args.pop("open_args_load", {})
+        self._fs_open_args_save = _fs_args.pop("open_args_save", {})
+        _credentials = deepcopy(credentials) or {}
+
+        protocol, path = get_protocol_and_path(filepath, version)
+        self._protocol = protocol
+        self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
+
+        super().__init__(
+            filepath=PurePosixPath(path),
+            version=version,
+            exists_function=self._fs.exists,
+            glob_function=self._fs.glob,
+        )
+
+        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        if load_args is not None:
+            self._load_args.update(load_args)
+        self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
+        if save_args is not None:
+            self._save_args.update(save_args)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            protocol=self._protocol,
+            load_args=self._load_args,
+            save_args=self._save_args,
+            version=self._version,
+        )
+
+    def _load_path(self) -> str:
+        return get_filepath_str(self._get_load_path(), self._protocol)
+
+    def _save_path(self) -> str:
+        return get_filepath_str(self._get_save_path(), self._protocol)
+
+    def _local_path(self, path: str) -> Optional[str]:
+        """
+        The path on local disk, if the dataset is on the local filesystem
+        """
+        if self._protocol in LOCAL_PROTOCOLS:
+            return path
+        return None
+
+    def _exists(self) -> bool:
+        try:
+            load_path = self._load_path()
+        except DataSetError:
+            return False
+        return self._fs.exists(load_path)
+
+    def _release(self) -> None:
+        super()._release()
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        filepath = get_filepath_str(self._filepath, self._protocol)
+        self._fs.invalidate_cache(filepath)
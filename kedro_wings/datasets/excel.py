@@ -0,0 +1,181 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Union
+
+import pandas as pd
+from kedro.io.core import DataSetError, Version
+
+from .core import LOCAL_PROTOCOLS, FileDataSet, temp_path
+
+try:
+    import python_calamine  # noqa: F401  # pylint: disable=unused-import
+
+    DEFAULT_ENGINE = "calamine"
+except ImportError:  # pragma: no cover
+    DEFAULT_ENGINE = None
+
+MAX_WORKBOOKS = 4
+
+
+class _WorkbookCache:
+    """
+    Parsed workbooks, shared by every dataset reading a sheet of the same file.
+    A workbook is parsed again when the file's modification time or size changes.
+    Workbooks are opened outside of the cache lock, and local files are opened from disk instead of read into memory.
+    """
+
+    def __init__(self, max_workbooks: int = MAX_WORKBOOKS):
+        self._max_workbooks = max_workbooks
+        self._workbooks = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, fs, path: str, engine: str) -> Tuple[pd.ExcelFile, threading.Lock]:
+        info = fs.info(path)
+        signature = (info.get("mtime") or info.get("LastModified"), info.get("size"))
+        protocol = fs.protocol if isinstance(fs.protocol, str) else fs.protocol[0]
+        key = (protocol, path, engine)
+        with self._lock:
+            found = self._workbooks.get(key)
+            if found is not None and found[0] == signature:
+                self._workbooks.move_to_end(key)
+                return found[1], found[2]
+
+        if protocol in LOCAL_PROTOCOLS:
+            workbook = pd.ExcelFile(path, engine=engine)
+        else:
+            with fs.open(path, mode="rb") as fs_file:
+                workbook = pd.ExcelFile(io.BytesIO(fs_file.read()), engine=engine)
+
+        closed = []
+        with self._lock:
+            found = self._workbooks.get(key)
+            if found is not None and found[0] == signature:
+                # Another thread opened the same workbook meanwhile
+                self._workbooks.move_to_end(key)
+                closed.append(workbook)
+                workbook, lock = found[1], found[2]
+            else:
+                if found is not None:
+                    closed.append(found[1])
+                lock = threading.Lock()
+                self._workbooks[key] = (signature, workbook, lock)
+                while len(self._workbooks) > self._max_workbooks:
+                    closed.append(self._workbooks.popitem(last=False)[1][1])
+        for closed_workbook in closed:
+            closed_workbook.close()
+        return workbook, lock
+
+    def evict(self, fs, path: str):
+        with self._lock:
+            evicted = [self._workbooks.pop(k)[1] for k in list(self._workbooks) if k[1] == path]
+        for workbook in evicted:
+            workbook.close()
+
+
+_workbooks = _WorkbookCache()
+
+
+class ExcelWorkbookDataSet(FileDataSet):
+    """
+    Loads and saves sheets of an Excel workbook with pandas.
+    Loads use the calamine engine when python-calamine is installed, and a read-only openpyxl workbook otherwise.
+    The parsed workbook is shared by all datasets reading sheets of the same file, until the file changes.
+
+    With `sheet_name` None, loads a dict of all sheets and saves a dict of sheets.
+    Saving a single sheet replaces only that sheet of an existing workbook.
+    An index `sheet_name` saves to the existing sheet at that index, or to the first sheet of a new workbook.
+    """
+
+    DEFAULT_SAVE_ARGS = {"index": False}  # type: Dict[str, Any]
+
+    def __init__(
+        self,
+        filepath: str,
+        sheet_name: Union[str, int, None] = 0,
+        engine: str = None,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param sheet_name: The sheet name, or index, to load and save. None for all sheets.
+        :param engine: The pandas engine used to read the workbook. Default: calamine if installed, else openpyxl
+        """
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._sheet_name = sheet_name
+        self._engine = engine or DEFAULT_ENGINE or (
+            "xlrd" if str(filepath).endswith(".xls") else "openpyxl"
+        )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(**super()._describe(), sheet_name=self._sheet_name, engine=self._engine)
+
+    def _load(self) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        workbook, lock = _workbooks.get(self._fs, self._load_path(), self._engine)
+        with lock:
+            if self._sheet_name is None:
+                return {
+                    sheet: workbook.parse(sheet, **self._load_args)
+                    for sheet in workbook.sheet_names
+                }
+            return workbook.parse(self._sheet_name, **self._load_args)
+
+    def _save(self, data: Union[pd.DataFrame, Dict[str, pd.DataFrame]]) -> None:
+        save_path = self._save_path()
+        if self._sheet_name is None:
+            if not isinstance(data, dict):
+                raise DataSetError("A dict of DataFrames is saved when sheet_name is None")
+            sheets = data
+        else:
+            sheets = {self._sheet_name: data}
+
+        writer_args = {"engine": "openpyxl", "mode": "w"}
+        existing = None
+        if self._sheet_name is not None and self._fs.exists(save_path):
+            with self._fs.open(save_path, mode="rb") as fs_file:
+                existing = io.BytesIO(fs_file.read())
+            writer_args = {"engine": "openpyxl", "mode": "a", "if_sheet_exists": "replace"}
+
+        output = existing or io.BytesIO()
+        with pd.ExcelWriter(output, **writer_args) as writer:
+            for sheet_name, sheet in sheets.items():
+                sheet_name = self._indexed_sheet_name(sheet_name, writer.book.sheetnames)
+                sheet.to_excel(writer, sheet_name=sheet_name, **self._save_args)
+        if self._local_path(save_path) is None:
+            with self._fs.open(save_path, mode="wb") as fs_file:
+                fs_file.write(output.getvalue())
+        else:
+            # Cached workbooks read the local file lazily, so it's replaced instead of truncated
+            write_path = temp_path(save_path)
+            with open(write_path, "wb") as local_file:
+                local_file.write(output.getvalue())
+            os.replace(write_path, save_path)
+
+        _workbooks.evict(self._fs, save_path)
+        self._invalidate_cache()
+
+    def _indexed_sheet_name(self, sheet_name: Union[str, int], sheet_names) -> str:
+        """
+        The name of the sheet an index refers to, in a workbook with the given sheets
+        """
+        if isinstance(sheet_name, str):
+            return sheet_name
+        if not sheet_names and sheet_name == 0:
+            return "Sheet1"
+        if not 0 <= sheet_name < len(sheet_names):
+            raise DataSetError(
+                f"Sheet index {sheet_name} is out of range for {self._filepath}, "
+                f"which has the sheets {list(sheet_names)}"
+            )
+        return sheet_names[sheet_name]
+
+    def _release(self) -> None:
+        super()._release()
+        try:
+            _workbooks.evict(self._fs, self._load_path())
+        except DataSetError:
+            pass
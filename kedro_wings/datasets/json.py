@@ -0,0 +1,176 @@
+import json
+import math
+from typing import Any, Dict, Iterable, Iterator, Union
+
+from kedro.extras.datasets.json import JSONDataSet
+from kedro.io.core import Version, get_filepath_str
+
+from .core import FileDataSet
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _orjson_options(save_args: Dict[str, Any]):
+    """
+    Converts json.dump arguments to orjson options, or None if orjson can't honour them
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    for key, value in save_args.items():
+        if key == "indent" and value in (None, 0):
+            continue
+        if key == "indent" and value == 2:
+            options |= orjson.OPT_INDENT_2
+        elif key == "sort_keys":
+            options |= orjson.OPT_SORT_KEYS if value else 0
+        else:
+            return None
+    return options
+
+
+def _has_non_finite(data: Any) -> bool:
+    """
+    Whether data holds a NaN or infinite float, which orjson would silently serialize as null
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif hasattr(item, "dtype") and hasattr(item, "tolist"):
+            if item.dtype.kind in "fc" and not (abs(item) < math.inf).all():
+                return True
+            if item.dtype.kind == "O":
+                stack.extend(item.ravel())
+    return False
+
+
+def _to_builtin(obj: Any) -> Any:
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """
+    Parses with orjson, falling back to the json module for documents only it accepts,
+    such as NaN and Infinity written by json.dump
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _dumps(data: Any, save_args: Dict[str, Any]) -> bytes:
+    """
+    Serializes with orjson, falling back to the json module for save_args and values orjson doesn't
+    support, such as integers wider than 64 bits, and NaN which it would write as null
+    """
+    options = None if orjson is None else _orjson_options(save_args)
+    if options is not None:
+        try:
+            dumped = orjson.dumps(data, option=options)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b"null" not in dumped or not _has_non_finite(data):
+                return dumped
+    return json.dumps(data, **{"default": _to_builtin, **save_args}).encode()
+
+
+class FastJSONDataSet(JSONDataSet):
+    """
+    A drop-in ``JSONDataSet`` which parses and serializes with orjson.
+    Falls back to the json module if orjson is not installed, for save_args orjson doesn't support,
+    and for documents and values only the json module handles.
+    """
+
+    def _load(self) -> Any:
+        if orjson is None:
+            return super()._load()
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        with self._fs.open(load_path, **{**self._fs_open_args_load, "mode": "rb"}) as fs_file:
+            content = fs_file.read()
+        encoding = self._fs_open_args_load.get("encoding")
+        if encoding is not None:
+            content = content.decode(encoding)
+        return _loads(content)
+
+    def _save(self, data: Any) -> None:
+        if orjson is None or _orjson_options(self._save_args) is None:
+            super()._save(data)
+            return
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        with self._fs.open(save_path, **{**self._fs_open_args_save, "mode": "wb"}) as fs_file:
+            fs_file.write(_dumps(data, self._save_args))
+        self._invalidate_cache()
+
+
+class JSONLinesDataSet(FileDataSet):
+    """
+    Streams records to and from a JSON lines file, one JSON document per line.
+    Loading returns a list of the records, or an iterator over them if `lazy` is True.
+    The iterator keeps the file open until it is exhausted or closed. It is not the default,
+    as a chronocoded wing would truncate the file it streams from when its records are saved back.
+    Saving accepts any iterable of records, or a pandas DataFrame.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        lazy: bool = False,
+        append: bool = False,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param lazy: Load an iterator over the records, instead of a list.
+        :param append: Add saved records to the end of the file, instead of replacing it.
+        """
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._lazy = lazy
+        self._append = append
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(**super()._describe(), lazy=self._lazy, append=self._append)
+
+    def _iter_records(self, load_path: str) -> Iterator[Any]:
+        with self._fs.open(load_path, **{**self._fs_open_args_load, "mode": "rb"}) as fs_file:
+            for line in fs_file:
+                if line.strip():
+                    yield _loads(line)
+
+    def _load(self) -> Union[Iterator[Any], list]:
+        records = self._iter_records(self._load_path())
+        if self._lazy:
+            return records
+        return list(records)
+
+    def _save(self, data: Iterable[Any]) -> None:
+        save_path = self._save_path()
+        mode = "a" if self._append else "w"
+        if hasattr(data, "to_json"):
+            with self._fs.open(save_path, **{**self._fs_open_args_save, "mode": mode}) as fs_file:
+                lines = data.to_json(orient="records", lines=True)
+                fs_file.write(lines if lines.endswith("\n") else f"{lines}\n")
+            self._invalidate_cache()
+            return
+
+        with self._fs.open(save_path, **{**self._fs_open_args_save, "mode": f"{mode}b"}) as fs_file:
+            for record in data:
+                fs_file.write(_dumps(record, self._save_args))
+                fs_file.write(b"\n")
+        self._invalidate_cache()
@@ -0,0 +1,186 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable
+
+import pandas as pd
+from kedro.extras.datasets.pandas import CSVDataSet, ParquetDataSet
+from kedro.io.core import Version, get_filepath_str
+
+try:
+    import pyarrow as pa
+    from pyarrow import parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+SCHEMA_SUFFIX = ".schema.json"
+DOWNCAST_KINDS = ("integer", "float")
+
+
+def _column_schema(
+    series: pd.Series, downcast: Iterable[str], category_threshold: float = None
+) -> Dict[str, Any]:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {
+            "dtype": "category",
+            "categories": dtype.categories.tolist(),
+            "ordered": bool(dtype.ordered),
+        }
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return {"dtype": str(dtype)}
+    if pd.api.types.is_bool_dtype(dtype):
+        return {"dtype": "bool"}
+    if pd.api.types.is_integer_dtype(dtype) and "integer" in downcast:
+        return {"dtype": str(pd.to_numeric(series, downcast="integer").dtype)}
+    if pd.api.types.is_float_dtype(dtype) and "float" in downcast:
+        return {"dtype": str(pd.to_numeric(series, downcast="float").dtype)}
+    is_text = pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+    if is_text and category_threshold is not None and len(series):
+        uniques = series.dropna().unique()
+        if len(uniques) / len(series) <= category_threshold:
+            return {"dtype": "category", "categories": sorted(uniques.tolist(), key=str), "ordered": False}
+    return {"dtype": str(dtype)}
+
+
+def infer_schema(
+    data: pd.DataFrame, downcast: Iterable[str] = (), category_threshold: float = None
+) -> Dict[str, Any]:
+    """
+    The column dtypes of a DataFrame, after applying the downcasting and categorical policies
+    """
+    return {
+        "columns": {
+            str(column): _column_schema(data[column], downcast, category_threshold)
+            for column in data.columns
+        }
+    }
+
+
+def schema_to_read_args(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts a schema to the dtype and parse_dates arguments of pandas.read_csv
+    """
+    dtype = {}
+    parse_dates = []
+    for column, column_schema in schema["columns"].items():
+        column_dtype = column_schema["dtype"]
+        if column_dtype.startswith("datetime64"):
+            parse_dates.append(column)
+        elif column_dtype == "category":
+            dtype[column] = pd.CategoricalDtype(
+                column_schema["categories"], ordered=column_schema["ordered"]
+            )
+        else:
+            dtype[column] = column_dtype
+    return {"dtype": dtype, "parse_dates": parse_dates}
+
+
+class SchemaCSVDataSet(CSVDataSet):
+    """
+    A ``CSVDataSet`` which records the dtypes of saved DataFrames in a `.schema.json` sidecar file.
+    On load the recorded dtypes are passed to the parser, so pandas does not need to infer them.
+    Integers and floats can be downcast, and low cardinality strings stored as categoricals.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        downcast: Iterable[str] = (),
+        category_threshold: float = None,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param downcast: Kinds of numeric columns to downcast to the smallest fitting dtype: integer, float
+        :param category_threshold: Store string columns as categoricals when their ratio of unique values is at most this.
+        """
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        unknown_kinds = set(downcast) - set(DOWNCAST_KINDS)
+        if unknown_kinds:
+            raise ValueError(
+                f"downcast should only contain {DOWNCAST_KINDS}, got {sorted(unknown_kinds)}"
+            )
+        self._downcast = tuple(downcast)
+        self._category_threshold = category_threshold
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            **super()._describe(),
+            downcast=self._downcast,
+            category_threshold=self._category_threshold,
+        )
+
+    def _load(self) -> pd.DataFrame:
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        schema_path = f"{load_path}{SCHEMA_SUFFIX}"
+        if not self._fs.exists(schema_path):
+            return super()._load()
+
+        with self._fs.open(schema_path, **{**self._fs_open_args_load, "mode": "r"}) as schema_file:
+            schema = json.load(schema_file)
+        read_args = schema_to_read_args(schema)
+        if "usecols" in self._load_args:
+            usecols = set(self._load_args["usecols"])
+            read_args["dtype"] = {k: v for k, v in read_args["dtype"].items() if k in usecols}
+            read_args["parse_dates"] = [c for c in read_args["parse_dates"] if c in usecols]
+        read_args["dtype"].update(self._load_args.get("dtype", {}))
+        load_args = {**self._load_args, **read_args}
+
+        with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
+            data = pd.read_csv(fs_file, **load_args)
+
+        for column in read_args["parse_dates"]:
+            column_dtype = schema["columns"][column]["dtype"]
+            if isinstance(column_dtype, str) and "," in column_dtype:
+                tz = column_dtype.split(",", 1)[1].strip(" ]")
+                data[column] = pd.to_datetime(data[column], utc=True).dt.tz_convert(tz)
+        return data
+
+    def _save(self, data: pd.DataFrame) -> None:
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        super()._save(data)
+
+        schema = infer_schema(data, self._downcast, self._category_threshold)
+        schema_path = f"{save_path}{SCHEMA_SUFFIX}"
+        with self._fs.open(schema_path, **{**self._fs_open_args_save, "mode": "w"}) as schema_file:
+            json.dump(schema, schema_file, default=str)
+        self._invalidate_cache()
+
+
+class AppendCSVDataSet(CSVDataSet):
+    """
+    A ``CSVDataSet`` which adds saved rows to the end of its file, instead of replacing it.
+    The header is only written when the file is created.
+    The filesystem must support opening files in append mode.
+    """
+
+    def _save(self, data: pd.DataFrame) -> None:
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        header = self._save_args.get("header", True) and not self._fs.exists(save_path)
+        with self._fs.open(save_path, **{**self._fs_open_args_save, "mode": "a"}) as fs_file:
+            data.to_csv(fs_file, **{**self._save_args, "header": header})
+        self._invalidate_cache()
+
+
+class AppendParquetDataSet(ParquetDataSet):
+    """
+    A ``ParquetDataSet`` which writes every save as a new part file in a dataset directory.
+    Loading reads the union of all parts.
+    """
+
+    def _save(self, data: pd.DataFrame) -> None:
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        self._fs.makedirs(save_path, exist_ok=True)
+        stamp = datetime.now(timezone.utc)
+        part_name = f"part-{stamp:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}.parquet"
+
+        table = pa.Table.from_pandas(data, **self._from_pandas_args)
+        pq.write_table(
+            table=table, where=f"{save_path}/{part_name}", filesystem=self._fs, **self._save_args
+        )
+        self._invalidate_cache()
@@ -0,0 +1,224 @@
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, Dict, List, Tuple
+
+from kedro.io.core import DataSetError, Version
+
+from .core import FileDataSet, temp_path
+
+try:
+    import cloudpickle
+except ImportError:  # pragma: no cover
+    cloudpickle = None
+
+try:
+    import joblib
+except ImportError:  # pragma: no cover
+    joblib = None
+
+MAGIC = b"KWPKL5\x00\x01"
+ALIGNMENT = 64
+_UINT64 = struct.Struct("<Q")
+COMPRESSIONS = {"gzip": gzip.GzipFile, "bz2": bz2.BZ2File, "lzma": lzma.LZMAFile}
+
+
+def _compressed(fs_file, compression: str, mode: str):
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fs_file, mode=mode)
+    return COMPRESSIONS[compression](fs_file, mode=mode)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _raw(buffer: pickle.PickleBuffer) -> memoryview:
+    try:
+        return buffer.raw()
+    except BufferError:
+        return memoryview(memoryview(buffer).tobytes())
+
+
+def dump_out_of_band(data: Any, fs_file, dumps=pickle.dumps, **save_args) -> None:
+    """
+    Writes data with pickle protocol 5, with its large buffers stored out-of-band.
+    Layout: magic, pickle offset and length, buffer count, buffer offsets and lengths,
+    then the pickle and each buffer, aligned to 64 bytes so they can be memory-mapped.
+    This is not a plain pickle file, and is read back with load_out_of_band.
+    """
+    buffers = []  # type: List[pickle.PickleBuffer]
+    payload = dumps(data, protocol=5, buffer_callback=buffers.append, **save_args)
+    raw_buffers = [_raw(b) for b in buffers]
+
+    header_size = len(MAGIC) + _UINT64.size * (3 + 2 * len(raw_buffers))
+    payload_offset = _aligned(header_size)
+    offsets = []
+    offset = _aligned(payload_offset + len(payload))
+    for raw_buffer in raw_buffers:
+        offsets.append(offset)
+        offset = _aligned(offset + raw_buffer.nbytes)
+
+    header = [payload_offset, len(payload), len(raw_buffers)]
+    for buffer_offset, raw_buffer in zip(offsets, raw_buffers):
+        header += [buffer_offset, raw_buffer.nbytes]
+
+    header_bytes = MAGIC + b"".join(_UINT64.pack(v) for v in header)
+    fs_file.write(header_bytes)
+    position = len(header_bytes)
+    for chunk_offset, chunk in [(payload_offset, payload)] + list(zip(offsets, raw_buffers)):
+        fs_file.write(b"\x00" * (chunk_offset - position))
+        fs_file.write(chunk)
+        position = chunk_offset + memoryview(chunk).nbytes
+
+
+def _read_header(view: memoryview) -> Tuple[int, int, List[Tuple[int, int]]]:
+    def _uint(i: int) -> int:
+        start = len(MAGIC) + _UINT64.size * i
+        return _UINT64.unpack(view[start : start + _UINT64.size])[0]
+
+    payload_offset, payload_length, n_buffers = _uint(0), _uint(1), _uint(2)
+    buffers = [(_uint(3 + 2 * i), _uint(4 + 2 * i)) for i in range(n_buffers)]
+    return payload_offset, payload_length, buffers
+
+
+def load_out_of_band(view: memoryview, copy: bool = False, **load_args) -> Any:
+    """
+    Loads data written by dump_out_of_band.
+    Buffers are slices of the given view, so a memory-mapped view gives a zero-copy load.
+    """
+    payload_offset, payload_length, buffers = _read_header(view)
+    buffer_views = [view[offset : offset + length] for offset, length in buffers]
+    if copy:
+        buffer_views = [bytearray(b) for b in buffer_views]
+    return pickle.loads(  # nosec
+        view[payload_offset : payload_offset + payload_length], buffers=buffer_views, **load_args
+    )
+
+
+class PickleDataSet(FileDataSet):
+    """
+    Loads and saves pickles with protocol 5 and out-of-band buffers.
+    Large buffers, such as numpy arrays, are stored separately and memory-mapped on load, without being copied.
+    Memory-mapped arrays are read-only, unless `mmap` is False.
+
+    Out-of-band files are a container of the pickle and its buffers, which the plain pickle module can't read.
+    With `out_of_band` False, or with `compression`, plain protocol 5 pickles are written instead.
+    The `cloudpickle` backend uses the same layout, and the `joblib` backend uses joblib's own format.
+    Pickles written with the plain pickle module can always be loaded.
+
+    Local files are written next to the file they replace and swapped in,
+    so arrays memory-mapped from the replaced file stay readable while it is overwritten.
+    """
+
+    BACKENDS = ("pickle", "cloudpickle", "joblib")
+
+    def __init__(
+        self,
+        filepath: str,
+        backend: str = "pickle",
+        compression: Any = None,
+        mmap: bool = True,
+        out_of_band: bool = True,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param backend: One of pickle, cloudpickle, joblib
+        :param compression: gzip, bz2 or lzma. For joblib, any value of joblib.dump's `compress`.
+        :param mmap: Memory-map the out-of-band buffers of local files on load.
+        :param out_of_band: Store large buffers out-of-band. False writes plain pickles.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"'backend' should be one of {self.BACKENDS}, got '{backend}'.")
+        if backend == "cloudpickle" and cloudpickle is None:
+            raise ImportError("Selected backend 'cloudpickle' could not be imported.")
+        if backend == "joblib" and joblib is None:
+            raise ImportError("Selected backend 'joblib' could not be imported.")
+        if backend != "joblib" and compression not in (None, *COMPRESSIONS):
+            raise ValueError(
+                f"'compression' should be one of {list(COMPRESSIONS)}, got '{compression}'."
+            )
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._backend = backend
+        self._compression = compression
+        self._mmap = mmap
+        self._out_of_band = out_of_band and backend != "joblib" and compression is None
+        if self._out_of_band and self._save_args.get("protocol", 5) != 5:
+            raise ValueError(
+                "Out-of-band pickles use protocol 5, set 'out_of_band' to False for other protocols."
+            )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            **super()._describe(),
+            backend=self._backend,
+            compression=self._compression,
+            mmap=self._mmap,
+            out_of_band=self._out_of_band,
+        )
+
+    def _dumps(self):
+        if self._backend == "cloudpickle":
+            return cloudpickle.dumps
+        return pickle.dumps
+
+    def _load(self) -> Any:
+        load_path = self._load_path()
+        if self._backend == "joblib":
+            with self._fs.open(load_path, mode="rb", **self._fs_open_args_load) as fs_file:
+                return joblib.load(fs_file, **self._load_args)
+
+        local_path = self._local_path(load_path)
+        with self._fs.open(load_path, mode="rb", **self._fs_open_args_load) as fs_file:
+            is_out_of_band = fs_file.read(len(MAGIC)) == MAGIC
+            fs_file.seek(0)
+            if not is_out_of_band:
+                if self._compression is not None:
+                    fs_file = _compressed(fs_file, self._compression, "rb")
+                return pickle.load(fs_file, **self._load_args)  # nosec
+            if local_path is None or not self._mmap:
+                return load_out_of_band(
+                    memoryview(fs_file.read()), copy=not self._mmap, **self._load_args
+                )
+
+        with open(local_path, "rb") as local_file:
+            mapped = mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return load_out_of_band(memoryview(mapped), **self._load_args)
+
+    def _dump(self, data: Any, fs_file) -> None:
+        if self._backend == "joblib":
+            joblib.dump(data, fs_file, compress=self._compression or 0, **self._save_args)
+        elif self._out_of_band:
+            dump_out_of_band(data, fs_file, self._dumps(), **self._save_args)
+        else:
+            payload = self._dumps()(data, **{"protocol": 5, **self._save_args})
+            if self._compression is None:
+                fs_file.write(payload)
+            else:
+                with _compressed(fs_file, self._compression, "wb") as compressed:
+                    compressed.write(payload)
+
+    def _save(self, data: Any) -> None:
+        save_path = self._save_path()
+        # Loads may have memory-mapped the local file, which must not be truncated while it's rewritten
+        is_local = self._local_path(save_path) is not None
+        write_path = temp_path(save_path) if is_local else save_path
+        try:
+            with self._fs.open(write_path, mode="wb", **self._fs_open_args_save) as fs_file:
+                self._dump(data, fs_file)
+            if is_local:
+                os.replace(write_path, save_path)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise DataSetError(f"{data.__class__} was not serialized due to: {e}") from e
+        finally:
+            if is_local and os.path.exists(write_path):
+                os.unlink(write_path)
+        self._invalidate_cache()
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from kedro.io.core import DataSetError, Version
+
+from .core import FileDataSet, temp_path
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None
+
+logger = logging.getLogger("KedroWings")
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+CACHE_SUFFIX = ".cache.npy"
+SIGNATURE_SUFFIX = ".cache.json"
+
+
+def _decode(fs, path: str, size: Optional[Tuple[int, int]], mode: str) -> np.ndarray:
+    with fs.open(path, mode="rb") as fs_file:
+        image = Image.open(fs_file)
+        if size is not None:
+            # Lets JPEG decoders skip detail that would be lost by the resize
+            image.draft(mode, size)
+        image = image.convert(mode)
+        if size is not None and image.size != tuple(size):
+            image = image.resize(tuple(size))
+        return np.asarray(image)
+
+
+def _decode_batch(
+    fs,
+    paths: Sequence[str],
+    start: int,
+    size: Optional[Tuple[int, int]],
+    mode: str,
+    out_file: Optional[str],
+) -> Optional[np.ndarray]:
+    """
+    Decodes a batch of images in a worker process.
+    Writes them into the memory-mapped output file if there is one, else returns them.
+    """
+    arrays = [_decode(fs, path, size, mode) for path in paths]
+    if out_file is None:
+        return np.stack(arrays)
+    out = np.load(out_file, mmap_mode="r+")
+    for i, array in enumerate(arrays):
+        out[start + i] = array
+    out.flush()
+    return None
+
+
+class ImageDirectoryDataSet(FileDataSet):
+    """
+    Loads a directory of images as one stacked numpy array of shape (images, height, width, channels),
+    in the sorted order of their paths.
+    Images are decoded in parallel, straight into a preallocated array, and can be resized while decoding.
+
+    On the local filesystem, the decoded array is cached as a `.npy` file next to the directory and memory-mapped on load.
+    The cache is rebuilt when images are added, removed or modified.
+    Saving writes each image of an array, or of a mapping of names to images, as a PNG file,
+    and then removes the images of earlier saves that were not overwritten.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        size: Tuple[int, int] = None,
+        mode: str = "RGB",
+        workers: int = None,
+        executor: str = "thread",
+        cache: bool = True,
+        extensions: Sequence[str] = IMAGE_EXTENSIONS,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param size: Resize every image to this (width, height). Required when images differ in size.
+        :param mode: The pillow mode images are converted to.
+        :param workers: Number of decoding threads or processes. Default: all cores
+        :param executor: thread or process
+        :param cache: Cache the decoded array of local directories as a memory-mapped `.npy` file.
+        :param extensions: Extensions of the files loaded from the directory.
+        """
+        if Image is None:
+            raise ImportError("ImageDirectoryDataSet requires pillow to be installed.")
+        if executor not in ("thread", "process"):
+            raise ValueError(f"'executor' should be one of thread, process, got '{executor}'.")
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._size = tuple(size) if size is not None else None
+        self._mode = mode
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._cache = cache
+        self._extensions = tuple(e.lower() for e in extensions)
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            **super()._describe(),
+            size=self._size,
+            mode=self._mode,
+            workers=self._workers,
+            executor=self._executor,
+            cache=self._cache,
+        )
+
+    def _list_images(self, load_path: str) -> Dict[str, Dict[str, Any]]:
+        found = self._fs.find(load_path, detail=True)
+        return {
+            path: info
+            for path, info in sorted(found.items())
+            if path.lower().endswith(self._extensions)
+            and not os.path.basename(path).startswith(".")
+        }
+
+    def _signature(self, load_path: str, images: Dict[str, Dict[str, Any]]) -> str:
+        digest = hashlib.sha1(json.dumps([self._size, self._mode]).encode())
+        for path, info in images.items():
+            mtime = info.get("mtime") or info.get("LastModified")
+            line = f"{os.path.relpath(path, load_path)}\0{info.get('size')}\0{mtime}\n"
+            digest.update(line.encode())
+        return digest.hexdigest()
+
+    def _cache_paths(self, load_path: str) -> Optional[Tuple[str, str]]:
+        local_path = self._local_path(load_path)
+        if not self._cache or local_path is None:
+            return None
+        local_path = local_path.rstrip("/")
+        return f"{local_path}{CACHE_SUFFIX}", f"{local_path}{SIGNATURE_SUFFIX}"
+
+    def _decode_all(self, paths: List[str], out: np.ndarray, out_file: Optional[str]):
+        batch_size = max(math.ceil(len(paths) / (self._workers * 4)), 1)
+        starts = range(0, len(paths), batch_size)
+        if self._executor == "thread":
+
+            def _decode_into(start):
+                for i, path in enumerate(paths[start : start + batch_size]):
+                    out[start + i] = _decode(self._fs, path, self._size, self._mode)
+
+            with ThreadPoolExecutor(self._workers) as pool:
+                list(pool.map(_decode_into, starts))
+            return
+
+        if out_file is not None:
+            out.flush()
+        with ProcessPoolExecutor(self._workers) as pool:
+            futures = {
+                start: pool.submit(
+                    _decode_batch,
+                    self._fs,
+                    paths[start : start + batch_size],
+                    start,
+                    self._size,
+                    self._mode,
+                    out_file,
+                )
+                for start in starts
+            }
+            for start, future in futures.items():
+                batch = future.result()
+                if batch is not None:
+                    out[start : start + len(batch)] = batch
+
+    def _load(self) -> np.ndarray:
+        load_path = self._load_path()
+        images = self._list_images(load_path)
+        if not images:
+            raise DataSetError(f"No images found in {load_path}")
+
+        cache_paths = self._cache_paths(load_path)
+        signature = self._signature(load_path, images)
+        if cache_paths is not None and os.path.exists(cache_paths[1]):
+            with open(cache_paths[1], "r") as signature_file:
+                if json.load(signature_file).get("signature") == signature:
+                    return np.load(cache_paths[0], mmap_mode="r")
+
+        paths = list(images)
+        first = _decode(self._fs, paths[0], self._size, self._mode)
+        shape = (len(paths),) + first.shape
+        out_file = None
+        if cache_paths is None:
+            out = np.empty(shape, dtype=first.dtype)
+        else:
+            # Earlier loads may still be memory-mapping the cache, so it's rebuilt next to it and swapped in
+            out_file = temp_path(cache_paths[0])
+            out = np.lib.format.open_memmap(out_file, mode="w+", dtype=first.dtype, shape=shape)
+
+        try:
+            self._decode_all(paths, out, out_file)
+        except Exception as e:
+            if out_file is not None:
+                del out
+                os.unlink(out_file)
+            if isinstance(e, ValueError):
+                raise DataSetError(
+                    f"Images in {load_path} could not be stacked, set 'size' to resize them: {e}"
+                ) from e
+            raise
+
+        if cache_paths is None:
+            return out
+        out.flush()
+        del out
+        os.replace(out_file, cache_paths[0])
+        signature_file_path = temp_path(cache_paths[1])
+        with open(signature_file_path, "w") as signature_file:
+            json.dump({"signature": signature, "images": len(paths)}, signature_file)
+        os.replace(signature_file_path, cache_paths[1])
+        return np.load(cache_paths[0], mmap_mode="r")
+
+    def _save(self, data: Any) -> None:
+        save_path = self._save_path()
+        if isinstance(data, dict):
+            named_images = data.items()
+        else:
+            named_images = ((f"{i:06d}.png", image) for i, image in enumerate(data))
+
+        self._fs.makedirs(save_path, exist_ok=True)
+        stale = set(self._list_images(save_path))
+        for name, image in named_images:
+            if not isinstance(image, Image.Image):
+                image = Image.fromarray(np.asarray(image))
+            image_path = f"{save_path}/{name}"
+            with self._fs.open(image_path, mode="wb") as fs_file:
+                image.save(fs_file, format="PNG", **self._save_args)
+            stale.discard(self._fs._strip_protocol(image_path))
+
+        # Images of earlier saves are only removed once all new images are written
+        for path in sorted(stale):
+            self._fs.rm(path)
+        self._invalidate_cache()
@@ -0,0 +1,149 @@
+import io
+import os
+from typing import Any, Dict
+
+from kedro.io.core import DataSetError, Version
+
+from .core import FileDataSet, temp_path
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None
+
+try:
+    import pyarrow.dataset as pa_dataset
+except ImportError:  # pragma: no cover
+    pa_dataset = None
+
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".feather": "ipc",
+    ".arrow": "ipc",
+    ".ipc": "ipc",
+}
+
+
+def file_format_of(filepath: str) -> str:
+    for extension, file_format in FILE_FORMATS.items():
+        if str(filepath).endswith(extension):
+            return file_format
+    raise DataSetError(f"Can't tell the file format of {filepath}, set 'file_format'")
+
+
+def to_polars(data: Any) -> Any:
+    """
+    Converts pandas DataFrames and pyarrow Tables to polars, leaving polars frames as they are
+    """
+    if isinstance(data, (pl.DataFrame, pl.LazyFrame)):
+        return data
+    if type(data).__module__.startswith("pyarrow"):
+        return pl.from_arrow(data)
+    return pl.from_pandas(data)
+
+
+class LazyPolarsDataSet(FileDataSet):
+    """
+    Loads CSV, parquet and feather files as polars LazyFrames.
+    Selecting columns and filtering rows of the loaded frame is pushed into the file scan,
+    so only what is collected is ever read.
+
+    Remote files are downloaded whole and scanned from memory, with the same load_args.
+    Remote directories, such as hive-partitioned datasets, are scanned through pyarrow.
+
+    Saves LazyFrames, polars or pandas DataFrames and pyarrow Tables.
+    LazyFrames saved to the local filesystem are streamed to the file, without collecting them.
+    Local files are written next to the file they replace and swapped in,
+    so a LazyFrame scanning the file it is saved to reads it whole.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        file_format: str = None,
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """
+        :param file_format: csv, parquet or ipc. Default: from the file extension
+        :param load_args: Passed to polars' scan_<format>.
+        :param save_args: Passed to polars' sink_<format>, or write_<format> for DataFrames.
+        """
+        if pl is None:
+            raise ImportError("LazyPolarsDataSet requires polars to be installed.")
+        super().__init__(filepath, load_args, save_args, version, credentials, fs_args)
+        self._file_format = file_format or file_format_of(filepath)
+        if self._file_format not in ("csv", "parquet", "ipc"):
+            raise ValueError(
+                f"'file_format' should be one of csv, parquet, ipc, got '{self._file_format}'."
+            )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(**super()._describe(), file_format=self._file_format)
+
+    def _load(self) -> "pl.LazyFrame":
+        load_path = self._load_path()
+        scan = getattr(pl, f"scan_{self._file_format}")
+        if self._local_path(load_path) is not None:
+            return scan(load_path, **self._load_args)
+        if self._fs.isdir(load_path):
+            return self._scan_directory(load_path)
+
+        with self._fs.open(load_path, mode="rb", **self._fs_open_args_load) as fs_file:
+            source = io.BytesIO(fs_file.read())
+        load_args = dict(self._load_args)
+        # A single file has no partition directories, and polars can't hive-partition a buffer
+        load_args.pop("hive_partitioning", None)
+        return scan(source, **load_args)
+
+    _DIRECTORY_LOAD_ARGS = ("hive_partitioning", "n_rows")
+
+    def _scan_directory(self, load_path: str) -> "pl.LazyFrame":
+        """
+        Scans a remote dataset directory through pyarrow, which reads it with the filesystem
+        """
+        if pa_dataset is None:
+            raise DataSetError("Loading a remote directory with polars requires pyarrow.")
+        unsupported = sorted(set(self._load_args) - set(self._DIRECTORY_LOAD_ARGS))
+        if unsupported:
+            raise DataSetError(
+                f"{unsupported} are not supported when loading the remote directory {load_path}"
+            )
+        dataset = pa_dataset.dataset(
+            load_path,
+            format=self._file_format,
+            filesystem=self._fs,
+            partitioning="hive" if self._load_args.get("hive_partitioning", True) else None,
+        )
+        frame = pl.scan_pyarrow_dataset(dataset)
+        n_rows = self._load_args.get("n_rows")
+        return frame if n_rows is None else frame.head(n_rows)
+
+    def _save(self, data: Any) -> None:
+        save_path = self._save_path()
+        data = to_polars(data)
+        if self._local_path(save_path) is None:
+            if isinstance(data, pl.LazyFrame):
+                data = data.collect()
+            with self._fs.open(save_path, mode="wb", **self._fs_open_args_save) as fs_file:
+                getattr(data, f"write_{self._file_format}")(fs_file, **self._save_args)
+            self._invalidate_cache()
+            return
+
+        os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+        write_path = temp_path(save_path)
+        try:
+            if isinstance(data, pl.LazyFrame):
+                getattr(data, f"sink_{self._file_format}")(write_path, **self._save_args)
+            else:
+                getattr(data, f"write_{self._file_format}")(write_path, **self._save_args)
+            os.replace(write_path, save_path)
+        finally:
+            # Also cleans up after polars panics, which are not Exceptions
+            if os.path.exists(write_path):
+                os.unlink(write_path)
+        self._invalidate_cache()
@@ -0,0 +1,56 @@
+import logging
+from typing import Any, Dict
+
+from kedro.io import AbstractDataSet
+from kedro.io.core import DataSetError
+
+logger = logging.getLogger("KedroWings")
+
+
+class SampledDataSet(AbstractDataSet):
+    """
+    Loads a sample of the rows of another dataset, for datasets whose reader can't sample by itself.
+    The underlying dataset is loaded fully and then truncated.
+    Sampled datasets are read-only.
+    """
+
+    def __init__(
+        self, dataset: Dict[str, Any], rows: int = None, fraction: float = None, seed: int = 0,
+    ):
+        if (rows is None) == (fraction is None):
+            raise ValueError("Exactly one of 'rows' and 'fraction' must be given.")
+        self._dataset = AbstractDataSet.from_config("sampled", dataset)
+        self._rows = rows
+        self._fraction = fraction
+        self._seed = seed
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            dataset=self._dataset, rows=self._rows, fraction=self._fraction, seed=self._seed
+        )
+
+    def _load(self) -> Any:
+        logger.debug(f"Sampling {self._dataset} after loading it fully")
+        data = self._dataset.load()
+        step = max(int(round(1 / self._fraction)), 1) if self._fraction else 1
+        if hasattr(data, "gather_every"):
+            # polars frames
+            if self._rows is not None:
+                return data.head(self._rows)
+            return data.gather_every(step, offset=self._seed % step)
+        if hasattr(data, "sample") and hasattr(data, "head"):
+            if self._rows is not None:
+                return data.head(self._rows)
+            return data.sample(frac=self._fraction, random_state=self._seed).sort_index()
+        if self._rows is not None:
+            return data[: self._rows]
+        return data[self._seed % step :: step]
+
+    def _save(self, data: Any) -> None:
+        raise DataSetError(f"Sampled dataset {self._dataset} is read-only")
+
+    def _exists(self) -> bool:
+        return self._dataset.exists()
+
+    def _release(self) -> None:
+        self._dataset.release()
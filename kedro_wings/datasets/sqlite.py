@@ -0,0 +1,275 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from kedro.io import AbstractDataSet
+from kedro.io.core import DataSetError
+
+_SQLITE_TYPES = (
+    (pd.api.types.is_bool_dtype, "BOOLEAN"),
+    (pd.api.types.is_integer_dtype, "INTEGER"),
+    (pd.api.types.is_float_dtype, "REAL"),
+    (pd.api.types.is_datetime64_any_dtype, "TIMESTAMP"),
+)
+
+
+def _quote(identifier: str) -> str:
+    return '"{}"'.format(str(identifier).replace('"', '""'))
+
+
+class ConnectionPool:
+    """
+    Reusable connections to one SQLite database file, in WAL mode.
+    Connections may be used from any thread, but only by one thread at a time.
+    """
+
+    def __init__(self, database: str, max_idle: int = 8, timeout: float = 30.0):
+        self._database = database
+        self._max_idle = max_idle
+        self._timeout = timeout
+        self._idle = []  # type: List[sqlite3.Connection]
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._database, timeout=self._timeout, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            # Connecting under the lock, as switching to WAL mode needs an exclusive lock on the file
+            connection = self._idle.pop() if self._idle else self._connect()
+        reusable = True
+        try:
+            yield connection
+        except BaseException:
+            # Also rolls back iterators closed early, which raise GeneratorExit
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                reusable = False
+            raise
+        finally:
+            self._release(connection, reusable)
+
+    def _release(self, connection: sqlite3.Connection, reusable: bool):
+        with self._lock:
+            if reusable and len(self._idle) < self._max_idle:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+_pools = {}  # type: Dict[str, ConnectionPool]
+_pools_lock = threading.Lock()
+
+
+def connection_pool(database: str) -> ConnectionPool:
+    """
+    The connection pool of a database file, shared by every dataset pointing at it
+    """
+    database = os.path.abspath(database)
+    with _pools_lock:
+        found_pool = _pools.get(database)
+        if found_pool is None:
+            found_pool = _pools[database] = ConnectionPool(database)
+        return found_pool
+
+
+def _column_type(series: pd.Series) -> str:
+    for matches, column_type in _SQLITE_TYPES:
+        if matches(series.dtype):
+            return column_type
+    return "TEXT"
+
+
+def _column_values(series: pd.Series) -> list:
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return [None if pd.isna(x) else x.isoformat() for x in series]
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        # tolist gives python scalars, and SQLite stores NaN as NULL
+        return series.tolist()
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _to_rows(data: pd.DataFrame) -> Iterator[tuple]:
+    return zip(*[_column_values(data[column]) for column in data.columns])
+
+
+class SQLiteTableDataSet(AbstractDataSet):
+    """
+    Loads and saves pandas DataFrames as tables of a SQLite database file.
+    All datasets pointing at the same file share one pool of WAL mode connections.
+    Saves are bulk inserts inside a single transaction, and loads read the table in chunks.
+
+    Without a `table`, loads a dict of all tables, and saves a dict of tables.
+    """
+
+    DEFAULT_LOAD_ARGS = {}  # type: Dict[str, Any]
+    DEFAULT_SAVE_ARGS = {"if_exists": "replace"}  # type: Dict[str, Any]
+
+    def __init__(
+        self,
+        filepath: str,
+        table: str = None,
+        chunksize: int = 100000,
+        indexes: Sequence[Union[str, Sequence[str]]] = (),
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+    ):
+        """
+        :param table: The table of the database file.
+        :param chunksize: Rows read and inserted at a time.
+        :param indexes: Columns, or lists of columns, indexed after saving.
+        :param load_args: columns, where and params, to filter the rows loaded. `iterator` loads an iterator of chunks.
+        :param save_args: if_exists: replace or append
+        """
+        if "://" in str(filepath) and not str(filepath).startswith("file://"):
+            raise DataSetError(f"SQLite databases must be local files, got {filepath}")
+        self._filepath = str(filepath).replace("file://", "", 1)
+        self._table = table
+        self._chunksize = chunksize
+        self._indexes = [[i] if isinstance(i, str) else list(i) for i in indexes]
+        self._load_args = {**self.DEFAULT_LOAD_ARGS, **(load_args or {})}
+        self._save_args = {**self.DEFAULT_SAVE_ARGS, **(save_args or {})}
+        if self._save_args["if_exists"] not in ("replace", "append"):
+            raise ValueError(
+                f"'if_exists' should be one of replace, append, got '{self._save_args['if_exists']}'."
+            )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            table=self._table,
+            chunksize=self._chunksize,
+            load_args=self._load_args,
+            save_args=self._save_args,
+        )
+
+    def _pool(self) -> ConnectionPool:
+        return connection_pool(self._filepath)
+
+    @staticmethod
+    def _tables(connection: sqlite3.Connection) -> List[str]:
+        cursor = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+        return sorted(row[0] for row in cursor)
+
+    def _query(self, table: str) -> str:
+        columns = self._load_args.get("columns")
+        query = "SELECT {} FROM {}".format(
+            ", ".join(map(_quote, columns)) if columns else "*", _quote(table)
+        )
+        if self._load_args.get("where"):
+            query = f"{query} WHERE {self._load_args['where']}"
+        return query
+
+    def _iter_chunks(self, table: str) -> Iterator[pd.DataFrame]:
+        with self._pool().connection() as connection:
+            declared = {
+                row[1]: (row[2] or "").upper()
+                for row in connection.execute(f"PRAGMA table_info({_quote(table)})")
+            }
+            cursor = connection.execute(self._query(table), self._load_args.get("params", ()))
+            try:
+                columns = [d[0] for d in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(self._chunksize)
+                    if not rows:
+                        break
+                    yield self._convert(pd.DataFrame.from_records(rows, columns=columns), declared)
+            finally:
+                # Ends the read snapshot of the query before the connection goes back to the pool
+                cursor.close()
+
+    @staticmethod
+    def _convert(chunk: pd.DataFrame, declared: Dict[str, str]) -> pd.DataFrame:
+        for column in chunk.columns:
+            if declared.get(column) == "TIMESTAMP":
+                chunk[column] = pd.to_datetime(chunk[column])
+            elif declared.get(column) == "BOOLEAN" and chunk[column].notna().all():
+                chunk[column] = chunk[column].astype(bool)
+        return chunk
+
+    def _load_table(self, table: str) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        chunks = self._iter_chunks(table)
+        if self._load_args.get("iterator"):
+            return chunks
+        chunks = list(chunks)
+        if not chunks:
+            with self._pool().connection() as connection:
+                cursor = connection.execute(f"{self._query(table)} LIMIT 0", self._load_args.get("params", ()))
+                return pd.DataFrame(columns=[d[0] for d in cursor.description])
+        return pd.concat(chunks, ignore_index=True)
+
+    def _load(self) -> Any:
+        if not os.path.exists(self._filepath):
+            raise DataSetError(f"Database {self._filepath} does not exist")
+        if self._table is not None:
+            return self._load_table(self._table)
+        with self._pool().connection() as connection:
+            tables = self._tables(connection)
+        return {table: self._load_table(table) for table in tables}
+
+    def _save_table(self, connection: sqlite3.Connection, table: str, data: pd.DataFrame):
+        columns = [str(c) for c in data.columns]
+        if self._save_args["if_exists"] == "replace":
+            connection.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS {} ({})".format(
+                _quote(table),
+                ", ".join(f"{_quote(c)} {_column_type(data[c])}" for c in data.columns),
+            )
+        )
+        insert = "INSERT INTO {} ({}) VALUES ({})".format(
+            _quote(table), ", ".join(map(_quote, columns)), ", ".join("?" * len(columns))
+        )
+        rows = _to_rows(data)
+        while True:
+            chunk = [row for _, row in zip(range(self._chunksize), rows)]
+            if not chunk:
+                break
+            connection.executemany(insert, chunk)
+        for index_columns in self._indexes:
+            index_name = "_".join(["ix", table] + index_columns)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS {} ON {} ({})".format(
+                    _quote(index_name), _quote(table), ", ".join(map(_quote, index_columns))
+                )
+            )
+
+    def _save(self, data: Any) -> None:
+        tables = {self._table: data} if self._table is not None else data
+        if not isinstance(tables, dict):
+            raise DataSetError("A dict of DataFrames is saved when no table is given")
+        directory = os.path.dirname(self._filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._pool().connection() as connection:
+            # A single transaction for all the tables and rows
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                for table, table_data in tables.items():
+                    self._save_table(connection, table, table_data)
+
+    def _exists(self) -> bool:
+        if not os.path.exists(self._filepath):
+            return False
+        with self._pool().connection() as connection:
+            tables = self._tables(connection)
+        return bool(tables) if self._table is None else self._table in tables
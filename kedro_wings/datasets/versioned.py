@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import fsspec
+from kedro.io import AbstractDataSet
+from kedro.io.core import generate_timestamp, get_protocol_and_path
+
+from .core import LOCAL_PROTOCOLS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..filesystems import FileSystemPool
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger("KedroWings")
+
+INDEX_NAME = ".versions.json"
+LOCK_NAME = ".versions.json.lock"
+# kedro's version format, truncated to milliseconds
+_VERSION_FORMAT = "%Y-%m-%dT%H.%M.%S.%fZ"
+
+
+def next_version(latest: Optional[str]) -> str:
+    """
+    A new version, which sorts after the latest one even if the latest came from a clock running ahead
+    """
+    save_version = generate_timestamp()
+    if latest is None or save_version > latest:
+        return save_version
+    try:
+        latest_time = datetime.strptime(latest, _VERSION_FORMAT)
+    except ValueError:
+        return save_version
+    bumped = (latest_time + timedelta(milliseconds=1)).strftime(_VERSION_FORMAT)
+    return bumped[:-4] + bumped[-1:]
+
+
+class VersionIndex:
+    """
+    The versions of a versioned dataset, oldest first, kept in a small file next to them.
+    The file is replaced atomically on every update, so readers never see a partial index.
+    Local updates hold a file lock, so writers in other processes don't lose each other's versions.
+    Elsewhere, the versions are merged with the version directories found next to the index.
+    """
+
+    def __init__(self, fs, directory: str, protocol: str = "file"):
+        self._fs = fs
+        self._directory = directory.rstrip("/")
+        self._path = f"{self._directory}/{INDEX_NAME}"
+        self._local = protocol in LOCAL_PROTOCOLS
+        self._lock = threading.Lock()
+
+    def versions(self) -> Optional[List[str]]:
+        """
+        The indexed versions, or None if there is no index
+        """
+        try:
+            with self._fs.open(self._path, mode="rb") as index_file:
+                return json.loads(index_file.read())["versions"]
+        except FileNotFoundError:
+            return None
+
+    def latest(self) -> Optional[str]:
+        versions = self.versions()
+        return versions[-1] if versions else None
+
+    def _write(self, versions: List[str]):
+        content = json.dumps({"latest": versions[-1] if versions else None, "versions": versions})
+        if not self._local:
+            # Object stores replace whole objects atomically
+            self._fs.pipe(self._path, content.encode())
+            return
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        temp_path = f"{self._path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as index_file:
+            index_file.write(content)
+        os.replace(temp_path, self._path)
+
+    @contextmanager
+    def _locked(self):
+        """
+        Holds the index for a read-modify-write
+        """
+        with self._lock:
+            if not self._local or fcntl is None:
+                yield
+                return
+            os.makedirs(self._directory, exist_ok=True)
+            with open(f"{self._directory}/{LOCK_NAME}", "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _indexed(self) -> List[str]:
+        versions = self.versions() or []
+        if self._local and fcntl is not None:
+            return versions
+        # Without a lock, versions indexed by a concurrent writer are recovered from their directories
+        listed = [
+            os.path.basename(path.rstrip("/"))
+            for path in self._fs.ls(self._directory, detail=False)
+        ] if self._fs.exists(self._directory) else []
+        return sorted(set(versions) | {v for v in listed if not v.startswith(".")})
+
+    def add(self, version: str, keep: int = None) -> List[str]:
+        """
+        Adds a version, and returns the versions dropped by the `keep` newest retention
+        """
+        with self._locked():
+            versions = sorted(set(self._indexed()) | {version})
+            dropped = versions[: -keep] if keep else []
+            self._write(versions[len(dropped) :])
+        return dropped
+
+    def remove(self, removed: List[str]):
+        with self._locked():
+            self._write([v for v in self._indexed() if v not in set(removed)])
+
+
+class IndexedVersionedDataSet(AbstractDataSet):
+    """
+    Versions another dataset the way kedro does, under `<filepath>/<version>/<basename>`,
+    but resolves the latest version from an index file instead of listing every version.
+    Loads are pinned to `load_version` if given.
+    Only the `keep` newest versions are kept, if given.
+    """
+
+    def __init__(self, dataset: Dict[str, Any], load_version: str = None, keep: int = None):
+        self._dataset_config = deepcopy(dataset)
+        self._dataset_config.pop("versioned", None)
+        self._filepath = str(self._dataset_config["filepath"])
+        self._load_version = load_version
+        self._keep = keep
+        self._datasets = {}  # type: Dict[Any, AbstractDataSet]
+
+        protocol, path = get_protocol_and_path(self._filepath)
+        fs_args = dict(self._dataset_config.get("fs_args") or {})
+        fs_args.pop("open_args_load", None)
+        fs_args.pop("open_args_save", None)
+        self._protocol = protocol
+        self._path = path
+        self._fs = fsspec.filesystem(
+            protocol, **(self._dataset_config.get("credentials") or {}), **fs_args
+        )
+        self._index = VersionIndex(self._fs, path, protocol)
+        self._filesystems = None  # type: Optional[FileSystemPool]
+
+    def share_filesystems(self, filesystems: "FileSystemPool"):
+        """
+        Uses the shared filesystem given to this dataset for its index, and shares it with the datasets of its versions
+        """
+        self._filesystems = filesystems
+        self._index = VersionIndex(self._fs, self._path, self._protocol)
+        self._datasets.clear()
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            dataset=self._dataset_config, load_version=self._load_version, keep=self._keep
+        )
+
+    def _versioned(self, load_version: str = None, save_version: str = None) -> AbstractDataSet:
+        key = (load_version, save_version)
+        found_dataset = self._datasets.get(key)
+        if found_dataset is None:
+            found_dataset = AbstractDataSet.from_config(
+                f"{self._filepath}:{load_version or save_version}",
+                {**self._dataset_config, "versioned": True},
+                load_version=load_version,
+                save_version=save_version,
+            )
+            if self._filesystems is not None:
+                self._filesystems.inject(found_dataset, self._dataset_config)
+            if load_version is not None:
+                self._datasets[key] = found_dataset
+        return found_dataset
+
+    def resolve_load_version(self) -> Optional[str]:
+        """
+        The pinned version, else the latest indexed version
+        """
+        return self._load_version or self._index.latest()
+
+    def _load(self) -> Any:
+        load_version = self.resolve_load_version()
+        if load_version is None:
+            # Versions saved before the index existed are found by listing them
+            logger.warning(f"No version index for {self._filepath}, listing its versions")
+        return self._versioned(load_version).load()
+
+    def _save(self, data: Any) -> None:
+        save_version = next_version(self._index.latest())
+        self._fs.makedirs(f"{self._path.rstrip('/')}/{save_version}", exist_ok=True)
+        self._versioned(save_version=save_version).save(data)
+        dropped = self._index.add(save_version, self._keep)
+        self._remove_versions(dropped)
+
+    def _remove_versions(self, versions: List[str]):
+        for version in versions:
+            version_path = f"{self._path.rstrip('/')}/{version}"
+            if self._fs.exists(version_path):
+                self._fs.rm(version_path, recursive=True)
+            self._datasets.pop((version, None), None)
+
+    def _exists(self) -> bool:
+        load_version = self.resolve_load_version()
+        if load_version is None:
+            return False
+        return self._versioned(load_version).exists()
+
+    def _release(self) -> None:
+        for dataset in self._datasets.values():
+            dataset.release()
+        self._datasets.clear()
+        self._fs.invalidate_cache(self._path)
+
+    def versions(self) -> List[str]:
+        """
+        The indexed versions, oldest first
+        """
+        return self._index.versions() or []
+
+    def prune(self, keep: int) -> List[str]:
+        """
+        Removes all but the `keep` newest versions, and returns the removed versions
+        """
+        versions = self.versions()
+        removed = versions[: -keep] if keep else versions
+        self._index.remove(removed)
+        self._remove_versions(removed)
+        return removed
@@ -0,0 +1,36 @@
+from typing import Any
+
+import yaml
+from kedro.extras.datasets.yaml import YAMLDataSet
+from kedro.io.core import get_filepath_str
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper, SafeLoader
+
+
+class FastYAMLDataSet(YAMLDataSet):
+    """
+    A drop-in ``YAMLDataSet`` which loads and dumps with libyaml's CSafeLoader and CSafeDumper.
+    Falls back to the pure python loader and dumper when libyaml is not available.
+    """
+
+    def _load(self) -> Any:
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
+            return yaml.load(fs_file, Loader=SafeLoader)
+
+    def _save(self, data: Any) -> None:
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+        try:
+            dumped = yaml.dump(data, Dumper=SafeDumper, **self._save_args)
+        except yaml.representer.RepresenterError:
+            # Python specific objects, such as tuples, need the full dumper
+            dumped = yaml.dump(data, **self._save_args)
+
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
+            fs_file.write(dumped)
+        self._invalidate_cache()
@@ -0,0 +1,131 @@
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .cache import LocalCache
+
+if TYPE_CHECKING:  # pragma: no cover
+    import fsspec
+    from kedro.io import AbstractDataSet
+
+logger = logging.getLogger("KedroWings")
+
+LOCAL_PROTOCOLS = {"file", "local"}
+
+
+def _pool_size_args(protocol: str, max_connections: int) -> Dict[str, Any]:
+    if protocol in ("s3", "s3a", "s3n"):
+        return {"config_kwargs": {"max_pool_connections": max_connections}}
+    return {}
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = _merge(merged[key], value)
+        merged[key] = value
+    return merged
+
+
+class FileSystemPool:
+    """
+    Holds one fsspec filesystem per protocol and credential set.
+    Wing datasets on remote roots share these filesystems, and thus their sessions and connection pools.
+    When a cache is given, the shared filesystems read and write through it.
+    Local wings are only shared when local_fs_args are given.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = None,
+        cache: Optional[LocalCache] = None,
+        local_fs_args: Dict[str, Any] = None,
+    ):
+        self._max_connections = max_connections
+        self._cache = cache
+        self._local_fs_args = local_fs_args
+        self._filesystems = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(protocol: str, credentials: Dict, fs_args: Dict) -> Tuple[str, str, str]:
+        return (
+            protocol,
+            json.dumps(credentials, sort_keys=True, default=str),
+            json.dumps(fs_args, sort_keys=True, default=str),
+        )
+
+    def get(
+        self, protocol: str, credentials: Dict[str, Any] = None, fs_args: Dict[str, Any] = None
+    ) -> "fsspec.AbstractFileSystem":
+        """
+        Returns the shared filesystem for a protocol and credential set, creating it if needed
+        """
+        import fsspec
+
+        credentials = credentials or {}
+        fs_args = {
+            k: v
+            for k, v in (fs_args or {}).items()
+            if k not in ("open_args_load", "open_args_save")
+        }
+        key = self._key(protocol, credentials, fs_args)
+        with self._lock:
+            found_fs = self._filesystems.get(key)
+            if found_fs is None:
+                fs_kwargs = {**credentials, **fs_args}
+                if protocol in LOCAL_PROTOCOLS:
+                    fs_kwargs = {**fs_kwargs, **(self._local_fs_args or {})}
+                    found_fs = fsspec.filesystem(protocol, **fs_kwargs)
+                    self._filesystems[key] = found_fs
+                    return found_fs
+                if self._max_connections:
+                    pool_args = _pool_size_args(protocol, self._max_connections)
+                    if not pool_args:
+                        logger.warning(
+                            f"Connection pool size is not configurable for protocol {protocol}"
+                        )
+                    fs_kwargs = _merge(pool_args, fs_kwargs)
+                found_fs = fsspec.filesystem(protocol, **fs_kwargs)
+                if self._cache is not None:
+                    from .cached_filesystem import CachedFileSystem
+
+                    found_fs = CachedFileSystem(found_fs, self._cache)
+                self._filesystems[key] = found_fs
+            return found_fs
+
+    def inject(self, dataset: "AbstractDataSet", dataset_config: Dict[str, Any]) -> bool:
+        """
+        Replaces the filesystem of a fsspec based dataset with the shared one.
+        Versioned wings share it with the datasets of their versions.
+        Returns whether the dataset was injected.
+        """
+        from kedro.io.core import AbstractVersionedDataSet
+
+        from .datasets.versioned import IndexedVersionedDataSet
+
+        protocol = getattr(dataset, "_protocol", None)
+        if protocol is None or not hasattr(dataset, "_fs"):
+            return False
+        if protocol in LOCAL_PROTOCOLS and self._local_fs_args is None:
+            return False
+
+        shared_fs = self.get(
+            protocol, dataset_config.get("credentials"), dataset_config.get("fs_args")
+        )
+        dataset._fs = shared_fs
+        if isinstance(dataset, AbstractVersionedDataSet):
+            dataset._exists_function = shared_fs.exists
+            dataset._glob_function = shared_fs.glob
+        if isinstance(dataset, IndexedVersionedDataSet):
+            dataset.share_filesystems(self)
+        return True
+
+    def flush(self):
+        """
+        Uploads any files held back by a write-back cache
+        """
+        if self._cache is not None:
+            self._cache.flush()
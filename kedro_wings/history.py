@@ -0,0 +1,203 @@
+import errno
+import logging
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from kedro.io import AbstractDataSet
+
+logger = logging.getLogger("KedroWings")
+
+HISTORY_DIR = ".history"
+_STAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+_STAMP_LENGTH = 21
+# Generations snapshotted within the same microsecond get a counter, padded so they sort in order
+_COUNTER_WIDTH = 4
+# The retention policy of `chronocode_history=True`
+DEFAULT_HISTORY = {"generations": 10}
+# Linux ioctl number for FICLONE, used to request a copy-on-write reflink
+_FICLONE = 0x40049409
+
+
+def history_dir(filepath: str) -> str:
+    """
+    The directory holding the generations of a chronocoded file
+    """
+    directory, basename = os.path.split(filepath)
+    return os.path.join(directory, HISTORY_DIR, basename)
+
+
+def _reflink(src: str, dst: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    except OSError:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _link(src: str, dst: str) -> bool:
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            return False
+        raise
+    return True
+
+
+def snapshot(filepath: str) -> Tuple[Optional[str], bool]:
+    """
+    Snapshots the current state of a file into its history directory.
+    Returns the generation path, and whether the generation shares its inode with the live file.
+    A shared inode must be detached before the live file is rewritten.
+    """
+    if not os.path.isfile(filepath):
+        return None, False
+
+    target_dir = history_dir(filepath)
+    os.makedirs(target_dir, exist_ok=True)
+
+    _, ext = os.path.splitext(filepath)
+    stamp = datetime.now(timezone.utc).strftime(_STAMP_FORMAT)
+    generation = os.path.join(target_dir, f"{stamp}{ext}")
+    counter = 0
+    while os.path.exists(generation):
+        counter += 1
+        generation = os.path.join(target_dir, f"{stamp}_{counter:0{_COUNTER_WIDTH}d}{ext}")
+
+    if _link(filepath, generation):
+        return generation, True
+    if not _reflink(filepath, generation):
+        shutil.copy2(filepath, generation)
+    return generation, False
+
+
+def list_generations(filepath: str) -> List[str]:
+    """
+    Lists the generations of a file, newest first
+    """
+    target_dir = history_dir(filepath)
+    if not os.path.isdir(target_dir):
+        return []
+    return [
+        os.path.join(target_dir, g)
+        for g in sorted(os.listdir(target_dir), reverse=True)
+        if _generation_time(g) is not None
+    ]
+
+
+def _generation_time(generation: str) -> Optional[datetime]:
+    try:
+        stamp = os.path.basename(generation)[:_STAMP_LENGTH]
+        return datetime.strptime(stamp, _STAMP_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def compact(filepath: str, generations: int = None, days: float = None) -> List[str]:
+    """
+    Removes the generations of a file that fall outside of the retention policy.
+    A generation is kept only if it is within the newest `generations` and younger than `days`.
+    Returns the removed generations.
+    """
+    oldest = None
+    if days is not None:
+        oldest = datetime.now(timezone.utc) - timedelta(days=days)
+
+    removed = []
+    for i, generation in enumerate(list_generations(filepath)):
+        too_many = generations is not None and i >= generations
+        too_old = oldest is not None and _generation_time(generation) < oldest
+        if too_many or too_old:
+            os.unlink(generation)
+            removed.append(generation)
+    return removed
+
+
+class ChronocodeHistoryDataSet(AbstractDataSet):
+    """
+    Wraps a chronocoded dataset, keeping previous generations of its file under `.history/`.
+    Generations are hardlinks or reflinks of the replaced file where the filesystem supports them.
+    """
+
+    def __init__(
+        self,
+        dataset: AbstractDataSet,
+        filepath: str,
+        generations: int = None,
+        days: float = None,
+    ):
+        self._dataset = dataset
+        self._filepath = filepath
+        self._generations = generations
+        self._days = days
+        self._local = "://" not in filepath
+        if not self._local:
+            logger.warning(
+                f"Chronocode history is only supported on local files, skipping {filepath}"
+            )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            dataset=self._dataset,
+            filepath=self._filepath,
+            generations=self._generations,
+            days=self._days,
+        )
+
+    def _load(self) -> Any:
+        return self._dataset.load()
+
+    def _save(self, data: Any) -> None:
+        if not self._local:
+            self._dataset.save(data)
+            return
+
+        generation, shared = snapshot(self._filepath)
+        if shared:
+            # The writer must create a new inode, instead of truncating the generation
+            os.unlink(self._filepath)
+        try:
+            self._dataset.save(data)
+        except Exception:
+            if shared and not os.path.exists(self._filepath):
+                os.link(generation, self._filepath)
+            raise
+        compact(self._filepath, self._generations, self._days)
+
+    def _exists(self) -> bool:
+        return self._dataset.exists()
+
+    def _release(self) -> None:
+        self._dataset.release()
+
+    def list_generations(self) -> List[str]:
+        return list_generations(self._filepath)
+
+    def restore(self, generation: str = None) -> str:
+        """
+        Restores a generation as the live file, defaulting to the newest one.
+        The replaced state becomes a new generation itself.
+        """
+        found_generations = self.list_generations()
+        if generation is None:
+            if not found_generations:
+                raise FileNotFoundError(f"No history found for {self._filepath}")
+            generation = found_generations[0]
+
+        snapshot(self._filepath)
+        if os.path.exists(self._filepath):
+            os.unlink(self._filepath)
+        if not _link(generation, self._filepath):
+            shutil.copy2(generation, self._filepath)
+        self._dataset.release()
+        return generation
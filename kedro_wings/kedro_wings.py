@@ -1,18 +1,37 @@
+import json
 import logging
 import os
 from functools import reduce
-from typing import Dict, Iterable, Any, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Any, List, Optional, Set, Tuple, Union
 
-from kedro.framework.context import KedroContext
 from kedro.framework.hooks import hook_impl
 from kedro.io import DataCatalog, AbstractDataSet
+from kedro.io.core import AbstractVersionedDataSet
+from kedro.io.core import DataSetError, get_protocol_and_path, parse_dataset_definition
 from kedro.pipeline import Pipeline
 
+from .append import APPEND_SUFFIX, append_config
+from .backends import DEFAULT_BACKEND, backend_config, verify_backend
+from .cache import LocalCache
+from .filesystems import FileSystemPool
+from .history import DEFAULT_HISTORY, ChronocodeHistoryDataSet
+from .partitions import partition_config, split_partitions
+from .paths import PathRemapper
+from .sampling import sample_config, sample_from_env, verify_sample
+from .sharding import shard_prefix, verify_shard
+from .sniff import SNIFF_CACHE_NAME, SNIFF_EXTENSIONS, FormatSniffer
+from .versions import split_version, versioned_config
 from .wing_info import (
     WingInfo,
     parse_wing_info,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from kedro.framework.context import KedroContext
+    from kedro.pipeline.node import Node
+
+    from .memory import MemoryProfiler
+
 logger = logging.getLogger("KedroWings")
 
 
@@ -32,20 +51,80 @@ class MissingChronoDataSetTarget(KedroWingsException):
     pass
 
 
+class InvalidChronocodeHistory(KedroWingsException):
+    pass
+
+
+class InvalidCacheConfig(KedroWingsException):
+    pass
+
+
+class InvalidSample(KedroWingsException):
+    pass
+
+
+class InvalidSniffConfig(KedroWingsException):
+    pass
+
+
+class InvalidAppendWing(KedroWingsException):
+    pass
+
+
+class InvalidBackend(KedroWingsException):
+    pass
+
+
+class InvalidShardConfig(KedroWingsException):
+    pass
+
+
+class InvalidMemoryProfileConfig(KedroWingsException):
+    pass
+
+
+class InvalidPartitionWing(KedroWingsException):
+    pass
+
+
+class InvalidVersionConfig(KedroWingsException):
+    pass
+
+
+class InvalidVersionedWing(KedroWingsException):
+    pass
+
+
 class KedroWings:
     DEFAULT_TYPES = {
         ".csv": {"type": "pandas.CSVDataSet"},
-        ".yml": {"type": "yaml.YAMLDataSet"},
-        ".yaml": {"type": "yaml.YAMLDataSet"},
-        ".xls": {"type": "pandas.ExcelDataSet"},
+        ".yml": {"type": "kedro_wings.datasets.yaml.FastYAMLDataSet"},
+        ".yaml": {"type": "kedro_wings.datasets.yaml.FastYAMLDataSet"},
+        ".xls": {"type": "kedro_wings.datasets.excel.ExcelWorkbookDataSet"},
+        ".xlsx": {"type": "kedro_wings.datasets.excel.ExcelWorkbookDataSet"},
         ".txt": {"type": "text.TextDataSet"},
         ".png": {"type": "pillow.ImageDataSet"},
         ".jpg": {"type": "pillow.ImageDataSet"},
         ".jpeg": {"type": "pillow.ImageDataSet"},
         ".img": {"type": "pillow.ImageDataSet"},
-        ".pkl": {"type": "pickle.PickleDataSet"},
+        ".images": {"type": "kedro_wings.datasets.pillow.ImageDirectoryDataSet"},
+        ".pkl": {"type": "kedro_wings.datasets.pickle.PickleDataSet"},
+        ".cpkl": {"type": "kedro_wings.datasets.pickle.PickleDataSet", "backend": "cloudpickle"},
+        ".joblib": {"type": "kedro_wings.datasets.pickle.PickleDataSet", "backend": "joblib", "compression": 3},
         ".parquet": {"type": "pandas.ParquetDataSet"},
-        ".json": {"type": "json.JSONDataSet"},
+        ".feather": {"type": "pandas.FeatherDataSet"},
+        ".json": {"type": "kedro_wings.datasets.json.FastJSONDataSet"},
+        ".jsonl": {"type": "kedro_wings.datasets.json.JSONLinesDataSet"},
+        ".sqlite": {"type": "kedro_wings.datasets.sqlite.SQLiteTableDataSet"},
+        ".db": {"type": "kedro_wings.datasets.sqlite.SQLiteTableDataSet"},
+    }
+
+    # Extensions of files holding several datasets, and the dataset argument the member is passed as
+    CONTAINER_EXTENSIONS = {
+        ".sqlite": "table",
+        ".db": "table",
+        ".xls": "sheet_name",
+        ".xlsx": "sheet_name",
     }
 
     def __init__(
@@ -55,49 +134,121 @@ class KedroWings:
         root: str = None,
         namespaces: Iterable[str] = None,
         enabled: bool = True,
-        context: Optional[KedroContext] = None,
+        context: Optional["KedroContext"] = None,
+        chronocode_history: Union[bool, Dict[str, Any]] = None,
+        max_connections: int = None,
+        cache: Dict[str, Any] = None,
+        precreate_dirs: bool = False,
+        layer_configs: Dict[str, Dict[str, Any]] = None,
+        sample: Dict[str, Union[int, float]] = None,
+        sample_seed: int = 0,
+        sample_root: str = None,
+        sniff: Union[bool, Dict[str, Any]] = False,
+        backend: Union[str, Dict[str, str]] = DEFAULT_BACKEND,
+        shard: Dict[str, int] = None,
+        memory_profile: Union[bool, Dict[str, Any]] = False,
+        versioned: Dict[str, Any] = None,
     ):
         """
         KedroWings Hook
         :param dataset_configs: A mapping of file name extensions to the type of dataset to be created.
-        :param paths: A mapping of old path names to new path names.
-        :param root: The root directory to save files to. Default: data
+        :param paths: A mapping of old path names, or glob and `re:` patterns, to new path names.
+        :param root: The root directory to save files to. Default: data, under the project of the context if given
         :param enabled: Convenience flag to enable or disable this plugin.
         :param context: Used when inside of a notebook
+        :param chronocode_history: Keep previous generations of chronocoded wings. Keys: generations, days. True keeps 10 generations
+        :param max_connections: Connection pool size of the filesystems shared by wings on remote roots.
+        :param cache: Local disk cache for wings on remote roots. Keys: directory, max_bytes, write
+        :param precreate_dirs: Create all output directories once per run, instead of on every save.
+        :param layer_configs: A mapping of layers to dataset_configs, used for the wings in that layer.
+        :param sample: A mapping of layers to a number of rows, or a fraction, loaded from their wings. Default: KEDRO_WINGS_SAMPLE
+        :param sample_seed: Seed of the random fraction samples.
+        :param sample_root: The root directory outputs are saved to while sampling. Default: <root>_sample
+        :param sniff: Pick the dataset type of existing files from their first bytes. Keys: extensions, cache_file
+        :param backend: pandas, polars or arrow, or a mapping of layers to backends. The type of `.csv`, `.parquet` and `.feather` wings.
+        :param shard: A mapping of layers to the width of the hash prefix directory their wing files are saved under.
+        :param memory_profile: Report the peak memory of each node, and the size of each wing's data. Keys: interval, report, top
+        :param versioned: Version the wings of some layers, with an index of their versions. Keys: layers, keep
         """
 
         dataset_configs = dataset_configs or {}
         paths = paths or {}
 
         is_new_kw = False
+        self._resolved_directories = {}
+        self._dataset_types = {}
+        self._built_datasets = {}
+        self._built_filepaths = {}
+        self._output_wings = set()
+        self._output_names = set()
+        self._partitioned_wings = set()
+        self._load_versions = {}
 
         if context:
             try:
-                found_kw = list(filter(lambda x: isinstance(x, KedroWings), context.hooks))[0]
+                found_kw = list(
+                    filter(lambda x: isinstance(x, KedroWings), getattr(context, "hooks", ()))
+                )[0]
                 self._dataset_configs = found_kw._dataset_configs
+                self._layer_configs = found_kw._layer_configs
+                self._valid_extensions = found_kw._valid_extensions
                 self._paths = found_kw._paths
+                self._path_remapper = found_kw._path_remapper
                 self._enabled = found_kw._enabled
                 self._root = root
                 if root is None:
                     self._root = os.path.join(str(context.project_path), 'data')
                 self._namespaces = found_kw._namespaces
-                all_pipelines = reduce(
-                    lambda x, y: x + y, context.pipelines.values(), Pipeline([])
-                )
-                self._add_wings_to_context(all_pipelines, context)
+                self._chronocode_history = found_kw._chronocode_history
+                self._filesystems = found_kw._filesystems
+                self._precreate_dirs = found_kw._precreate_dirs
+                self._sample = found_kw._sample
+                self._sample_seed = found_kw._sample_seed
+                self._sample_root = found_kw._sample_root
+                self._sniff_extensions = found_kw._sniff_extensions
+                self._sniffer = found_kw._sniffer
+                self._backend = found_kw._backend
+                self._shard = found_kw._shard
+                self._memory_profiler = found_kw._memory_profiler
+                self._versioned = found_kw._versioned
             except IndexError:
                 is_new_kw = True
         else:
             is_new_kw = True
 
         if is_new_kw:
+            if root is None and context:
+                root = os.path.join(str(context.project_path), 'data')
             self._dataset_configs = {**self.DEFAULT_TYPES, **dataset_configs}
+            self._layer_configs = layer_configs or {}
+            self._sniff_extensions, self._sniffer = self._create_sniffer(sniff, root or "data")
+            self._valid_extensions = set(self._dataset_configs).union(
+                self._sniff_extensions, *self._layer_configs.values()
+            )
             self._paths = paths
+            self._path_remapper = PathRemapper(paths)
             self._enabled = enabled
             self._root = root or "data"
             namespaces = namespaces or []
             self._namespaces = [n if not n.endswith(".") else n[:-1] for n in namespaces]
+            self._chronocode_history = self._verify_chronocode_history(chronocode_history)
+            self._precreate_dirs = precreate_dirs
+            self._sample = self._verify_sample(sample)
+            self._sample_seed = sample_seed
+            self._sample_root = sample_root
+            self._backend = self._verify_backend(backend)
+            self._shard = self._verify_shard(shard or {})
+            self._memory_profiler = self._create_memory_profiler(memory_profile)
+            self._versioned = self._verify_versioned(versioned)
+            self._filesystems = FileSystemPool(
+                max_connections,
+                self._create_cache(cache),
+                local_fs_args={"auto_mkdir": False} if precreate_dirs else None,
+            )
 
+        self._context = context
+        if context:
+            self.refresh()
 
     @staticmethod
     def _verify_config(ext: str, found_config: Dict):
@@ -107,56 +258,444 @@ class KedroWings:
         if "type" not in found_config:
             raise MissingType(f'Configuration for {ext} is missing its "type" key.')
 
-    def _wing_to_dataset_config(self, wing: WingInfo) -> Dict:
+    _chronocode_history_keys = {"generations", "days"}
+
+    @staticmethod
+    def _verify_chronocode_history(chronocode_history: Union[bool, Dict, None]) -> Optional[Dict]:
         """
-        Parsing a wing to make it fit with a dataset config
+        Verifies the chronocode history retention policy
         """
-        directory = self._paths.get(wing.directory, wing.directory)
-        filepath_dir = directory
-        if self._root:
-            filepath_dir = os.path.join(self._root, directory)
-        filepath = os.path.join(filepath_dir, wing.basename)
-        found_config = self._dataset_configs[wing.extension]
-        if type(found_config) is not dict:
+        if chronocode_history is None or chronocode_history is False:
+            return None
+        if chronocode_history is True:
+            return dict(DEFAULT_HISTORY)
+        if not isinstance(chronocode_history, dict):
+            raise InvalidChronocodeHistory(
+                f"Chronocode history must be a mapping or True, got {chronocode_history!r}"
+            )
+        unknown_keys = set(chronocode_history) - KedroWings._chronocode_history_keys
+        if unknown_keys:
+            raise InvalidChronocodeHistory(
+                f"Unknown chronocode history keys: {sorted(unknown_keys)}"
+            )
+        generations = chronocode_history.get("generations")
+        if generations is not None and (type(generations) is not int or generations < 1):
+            raise InvalidChronocodeHistory(
+                f"Chronocode history generations must be a positive integer, got {generations!r}"
+            )
+        days = chronocode_history.get("days")
+        if days is not None and (
+            isinstance(days, bool) or not isinstance(days, (int, float)) or days < 0
+        ):
+            raise InvalidChronocodeHistory(
+                f"Chronocode history days must be a non-negative number, got {days!r}"
+            )
+        return dict(chronocode_history)
+
+    _cache_keys = {"directory", "max_bytes", "write"}
+
+    @staticmethod
+    def _create_cache(cache: Optional[Dict]) -> Optional[LocalCache]:
+        """
+        Creates the local cache used by wings on remote roots
+        """
+        if cache is None:
+            return None
+        unknown_keys = set(cache) - KedroWings._cache_keys
+        if unknown_keys:
+            raise InvalidCacheConfig(f"Unknown cache keys: {sorted(unknown_keys)}")
+        if "directory" not in cache:
+            raise InvalidCacheConfig('Cache configuration is missing its "directory" key.')
+        try:
+            return LocalCache(**cache)
+        except ValueError as e:
+            raise InvalidCacheConfig(str(e)) from e
+
+    _sniff_keys = {"extensions", "cache_file"}
+
+    @staticmethod
+    def _create_sniffer(sniff: Any, root: str) -> Tuple[Set[str], Optional[FormatSniffer]]:
+        """
+        Creates the format sniffer of the extensions to sniff, cached in the root directory by default
+        """
+        if not sniff:
+            return set(), None
+        sniff = {} if sniff is True else sniff
+        unknown_keys = set(sniff) - KedroWings._sniff_keys
+        if unknown_keys:
+            raise InvalidSniffConfig(f"Unknown sniff keys: {sorted(unknown_keys)}")
+        cache_file = sniff.get("cache_file")
+        if cache_file is None and "://" not in root:
+            cache_file = os.path.join(root, SNIFF_CACHE_NAME)
+        return set(sniff.get("extensions", SNIFF_EXTENSIONS)), FormatSniffer(cache_file)
+
+    @staticmethod
+    def _verify_sample(sample: Optional[Dict]) -> Dict:
+        """
+        Verifies the sampled layers, read from KEDRO_WINGS_SAMPLE when not given
+        """
+        try:
+            if sample is None:
+                sample = sample_from_env()
+            verify_sample(sample)
+        except ValueError as e:
+            raise InvalidSample(str(e)) from e
+        if sample:
+            logger.info(f"KedroWings sampling {sample}")
+        return dict(sample)
+
+    @staticmethod
+    def _verify_backend(backend: Union[str, Dict[str, str]]) -> Union[str, Dict[str, str]]:
+        """
+        Verifies the backend, or the backends of each layer
+        """
+        try:
+            verify_backend(backend)
+        except ValueError as e:
+            raise InvalidBackend(str(e)) from e
+        return dict(backend) if isinstance(backend, dict) else backend
+
+    @staticmethod
+    def _verify_shard(shard: Dict[str, int]) -> Dict[str, int]:
+        """
+        Verifies the shard widths of each layer
+        """
+        try:
+            verify_shard(shard)
+        except ValueError as e:
+            raise InvalidShardConfig(str(e)) from e
+        return dict(shard)
+
+    _memory_profile_keys = {"interval", "report", "top"}
+
+    @staticmethod
+    def _create_memory_profiler(memory_profile: Any) -> Optional["MemoryProfiler"]:
+        """
+        Creates the memory profiler of the pipeline runs
+        """
+        if not memory_profile:
+            return None
+        memory_profile = {} if memory_profile is True else memory_profile
+        unknown_keys = set(memory_profile) - KedroWings._memory_profile_keys
+        if unknown_keys:
+            raise InvalidMemoryProfileConfig(f"Unknown memory_profile keys: {sorted(unknown_keys)}")
+        from .memory import MemoryProfiler
+
+        return MemoryProfiler(**memory_profile)
+
+    _versioned_keys = {"layers", "keep"}
+
+    @staticmethod
+    def _verify_versioned(versioned: Optional[Dict]) -> Dict:
+        """
+        Verifies the versioned layers and the number of versions kept
+        """
+        versioned = dict(versioned or {})
+        unknown_keys = set(versioned) - KedroWings._versioned_keys
+        if unknown_keys:
+            raise InvalidVersionConfig(f"Unknown versioned keys: {sorted(unknown_keys)}")
+        keep = versioned.get("keep")
+        if keep is not None and (type(keep) is not int or keep < 1):
+            raise InvalidVersionConfig(f"Versions kept must be a positive integer, got {keep}")
+        versioned["layers"] = set(versioned.get("layers", ()))
+        return versioned
+
+    @staticmethod
+    def _strip_suffix(dataset_catalog_name: str) -> str:
+        """
+        The wing name of a chronocoded (!), appended (+), versioned (~) or partitioned (@) name
+        """
+        if dataset_catalog_name.endswith(("!", APPEND_SUFFIX)):
+            dataset_catalog_name = dataset_catalog_name[:-1]
+        return split_partitions(split_version(dataset_catalog_name)[0])[0]
+
+    @staticmethod
+    def _wing_layer(wing: WingInfo) -> str:
+        return wing.directory.split("/", 1)[0]
+
+    def _wing_backend(self, wing: WingInfo) -> str:
+        if isinstance(self._backend, dict):
+            return self._backend.get(self._wing_layer(wing), DEFAULT_BACKEND)
+        return self._backend
+
+    def _find_config(self, wing: WingInfo) -> Optional[Dict]:
+        """
+        Finds the dataset config of a wing, with its layer config merged over the extension's config.
+        The backend replaces the default configs of tabular extensions, but not configs given by the user.
+        """
+        found_config = self._dataset_configs.get(wing.extension)
+        if type(found_config) not in (dict, type(None)):
             found_config = {"type": found_config}
+        # Compared by identity, so that configs given by the user are kept even when equal to the default
+        if found_config is not None and found_config is self.DEFAULT_TYPES.get(wing.extension):
+            found_config = backend_config(self._wing_backend(wing), wing.extension) or found_config
+        layer_config = self._layer_configs.get(self._wing_layer(wing), {}).get(
+            wing.extension
+        )
+        if layer_config is None:
+            return found_config
+        if type(layer_config) is not dict:
+            return {"type": layer_config}
+        return {**(found_config or {}), **layer_config}
+
+    def _parse_wing(self, dataset_catalog_name: str) -> WingInfo:
+        """
+        Parses a catalog name into a wing, if there is a dataset config for it
+        """
+        wing = parse_wing_info(
+            dataset_catalog_name,
+            self._valid_extensions,
+            self._namespaces,
+            self.CONTAINER_EXTENSIONS,
+        )
+        if (
+            wing != WingInfo()
+            and wing.extension not in self._sniff_extensions
+            and self._find_config(wing) is None
+        ):
+            return WingInfo()
+        return wing
+
+    def _resolve_directory(self, wing_directory: str, root: str = None) -> str:
+        """
+        Resolves the directory a wing is saved to, once per wing directory and root
+        """
+        root = root or self._root
+        found_directory = self._resolved_directories.get((root, wing_directory))
+        if found_directory is not None:
+            return found_directory
+
+        directory = self._path_remapper.remap(wing_directory)
+        filepath_dir = directory
+        if root:
+            filepath_dir = os.path.join(root, directory)
+        if self._precreate_dirs and "://" not in filepath_dir:
+            filepath_dir = os.path.abspath(filepath_dir)
+        self._resolved_directories[(root, wing_directory)] = filepath_dir
+        return filepath_dir
+
+    def _track_outputs(self, output_names: Iterable[str]):
+        """
+        Records the wings written by the pipeline, which are saved to the sample root while sampling.
+        Partitioned outputs are also read as partitioned datasets by their plain name.
+        """
+        for output_name in output_names:
+            wing = self._parse_wing(self._strip_suffix(output_name))
+            if wing != WingInfo():
+                self._output_wings.add((wing.directory, wing.basename, wing.member))
+                self._output_names.add(output_name)
+                if split_partitions(output_name.rstrip("!"))[1] is not None:
+                    self._partitioned_wings.add((wing.directory, wing.basename))
+
+    def _wing_root(self, wing: WingInfo, is_output: bool = True) -> str:
+        """
+        The root of a wing. While sampling, outputs are kept apart from the full data.
+        Names only read from an output wing, such as the input of a chronocoded wing,
+        read its sampled output if there is one yet, and the full data otherwise.
+        """
+        if not self._sample or (wing.directory, wing.basename, wing.member) not in self._output_wings:
+            return self._root
+        sample_root = self._sample_root or f"{self._root}_sample"
+        if is_output:
+            return sample_root
+        sample_path = os.path.join(self._wing_directory(wing, sample_root), wing.basename)
+        found_config = self._find_config(wing) or {}
+        protocol, _ = get_protocol_and_path(sample_path)
+        fs = self._filesystems.get(
+            protocol, found_config.get("credentials"), found_config.get("fs_args")
+        )
+        return sample_root if fs.exists(sample_path) else self._root
+
+    def _wing_directory(self, wing: WingInfo, root: str) -> str:
+        """
+        The directory a wing file is saved to, under its hash prefix directory in sharded layers
+        """
+        directory = self._resolve_directory(wing.directory, root)
+        width = self._shard.get(self._wing_layer(wing))
+        if width:
+            return os.path.join(directory, shard_prefix(wing.basename, width))
+        return directory
+
+    def _sniff_config(self, filepath: str, found_config: Optional[Dict]) -> Optional[Dict]:
+        """
+        The dataset config of an existing file, sniffed from its first bytes
+        """
+        found_config = found_config or {}
+        protocol, _ = get_protocol_and_path(filepath)
+        fs = self._filesystems.get(
+            protocol, found_config.get("credentials"), found_config.get("fs_args")
+        )
+        sniffed_config = self._sniffer.sniff_config(fs, filepath)
+        if sniffed_config is None:
+            return None
+        if "credentials" in found_config:
+            sniffed_config["credentials"] = found_config["credentials"]
+        return sniffed_config
+
+    def _wing_to_dataset_config(self, wing: WingInfo, root: str = None) -> Optional[Dict]:
+        """
+        Parsing a wing to make it fit with a dataset config.
+        Returns None for a wing to be sniffed, which has neither a recognized file nor a config.
+        """
+        root = root or self._wing_root(wing)
+        filepath = os.path.join(self._wing_directory(wing, root), wing.basename)
+        found_config = self._find_config(wing)
+        if wing.extension in self._sniff_extensions:
+            found_config = self._sniff_config(filepath, found_config) or found_config
+            if found_config is None:
+                return None
+        found_config = found_config or {}
         self._verify_config(wing.extension, found_config)
         dataset_config = {
             "filepath": filepath,
             **found_config,
         }
+        if wing.member:
+            dataset_config[self.CONTAINER_EXTENSIONS[wing.extension]] = wing.member
+        return dataset_config
+
+    def _resolve_config(self, dataset_catalog_name: str) -> Optional[Dict]:
+        """
+        Resolves the dataset config of a wing, or of a chronocoded, appended or partitioned wing, without instantiating it.
+        Sampling wraps the resolved dataset last, so that it samples the partitioned or versioned dataset.
+        """
+        wing = self._parse_wing(self._strip_suffix(dataset_catalog_name))
+        if wing == WingInfo():
+            return None
+        root = self._wing_root(wing, dataset_catalog_name in self._output_names)
+        dataset_config = self._wing_to_dataset_config(wing, root)
+        if dataset_config is None:
+            return None
+        if dataset_catalog_name.endswith(APPEND_SUFFIX):
+            try:
+                dataset_config = append_config(dataset_config)
+            except ValueError as e:
+                raise InvalidAppendWing(f"{dataset_catalog_name}: {e}") from e
+        unversioned_name, load_version = split_version(dataset_catalog_name.rstrip("!"))
+        partition_cols = split_partitions(unversioned_name)[1]
+        if partition_cols is not None or (wing.directory, wing.basename) in self._partitioned_wings:
+            try:
+                dataset_config = partition_config(dataset_config, partition_cols or [])
+            except ValueError as e:
+                raise InvalidPartitionWing(f"{dataset_catalog_name}: {e}") from e
+        if load_version is not None or self._wing_layer(wing) in self._versioned["layers"]:
+            dataset_type = self._dataset_type(dataset_config["type"])
+            if isinstance(dataset_type, type) and not issubclass(dataset_type, AbstractVersionedDataSet):
+                raise InvalidVersionedWing(
+                    f"{dataset_catalog_name}: {dataset_type.__name__} can't be versioned."
+                )
+            dataset_config = versioned_config(
+                dataset_config,
+                load_version or self._load_versions.get(dataset_catalog_name),
+                self._versioned.get("keep"),
+            )
+        sample_size = self._sample.get(self._wing_layer(wing))
+        # Chronocoded and appended names are only saved to
+        is_saved_only = dataset_catalog_name.endswith(("!", APPEND_SUFFIX))
+        if sample_size is not None and root == self._root and not is_saved_only:
+            dataset_config = sample_config(dataset_config, sample_size, self._sample_seed)
         return dataset_config
 
+    def _dataset_type(self, dataset_type: Any) -> Any:
+        """
+        Resolves a dataset type to its class, so that differently spelled types compare equal
+        """
+        if not isinstance(dataset_type, str):
+            return dataset_type
+        found_type = self._dataset_types.get(dataset_type)
+        if found_type is None:
+            try:
+                found_type = parse_dataset_definition({"type": dataset_type})[0]
+            except DataSetError:
+                found_type = dataset_type
+            self._dataset_types[dataset_type] = found_type
+        return found_type
+
+    def _dataset_key(self, dataset_config: Dict) -> Tuple[str, Any, str]:
+        """
+        The canonical physical file, type and arguments of a dataset config
+        """
+        filepath = str(dataset_config.get("filepath", ""))
+        if filepath and "://" not in filepath:
+            filepath = os.path.abspath(filepath)
+        arguments = {
+            k: v for k, v in dataset_config.items() if k not in ("filepath", "type")
+        }
+        return (
+            filepath,
+            self._dataset_type(dataset_config["type"]),
+            json.dumps(arguments, sort_keys=True, default=repr),
+        )
+
+    def _build_dataset(self, dataset_catalog_name: str, dataset_config: Dict) -> AbstractDataSet:
+        """
+        Instantiates a wing dataset, sharing its filesystem with the other wings on the same remote root.
+        Wings resolving to the same file, type and arguments share a single dataset.
+        """
+        dataset_key = self._dataset_key(dataset_config)
+        found_dataset = self._built_datasets.get(dataset_key)
+        if found_dataset is not None:
+            return found_dataset
+
+        filepath, dataset_type = dataset_key[:2]
+        if filepath:
+            other_name, other_type = self._built_filepaths.setdefault(
+                filepath, (dataset_catalog_name, dataset_type)
+            )
+            # Appended, partitioned and versioned variants of a wing are meant to share its file
+            is_variant = self._strip_suffix(dataset_catalog_name) == self._strip_suffix(other_name)
+            if other_type != dataset_type and not is_variant:
+                logger.warning(
+                    f"{dataset_catalog_name} and {other_name} both resolve to {filepath}, "
+                    f"with different types: {dataset_type} and {other_type}"
+                )
+
+        dataset = AbstractDataSet.from_config(dataset_catalog_name, dataset_config)
+        self._filesystems.inject(dataset, dataset_config)
+        self._built_datasets[dataset_key] = dataset
+        return dataset
+
     def _create_entries(
         self,
         dataset_catalog_names: Iterable[str],
         catalog_datasets: Dict[str, AbstractDataSet],
+        built_datasets: Dict[Tuple, AbstractDataSet] = None,
     ):
         """
-        Creates a set of catalog entries based on wing and chronocoded datasets
+        Creates a set of catalog entries based on wing and chronocoded datasets.
+        Datasets in built_datasets are reused when a wing still resolves to the same key.
         """
-        wing_entries = self._create_wing_entries(dataset_catalog_names)
+        self._built_datasets = dict(built_datasets or {})
+        self._built_filepaths = {}
+        wing_entries = self._create_wing_entries(dataset_catalog_names, catalog_datasets)
         catalog_and_wings = {**catalog_datasets, **wing_entries}
         chrono_datasets = self._create_chronocode_entries(
             dataset_catalog_names, catalog_and_wings
         )
+        if self._sniffer is not None:
+            self._sniffer.save()
         return {**wing_entries, **chrono_datasets}
 
     def _create_wing_entries(
-        self, dataset_catalog_names: Iterable[str]
+        self,
+        dataset_catalog_names: Iterable[str],
+        catalog_datasets: Dict[str, AbstractDataSet] = None,
     ) -> Dict[str, AbstractDataSet]:
+        catalog_datasets = catalog_datasets or {}
         out = {}
-        for dataset_catalog_name in dataset_catalog_names:
+        for dataset_catalog_name in sorted(dataset_catalog_names):
             if dataset_catalog_name.endswith("!"):
                 continue
 
-            wing = parse_wing_info(
-                dataset_catalog_name, self._dataset_configs.keys(), self._namespaces
-            )
-            if wing == WingInfo():
+            dataset_config = self._resolve_config(dataset_catalog_name)
+            if dataset_config is None:
+                is_catalog_dataset = dataset_catalog_name in catalog_datasets
+                if dataset_catalog_name.endswith(APPEND_SUFFIX) and not is_catalog_dataset:
+                    raise InvalidAppendWing(
+                        f"{dataset_catalog_name}: only wings can be appended to."
+                    )
                 continue
-            out[dataset_catalog_name] = AbstractDataSet.from_config(
-                dataset_catalog_name, self._wing_to_dataset_config(wing)
-            )
+            out[dataset_catalog_name] = self._build_dataset(dataset_catalog_name, dataset_config)
         return out
 
     def _create_chronocode_entries(
@@ -170,13 +709,17 @@ class KedroWings:
             if not dataset_catalog_name.endswith("!"):
                 continue
             nonchrono_name = dataset_catalog_name[:-1]
-            wing = parse_wing_info(
-                nonchrono_name, self._dataset_configs.keys(), self._namespaces
-            )
-            if wing != WingInfo():
-                out[dataset_catalog_name] = AbstractDataSet.from_config(
-                    dataset_catalog_name, self._wing_to_dataset_config(wing)
-                )
+            dataset_config = self._resolve_config(dataset_catalog_name)
+            if dataset_config is not None:
+                dataset = self._build_dataset(dataset_catalog_name, dataset_config)
+                if self._chronocode_history is not None:
+                    history_key = (*self._dataset_key(dataset_config), "history")
+                    if history_key not in self._built_datasets:
+                        self._built_datasets[history_key] = ChronocodeHistoryDataSet(
+                            dataset, dataset_config["filepath"], **self._chronocode_history
+                        )
+                    dataset = self._built_datasets[history_key]
+                out[dataset_catalog_name] = dataset
                 continue
 
             found_dataset = catalog_datasets.get(nonchrono_name)
@@ -186,13 +729,76 @@ class KedroWings:
 
         return out
 
+    def _output_directories(self, output_names: Iterable[str]) -> Set[str]:
+        """
+        The distinct local directories that the wing outputs are saved to
+        """
+        out = set()
+        for output_name in output_names:
+            wing = self._parse_wing(self._strip_suffix(output_name))
+            if wing == WingInfo():
+                continue
+            directory = self._wing_directory(wing, self._wing_root(wing))
+            if "://" not in directory:
+                out.add(directory)
+        return out
+
+    def _create_output_directories(self, pipeline: Pipeline):
+        """
+        Creates every output directory of a pipeline in a single pass
+        """
+        if not self._precreate_dirs:
+            return
+        for directory in sorted(self._output_directories(pipeline.all_outputs())):
+            os.makedirs(directory, exist_ok=True)
+
     _backup_attr_name = "__wings_backup_get_catalog"
+    _entries_attr_name = "__wings_entries"
+    _built_attr_name = "__wings_built_datasets"
 
-    def _add_wings_to_context(self, pipeline: Pipeline, context: KedroContext):
+    def refresh(self, context: Optional["KedroContext"] = None) -> Dict[str, List[str]]:
+        """
+        Updates the wing entries of a context after its pipelines have changed.
+        Only new and changed wings are created, unchanged datasets and their caches are kept.
+        :param context: Default: the context this KedroWings was created with
+        :return: The added, removed and replaced catalog names
+        """
+        context = context or self._context
+        if context is None:
+            raise KedroWingsException("KedroWings needs a context to refresh.")
+        all_pipelines = reduce(lambda x, y: x + y, context.pipelines.values(), Pipeline([]))
+        return self._add_wings_to_context(all_pipelines, context)
+
+    def _add_wings_to_context(
+        self, pipeline: Pipeline, context: "KedroContext"
+    ) -> Dict[str, List[str]]:
 
         logger.info("KedroWings added to Context")
-        if getattr(context, KedroWings._backup_attr_name, None):
-            return
+        if not getattr(context, KedroWings._backup_attr_name, None):
+            setattr(context, KedroWings._backup_attr_name, context._get_catalog)
+            setattr(context, KedroWings._entries_attr_name, {})
+            setattr(context, KedroWings._built_attr_name, {})
+
+            def _generate_wings_catalog(self_context, self_catalog_entries):
+                def _get_wings_catalog():
+                    catalog = getattr(self_context, KedroWings._backup_attr_name,)()
+
+                    existing_catalog_names = set(catalog.list())
+                    for catalog_name, catalog_dataset in self_catalog_entries.items():
+                        if catalog_name in existing_catalog_names:
+                            continue
+                        catalog.add(catalog_name, catalog_dataset)
+                    return catalog
+
+                return _get_wings_catalog
+
+            setattr(
+                context,
+                "_get_catalog",
+                _generate_wings_catalog(
+                    context, getattr(context, KedroWings._entries_attr_name)
+                ),
+            )
 
         all_dataset_names = set(
             [
@@ -202,27 +808,38 @@ class KedroWings:
             ]
         )
 
-        setattr(context, KedroWings._backup_attr_name, context._get_catalog)
-
-        def _generate_wings_catalog(self_context, self_catalog_entries):
-            def _get_wings_catalog():
-                catalog = getattr(self_context, KedroWings._backup_attr_name,)()
-
-                existing_catalog_names = set(catalog.list())
-                for catalog_name, catalog_dataset in self_catalog_entries.items():
-                    if catalog_name in existing_catalog_names:
-                        continue
-                    catalog.add(catalog_name, catalog_dataset)
-                return catalog
-
-            return _get_wings_catalog
-
+        self._track_outputs(pipeline.all_outputs())
+        self._create_output_directories(pipeline)
+        catalog = getattr(context, KedroWings._backup_attr_name)()
         all_new_entries = self._create_entries(
-            all_dataset_names, context.catalog._data_sets
+            all_dataset_names,
+            catalog._data_sets,
+            getattr(context, KedroWings._built_attr_name),
         )
+        used_datasets = set(map(id, all_new_entries.values()))
         setattr(
-            context, "_get_catalog", _generate_wings_catalog(context, all_new_entries)
+            context,
+            KedroWings._built_attr_name,
+            {k: v for k, v in self._built_datasets.items() if id(v) in used_datasets},
+        )
+
+        entries = getattr(context, KedroWings._entries_attr_name)
+        changes = {
+            "added": sorted(set(all_new_entries) - set(entries)),
+            "removed": sorted(set(entries) - set(all_new_entries)),
+            "replaced": sorted(
+                name
+                for name, dataset in all_new_entries.items()
+                if name in entries and entries[name] is not dataset
+            ),
+        }
+        entries.clear()
+        entries.update(all_new_entries)
+        logger.info(
+            f"KedroWings refreshed: {len(changes['added'])} added, "
+            f"{len(changes['removed'])} removed, {len(changes['replaced'])} replaced"
         )
+        return changes
 
     @hook_impl
     def before_pipeline_run(
@@ -240,6 +857,9 @@ class KedroWings:
             ]
         )
 
+        self._load_versions = dict(run_params.get("load_versions") or {})
+        self._track_outputs(pipeline.all_outputs())
+        self._create_output_directories(pipeline)
         all_new_entries = self._create_entries(all_dataset_names, catalog._data_sets)
 
         existing_catalog_names = set(catalog.list())
@@ -247,3 +867,54 @@ class KedroWings:
             if catalog_name in existing_catalog_names:
                 continue
             catalog.add(catalog_name, catalog_dataset)
+
+        if self._memory_profiler is not None:
+            self._memory_profiler.start()
+
+    def _wing_objects(self, data: Dict[str, Any]) -> List[Tuple[str, str, Any]]:
+        """
+        The wing name, layer and object of the wings among a node's inputs or outputs
+        """
+        out = []
+        for name, obj in data.items():
+            wing_name = self._strip_suffix(name)
+            wing = self._parse_wing(wing_name)
+            if wing != WingInfo():
+                out.append((wing_name, self._wing_layer(wing), obj))
+        return out
+
+    @hook_impl
+    def before_node_run(self, node: "Node", inputs: Dict[str, Any]):
+        if not self._enabled or self._memory_profiler is None:
+            return
+        self._memory_profiler.before_node(node.name, self._wing_objects(inputs))
+
+    @hook_impl
+    def after_node_run(self, node: "Node", outputs: Dict[str, Any]):
+        if not self._enabled or self._memory_profiler is None:
+            return
+        self._memory_profiler.after_node(node.name, self._wing_objects(outputs))
+
+    @hook_impl
+    def after_pipeline_run(
+        self, run_params: Dict, pipeline: Pipeline, catalog: DataCatalog
+    ):
+        if not self._enabled:
+            return
+        self._filesystems.flush()
+        if self._memory_profiler is not None:
+            self._memory_profiler.stop()
+
+    @hook_impl
+    def on_pipeline_error(
+        self,
+        error: Exception,
+        run_params: Dict,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+    ):
+        if not self._enabled:
+            return
+        self._filesystems.flush()
+        if self._memory_profiler is not None:
+            self._memory_profiler.stop()
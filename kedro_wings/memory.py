@@ -0,0 +1,219 @@
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("KedroWings")
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover
+    psutil = None
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """
+    The resident set size of this process, in bytes
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        # The peak RSS is the best that can be done without psutil or procfs
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _flat_size(obj: Any) -> Optional[int]:
+    """
+    The size of the buffers of dataframes and arrays, or None for other objects
+    """
+    if hasattr(obj, "memory_usage") and type(obj).__module__.startswith("pandas"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(obj, "estimated_size") and type(obj).__module__.startswith("polars"):
+        return int(obj.estimated_size())
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return None
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    The in-memory size of an object and everything it references, in bytes.
+    Objects referenced several times are counted once.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+
+        flat_size = _flat_size(item)
+        if flat_size is not None:
+            size += flat_size
+            continue
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, type):
+            stack.extend(vars(item).values())
+    return size
+
+
+class _NodeRecord:
+    __slots__ = ("name", "rss_before", "rss_after", "peak_rss")
+
+    def __init__(self, name: str, rss: int):
+        self.name = name
+        self.rss_before = rss
+        self.rss_after = None
+        self.peak_rss = rss
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "node": self.name,
+            "rss_before": self.rss_before,
+            "rss_after": self.rss_after,
+            "peak_rss": self.peak_rss,
+            "peak_increase": self.peak_rss - self.rss_before,
+        }
+
+
+class MemoryProfiler:
+    """
+    Records the RSS of the process before and after each node, and its peak while the node runs,
+    sampled by a background thread.
+    Also records the deep size of the objects loaded from and saved to each wing.
+    """
+
+    def __init__(self, interval: float = 0.01, report: str = None, top: int = 10):
+        self._interval = interval
+        self._report_file = report
+        self._top = top
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sampler = None  # type: Optional[threading.Thread]
+        self._running = {}  # type: Dict[str, _NodeRecord]
+        self._nodes = []  # type: List[_NodeRecord]
+        self._datasets = {}  # type: Dict[str, Dict[str, Any]]
+        self._peak_rss = 0
+        self.last_report = None  # type: Optional[Dict[str, Any]]
+
+    def _sample(self):
+        while not self._stopped.wait(self._interval):
+            rss = current_rss()
+            with self._lock:
+                self._peak_rss = max(self._peak_rss, rss)
+                for record in self._running.values():
+                    record.peak_rss = max(record.peak_rss, rss)
+
+    def start(self):
+        self.stop()
+        self._running, self._nodes, self._datasets = {}, [], {}
+        self._peak_rss = current_rss()
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._sample, name="KedroWingsMemory", daemon=True)
+        self._sampler.start()
+
+    def _record_datasets(self, wing_objects: Iterable[Tuple[str, str, Any]], key: str):
+        for name, layer, obj in wing_objects:
+            size = deep_sizeof(obj)
+            with self._lock:
+                dataset = self._datasets.setdefault(
+                    name, {"name": name, "layer": layer, "loaded_bytes": 0, "saved_bytes": 0}
+                )
+                dataset[key] = max(dataset[key], size)
+
+    def before_node(self, node_name: str, inputs: Iterable[Tuple[str, str, Any]]):
+        """
+        :param inputs: The (wing name, layer, object) of each wing loaded by the node
+        """
+        self._record_datasets(inputs, "loaded_bytes")
+        rss = current_rss()
+        with self._lock:
+            self._running[node_name] = _NodeRecord(node_name, rss)
+
+    def after_node(self, node_name: str, outputs: Iterable[Tuple[str, str, Any]]):
+        """
+        :param outputs: The (wing name, layer, object) of each wing saved by the node
+        """
+        rss = current_rss()
+        with self._lock:
+            record = self._running.pop(node_name, None)
+            if record is not None:
+                record.rss_after = rss
+                record.peak_rss = max(record.peak_rss, rss)
+                self._peak_rss = max(self._peak_rss, record.peak_rss)
+                self._nodes.append(record)
+        self._record_datasets(outputs, "saved_bytes")
+
+    def stop(self) -> Optional[Dict[str, Any]]:
+        """
+        Stops sampling, and writes the report of the run
+        """
+        if self._sampler is None:
+            return None
+        self._stopped.set()
+        self._sampler.join()
+        self._sampler = None
+
+        nodes = sorted(
+            (r.to_dict() for r in self._nodes), key=lambda r: r["peak_increase"], reverse=True
+        )
+        datasets = sorted(
+            self._datasets.values(),
+            key=lambda d: max(d["loaded_bytes"], d["saved_bytes"]),
+            reverse=True,
+        )
+        layers = {}  # type: Dict[str, int]
+        for dataset in datasets:
+            layer_bytes = max(dataset["loaded_bytes"], dataset["saved_bytes"])
+            layers[dataset["layer"]] = layers.get(dataset["layer"], 0) + layer_bytes
+        self.last_report = {
+            "peak_rss": self._peak_rss,
+            "nodes": nodes,
+            "datasets": datasets,
+            "layers": dict(sorted(layers.items(), key=lambda x: x[1], reverse=True)),
+        }
+        self._log_report(self.last_report)
+        if self._report_file:
+            directory = os.path.dirname(self._report_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self._report_file, "w") as report_file:
+                json.dump(self.last_report, report_file, indent=2)
+        return self.last_report
+
+    def _log_report(self, report: Dict[str, Any]):
+        lines = [f"KedroWings peak RSS {_megabytes(report['peak_rss'])}"]
+        for node in report["nodes"][: self._top]:
+            lines.append(
+                f"  node {node['node']}: +{_megabytes(node['peak_increase'])} peak, "
+                f"{_megabytes(node['peak_rss'])} peak RSS"
+            )
+        for dataset in report["datasets"][: self._top]:
+            lines.append(
+                f"  wing {dataset['name']}: {_megabytes(dataset['loaded_bytes'])} loaded, "
+                f"{_megabytes(dataset['saved_bytes'])} saved"
+            )
+        logger.info("\n".join(lines))
+
+
+def _megabytes(size: int) -> str:
+    return f"{size / 2 ** 20:.1f}MB"
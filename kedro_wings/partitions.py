@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from .sampling import dataset_type_name
+
+PARTITION_SEPARATOR = "@"
+# Only parquet wings are partitioned, the `@` suffixes of other names are left to kedro's transcoding
+PARTITION_EXTENSIONS = (".parquet",)
+# Suffixes naming a data format, which are kedro transcodings, such as `a.parquet@spark`, not partition columns
+TRANSCODING_FORMATS = {"arrow", "dask", "ibis", "modin", "pandas", "polars", "pyarrow", "spark"}
+PARTITIONED_PARQUET_TYPE = "kedro_wings.datasets.arrow.PartitionedParquetDataSet"
+
+# Whether the partitioned datasets replacing each parquet dataset load pandas DataFrames
+PARTITION_TYPES = {
+    "ParquetDataSet": True,
+    "PartitionedParquetDataSet": True,
+    "ArrowTableDataSet": False,
+    "LazyPolarsDataSet": False,
+}  # type: Dict[str, bool]
+_LAZY_TYPES = ("LazyPolarsDataSet",)
+
+
+def split_partitions(dataset_catalog_name: str) -> Tuple[str, Optional[List[str]]]:
+    """
+    Splits a name such as `03_primary/sales.parquet@region,date` into its wing name and partition columns.
+    The columns are None for names without a partition spec, and empty for names ending with a bare `@`.
+    The separator is kedro's transcoding separator, so that all the names of a dataset are linked in the pipeline.
+    Names of other wings, and parquet names transcoded to a format such as `@spark`, are returned as they are.
+    """
+    wing_name, separator, columns = dataset_catalog_name.rpartition(PARTITION_SEPARATOR)
+    if not separator or "/" in columns or not wing_name.endswith(PARTITION_EXTENSIONS):
+        return dataset_catalog_name, None
+    if columns.strip().lower() in TRANSCODING_FORMATS:
+        return dataset_catalog_name, None
+    return wing_name, [c.strip() for c in columns.split(",") if c.strip()]
+
+
+def partition_config(dataset_config: Dict[str, Any], partition_cols: List[str]) -> Dict[str, Any]:
+    """
+    Rewrites a parquet dataset config to load and save a hive-partitioned dataset directory
+    """
+    type_name = dataset_type_name(dataset_config["type"])
+    if type_name not in PARTITION_TYPES:
+        raise ValueError(
+            f"{type_name} can't be partitioned, only {sorted(PARTITION_TYPES)} can."
+        )
+    if type_name in _LAZY_TYPES and not partition_cols:
+        # Lazy scans prune the partitions by themselves
+        load_args = {**(dataset_config.get("load_args") or {}), "hive_partitioning": True}
+        return {**dataset_config, "load_args": load_args}
+    to_pandas = dataset_config.get("to_pandas", PARTITION_TYPES[type_name])
+    return {
+        "type": PARTITIONED_PARQUET_TYPE,
+        "filepath": dataset_config["filepath"],
+        "partition_cols": partition_cols,
+        "to_pandas": to_pandas,
+        "load_args": dataset_config.get("load_args"),
+        "credentials": dataset_config.get("credentials"),
+        "fs_args": dataset_config.get("fs_args"),
+    }
@@ -0,0 +1,88 @@
+import fnmatch
+import re
+from datetime import datetime
+from typing import Dict, List, Pattern, Tuple
+
+REGEX_PREFIX = "re:"
+_GLOB_CHARS = set("*?[")
+# Numbered backreferences and conditionals, which refer to other groups once rules are combined.
+# An escaped backslash followed by a digit matches too, which only costs the combined matcher.
+_NUMBERED_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def is_pattern(path: str) -> bool:
+    return path.startswith(REGEX_PREFIX) or bool(_GLOB_CHARS & set(path))
+
+
+def _compile_rule(path: str) -> Pattern:
+    if path.startswith(REGEX_PREFIX):
+        return re.compile(path[len(REGEX_PREFIX) :])
+    return re.compile(fnmatch.translate(path))
+
+
+class PathRemapper:
+    """
+    Remaps wing directories, using exact paths first and then glob or regex rules.
+    Regex rules are prefixed with `re:` and their new paths may reference groups, e.g. `\\1`.
+    New paths may also use the `{directory}` and `{date}` fields.
+    Rules are compiled into a single matcher, and results are memoized per directory.
+    """
+
+    def __init__(self, paths: Dict[str, str] = None):
+        paths = paths or {}
+        self._exact = {k: v for k, v in paths.items() if not is_pattern(k)}
+        self._rules = [
+            (_compile_rule(k), v) for k, v in paths.items() if is_pattern(k)
+        ]  # type: List[Tuple[Pattern, str]]
+        self._matcher = self._compile_matcher(self._rules)
+        self._date = datetime.now().strftime("%Y-%m-%d")
+        self._remapped = {}
+
+    @staticmethod
+    def _compile_matcher(rules: List[Tuple[Pattern, str]]):
+        if not rules:
+            return None
+        if any(_NUMBERED_GROUP_REFERENCE.search(rule.pattern) for rule, _ in rules):
+            # Combining the rules renumbers their groups, so they are tried one by one
+            return None
+        alternatives = "|".join(
+            f"(?P<_rule{i}>{rule.pattern})" for i, (rule, _) in enumerate(rules)
+        )
+        try:
+            return re.compile(alternatives)
+        except re.error:
+            # Rules with clashing group names can't be combined, and are tried one by one
+            return None
+
+    def _match_rule(self, directory: str):
+        if self._matcher is not None:
+            match = self._matcher.fullmatch(directory)
+            if match is None:
+                return None, None
+            rule, new_path = self._rules[int(match.lastgroup[len("_rule") :])]
+            return rule.fullmatch(directory), new_path
+        for rule, new_path in self._rules:
+            match = rule.fullmatch(directory)
+            if match is not None:
+                return match, new_path
+        return None, None
+
+    def remap(self, directory: str) -> str:
+        found_directory = self._remapped.get(directory)
+        if found_directory is not None:
+            return found_directory
+
+        if directory in self._exact:
+            new_directory = self._exact[directory]
+        else:
+            match, new_path = self._match_rule(directory)
+            if match is None:
+                new_directory = directory
+            else:
+                new_directory = match.expand(new_path)
+                if "{" in new_directory:
+                    new_directory = new_directory.format(
+                        directory=directory, date=self._date
+                    )
+        self._remapped[directory] = new_directory
+        return new_directory
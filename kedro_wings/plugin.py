@@ -0,0 +1,198 @@
+import csv
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+import click
+
+from .filesystems import LOCAL_PROTOCOLS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kedro.pipeline import Pipeline
+
+    from .kedro_wings import KedroWings
+
+PLAN_COLUMNS = ("name", "type", "filepath", "size", "mtime")
+
+
+def _type_name(dataset_type: Any) -> str:
+    if isinstance(dataset_type, str):
+        return dataset_type
+    return f"{dataset_type.__module__}.{dataset_type.__qualname__}"
+
+
+def _filepath(dataset_config: Dict[str, Any]) -> Optional[str]:
+    if "filepath" in dataset_config:
+        return str(dataset_config["filepath"])
+    if isinstance(dataset_config.get("dataset"), dict):
+        return _filepath(dataset_config["dataset"])
+    return None
+
+
+def _stat(
+    wings: "KedroWings", filepath: str, dataset_config: Dict[str, Any]
+) -> Dict[str, Any]:
+    from kedro.io.core import get_protocol_and_path
+
+    protocol, path = get_protocol_and_path(filepath)
+    try:
+        if protocol in LOCAL_PROTOCOLS:
+            stat = os.stat(path)
+            size, mtime = stat.st_size, stat.st_mtime
+        else:
+            fs = wings._filesystems.get(
+                protocol, dataset_config.get("credentials"), dataset_config.get("fs_args")
+            )
+            info = fs.info(path)
+            size, mtime = info.get("size"), info.get("mtime") or info.get("LastModified")
+    except (OSError, ValueError):
+        return {"size": None, "mtime": None}
+    if isinstance(mtime, (int, float)):
+        mtime = datetime.fromtimestamp(mtime).isoformat(timespec="seconds")
+    return {"size": size, "mtime": str(mtime) if mtime is not None else None}
+
+
+def plan_rows(
+    wings: "KedroWings",
+    pipeline: "Pipeline",
+    catalog_config: Dict[str, Any] = None,
+    stat: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Resolves the wings of a pipeline to their dataset types and filepaths, without instantiating any dataset.
+    Names defined in the catalog are left to the catalog, except as targets of chronocoded names.
+    """
+    catalog_config = catalog_config or {}
+    wings._track_outputs(pipeline.all_outputs())
+
+    rows = []
+    stats = {}  # type: Dict[str, Dict[str, Any]]
+    for name in sorted(pipeline.data_sets()):
+        if name in catalog_config:
+            continue
+        dataset_config = wings._resolve_config(name)
+        if dataset_config is None and name.endswith("!"):
+            dataset_config = catalog_config.get(name[:-1])
+        if dataset_config is None:
+            continue
+
+        filepath = _filepath(dataset_config)
+        row = {
+            "name": name,
+            "type": _type_name(dataset_config.get("type")),
+            "filepath": filepath,
+            "size": None,
+            "mtime": None,
+        }
+        if stat and filepath is not None:
+            if filepath not in stats:
+                stats[filepath] = _stat(wings, filepath, dataset_config)
+            row.update(stats[filepath])
+        rows.append(row)
+    return rows
+
+
+def _write_table(rows: Iterable[Dict[str, Any]], output):
+    rows = [
+        {k: "-" if row[k] is None else str(row[k]) for k in PLAN_COLUMNS} for row in rows
+    ]
+    widths = {
+        k: max([len(k)] + [len(row[k]) for row in rows]) for k in PLAN_COLUMNS
+    }
+    for row in [{k: k for k in PLAN_COLUMNS}] + rows:
+        output.write("  ".join(row[k].ljust(widths[k]) for k in PLAN_COLUMNS).rstrip() + "\n")
+
+
+def write_plan(rows: List[Dict[str, Any]], output, output_format: str = "table"):
+    if output_format == "json":
+        json.dump(rows, output, indent=2)
+        output.write("\n")
+        return
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=PLAN_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    _write_table(rows, output)
+    sizes = {row["filepath"]: row["size"] for row in rows if row["size"] is not None}
+    output.write(
+        f"\n{len(rows)} wings, {len(sizes)} existing files, {sum(sizes.values())} bytes\n"
+    )
+
+
+def _find_wings(context) -> "KedroWings":
+    from .kedro_wings import KedroWings
+
+    found_wings = [h for h in getattr(context, "hooks", ()) if isinstance(h, KedroWings)]
+    if not found_wings:
+        raise click.ClickException("KedroWings is not registered in the project's hooks.")
+    return found_wings[0]
+
+
+def load_context(project_path: Path, env: str = None):
+    from kedro.framework.context import load_context as kedro_load_context
+
+    return kedro_load_context(project_path, env=env)
+
+
+@click.group(name="KedroWings")
+def commands():
+    pass
+
+
+@commands.group()
+def wings():
+    """KedroWings commands"""
+
+
+@wings.command()
+@click.option("--pipeline", "pipeline_name", default=None, help="Name of the pipeline. Default: __default__")
+@click.option("--env", "-e", default=None, help="Kedro configuration environment.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "csv", "json"]),
+    default="table",
+    help="Output format.",
+)
+@click.option("--output", "-o", type=click.File("w"), default="-", help="Output file. Default: stdout")
+@click.option("--stat/--no-stat", default=True, help="Look up the size and mtime of each file.")
+def plan(pipeline_name, env, output_format, output, stat):
+    """
+    Lists the wings of a pipeline with their resolved type and filepath, without loading any data
+    """
+    context = load_context(Path.cwd(), env=env)
+    kedro_wings = _find_wings(context)
+    pipeline = context.pipelines.get(pipeline_name or "__default__")
+    if pipeline is None:
+        raise click.ClickException(f"Pipeline {pipeline_name} not found.")
+
+    catalog_config = context.config_loader.get("catalog*", "catalog*/**", "**/catalog*")
+    rows = plan_rows(kedro_wings, pipeline, catalog_config, stat=stat)
+    write_plan(rows, output, output_format)
+
+
+@wings.command()
+@click.argument("layer")
+@click.option("--width", type=int, default=None, help="Width of the new hash prefix directories, 0 for a flat layer. Default: the layer's shard width")
+@click.option("--from-width", type=int, default=0, help="Width of the current hash prefix directories, 0 for a flat layer.")
+@click.option("--env", "-e", default=None, help="Kedro configuration environment.")
+@click.option("--dry-run", is_flag=True, help="List the moves without moving any file.")
+def shard(layer, width, from_width, env, dry_run):
+    """
+    Moves the wing files of a layer into, out of, or between hash prefix directories
+    """
+    from .sharding import migrate_shards
+
+    context = load_context(Path.cwd(), env=env)
+    kedro_wings = _find_wings(context)
+    if width is None:
+        width = kedro_wings._shard.get(layer, 0)
+    directory = kedro_wings._resolve_directory(layer)
+    moves = migrate_shards(directory, width, from_width, dry_run=dry_run)
+    for source, destination in moves:
+        click.echo(f"{source} -> {destination}")
+    click.echo(f"{'Would move' if dry_run else 'Moved'} {len(moves)} files in {directory}")
@@ -0,0 +1,102 @@
+import os
+from typing import Any, Dict, Optional, Union
+
+SAMPLE_ENV_VAR = "KEDRO_WINGS_SAMPLE"
+SAMPLED_DATASET_TYPE = "kedro_wings.datasets.sample.SampledDataSet"
+SAMPLED_PARQUET_TYPE = "kedro_wings.datasets.arrow.SampledParquetDataSet"
+
+_CSV_TYPES = ("CSVDataSet", "SchemaCSVDataSet")
+_PARQUET_TYPES = ("ParquetDataSet",)
+_LAZY_TYPES = ("LazyPolarsDataSet",)
+
+
+def parse_sample(value: Optional[str]) -> Dict[str, Union[int, float]]:
+    """
+    Parses a sample specification such as `01_raw=10000,02_intermediate=0.1`
+    """
+    out = {}
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        layer, _, size = entry.partition("=")
+        try:
+            out[layer.strip()] = float(size) if "." in size else int(size)
+        except ValueError as e:
+            raise ValueError(f"Invalid sample entry: {entry}") from e
+    return out
+
+
+def sample_from_env() -> Dict[str, Union[int, float]]:
+    return parse_sample(os.getenv(SAMPLE_ENV_VAR))
+
+
+def verify_sample(sample: Dict[str, Union[int, float]]):
+    for layer, size in sample.items():
+        if isinstance(size, float) and not 0 < size <= 1:
+            raise ValueError(f"Sample fraction of {layer} must be within (0, 1], got {size}")
+        if isinstance(size, int) and size < 0:
+            raise ValueError(f"Sample rows of {layer} must be positive, got {size}")
+
+
+class RowSampler:
+    """
+    A `skiprows` callable for pandas.read_csv, keeping a seeded random fraction of the rows
+    """
+
+    def __init__(self, fraction: float, seed: int = 0):
+        self.fraction = fraction
+        self.seed = seed
+
+    def __call__(self, row: int) -> bool:
+        if row == 0:
+            return False
+        # Knuth's multiplicative hash, so that a row is kept the same way on every load
+        hashed = ((row + self.seed) * 2654435761) % 2 ** 32
+        return hashed / 2 ** 32 >= self.fraction
+
+    def __repr__(self):
+        return f"RowSampler(fraction={self.fraction}, seed={self.seed})"
+
+
+def dataset_type_name(dataset_type: Any) -> str:
+    if isinstance(dataset_type, str):
+        return dataset_type.rsplit(".", 1)[-1]
+    return dataset_type.__name__
+
+
+def sample_config(
+    dataset_config: Dict[str, Any], size: Union[int, float], seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Rewrites a dataset config to load a sample of its rows.
+    The sample is pushed into the reader for CSV and parquet datasets,
+    other datasets are loaded fully and then truncated.
+    """
+    type_name = dataset_type_name(dataset_config["type"])
+    is_fraction = isinstance(size, float)
+
+    if type_name in _CSV_TYPES:
+        load_args = dict(dataset_config.get("load_args") or {})
+        if is_fraction:
+            load_args["skiprows"] = RowSampler(size, seed)
+        else:
+            load_args["nrows"] = size
+        return {**dataset_config, "load_args": load_args}
+
+    if type_name in _LAZY_TYPES and not is_fraction:
+        load_args = dict(dataset_config.get("load_args") or {})
+        load_args["n_rows"] = size
+        return {**dataset_config, "load_args": load_args}
+
+    sample_args = {"fraction": size} if is_fraction else {"rows": size}
+    if type_name in _PARQUET_TYPES:
+        return {
+            "type": SAMPLED_PARQUET_TYPE,
+            "filepath": dataset_config["filepath"],
+            "load_args": dataset_config.get("load_args"),
+            "credentials": dataset_config.get("credentials"),
+            "fs_args": dataset_config.get("fs_args"),
+            "seed": seed,
+            **sample_args,
+        }
+    return {"type": SAMPLED_DATASET_TYPE, "dataset": dataset_config, "seed": seed, **sample_args}
@@ -0,0 +1,125 @@
+import hashlib
+import logging
+import os
+import re
+from typing import Dict, List, Set, Tuple
+
+from .history import HISTORY_DIR
+
+logger = logging.getLogger("KedroWings")
+
+MAX_SHARD_WIDTH = 8
+
+# Files saved next to a wing, which are kept in the shard of their wing:
+# SchemaCSVDataSet schemas, ImageDirectoryDataSet caches and SQLite journals
+SIDECAR_SUFFIXES = (".schema.json", ".cache.npy", ".cache.json", "-wal", "-shm", "-journal")
+
+
+def verify_shard(shard: Dict[str, int]):
+    for layer, width in shard.items():
+        if type(width) is not int or not 0 < width <= MAX_SHARD_WIDTH:
+            raise ValueError(
+                f"Shard width of {layer} must be an integer within [1, {MAX_SHARD_WIDTH}], got {width}"
+            )
+
+
+def shard_prefix(basename: str, width: int) -> str:
+    """
+    The shard directory of a wing file, the first hex characters of the hash of its basename
+    """
+    for suffix in SIDECAR_SUFFIXES:
+        if basename.endswith(suffix):
+            basename = basename[: -len(suffix)]
+            break
+    return hashlib.sha1(basename.encode()).hexdigest()[:width]
+
+
+def _is_shard(name: str, width: int) -> bool:
+    return len(name) == width and re.fullmatch("[0-9a-f]+", name) is not None
+
+
+def _is_wing_directory(name: str) -> bool:
+    """
+    Whether a directory is a wing itself, such as `cats.images` or `sales.parquet`.
+    Directories without an extension are nested wing directories, such as the `sub` of `02_intermediate/sub/x.txt`.
+    """
+    return os.path.splitext(name)[1] != ""
+
+
+def _layout_entries(fs, directory: str, widths: Set[int]) -> List[Tuple[str, str, str]]:
+    """
+    The (wing directory, parent, name) of every wing file under a directory,
+    where hash prefix directories of the given shard widths are shards.
+    Nested wing directories are sharded on their own, the same way wings are resolved at runtime.
+    """
+    entries = []
+
+    def _add_parent(parent: str):
+        for path in fs.ls(parent, detail=False):
+            name = os.path.basename(path.rstrip("/"))
+            if name == HISTORY_DIR:
+                entries.extend(
+                    (directory, f"{parent}/{HISTORY_DIR}", os.path.basename(p.rstrip("/")))
+                    for p in fs.ls(path, detail=False)
+                )
+            elif name.startswith("."):
+                continue
+            elif not fs.isdir(path) or _is_wing_directory(name):
+                entries.append((directory, parent, name))
+            elif parent == directory and any(_is_shard(name, w) for w in widths):
+                _add_parent(f"{parent}/{name}")
+            else:
+                entries.extend(_layout_entries(fs, f"{parent}/{name}", widths))
+
+    _add_parent(directory)
+    return entries
+
+
+def migrate_shards(
+    directory: str, width: int, from_width: int = 0, dry_run: bool = False
+) -> List[Tuple[str, str]]:
+    """
+    Moves the files of a layer directory from one shard layout to another.
+    A width of 0 is the flat layout, so `migrate_shards("data/02_intermediate", 2)` shards a flat layer.
+    Chronocode histories and sidecar files are moved along with their wing,
+    and the files of nested directories are moved under hash prefix directories of their own directory.
+
+    :return: The (source, destination) of every file moved
+    """
+    from fsspec.core import url_to_fs
+
+    fs, directory = url_to_fs(directory)
+    directory = directory.rstrip("/")
+    if not fs.exists(directory):
+        return []
+
+    moves = []
+    old_shards = set()
+    # Shards already in the new layout are included, so migrating twice moves nothing
+    shard_widths = {w for w in (from_width, width) if w}
+    for wing_directory, parent, name in _layout_entries(fs, directory, shard_widths):
+        history = parent.endswith(f"/{HISTORY_DIR}")
+        target = wing_directory
+        if width:
+            target = f"{wing_directory}/{shard_prefix(name, width)}"
+        if history:
+            target = f"{target}/{HISTORY_DIR}"
+        if target != parent:
+            moves.append((f"{parent}/{name}", f"{target}/{name}"))
+            old_parent = parent[: -len(HISTORY_DIR) - 1] if history else parent
+            if old_parent != wing_directory:
+                old_shards.add(old_parent)
+
+    for source, destination in moves:
+        logger.info(f"Moving {source} to {destination}")
+        if dry_run:
+            continue
+        fs.makedirs(os.path.dirname(destination), exist_ok=True)
+        fs.mv(source, destination, recursive=True)
+
+    if not dry_run:
+        # Removes the shards of the old layout that were emptied
+        for old_shard in sorted(old_shards):
+            if fs.exists(old_shard) and not fs.find(old_shard):
+                fs.rm(old_shard, recursive=True)
+    return moves
@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("KedroWings")
+
+SNIFF_EXTENSIONS = (".dat", ".bin", ".img")
+SNIFF_CACHE_NAME = ".kedro_wings_sniff.json"
+HEADER_SIZE = 4096
+
+_MAGIC_BYTES = (
+    (b"PAR1", "parquet"),
+    (b"ARROW1", "arrow"),
+    (b"\x1f\x8b", "gzip"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"KWPKL5", "pickle"),
+)
+
+_BINARY_READ = {"fs_args": {"open_args_load": {"mode": "rb"}}}
+
+SNIFFED_TYPES = {
+    "parquet": {"type": "pandas.ParquetDataSet"},
+    "arrow": {"type": "pandas.FeatherDataSet"},
+    "png": {"type": "pillow.ImageDataSet"},
+    "jpeg": {"type": "pillow.ImageDataSet"},
+    "pickle": {"type": "kedro_wings.datasets.pickle.PickleDataSet"},
+    "json": {"type": "kedro_wings.datasets.json.FastJSONDataSet"},
+    "jsonl": {"type": "kedro_wings.datasets.json.JSONLinesDataSet"},
+    "gzip": {"type": "pandas.CSVDataSet", "load_args": {"compression": "gzip"}, **_BINARY_READ},
+    "gzip+pickle": {"type": "kedro_wings.datasets.pickle.PickleDataSet", "compression": "gzip"},
+    "zstd": {"type": "pandas.CSVDataSet", "load_args": {"compression": "zstd"}, **_BINARY_READ},
+}  # type: Dict[str, Dict[str, Any]]
+
+
+def _sniff_json(header: bytes) -> Optional[str]:
+    text = header.lstrip()
+    if not text.startswith((b"{", b"[")):
+        return None
+    first_line, _, rest = text.partition(b"\n")
+    if text.startswith(b"{") and rest.lstrip().startswith(b"{"):
+        try:
+            json.loads(first_line)
+            return "jsonl"
+        except ValueError:
+            pass
+    return "json"
+
+
+def sniff_format(header: bytes) -> Optional[str]:
+    """
+    Identifies a file format from the first bytes of a file
+    """
+    for magic, file_format in _MAGIC_BYTES:
+        if header.startswith(magic):
+            break
+    else:
+        # Pickle protocols 2 to 5 start with the PROTO opcode
+        if len(header) > 1 and header[0] == 0x80 and 2 <= header[1] <= 5:
+            return "pickle"
+        return _sniff_json(header)
+
+    if file_format == "gzip":
+        try:
+            inner = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(header)
+        except zlib.error:
+            return file_format
+        if sniff_format(inner) == "pickle":
+            return "gzip+pickle"
+    return file_format
+
+
+class FormatSniffer:
+    """
+    Picks a dataset config for existing files by sniffing their first bytes.
+    Results are cached by path, modification time and size, in `cache_file` if given.
+    """
+
+    def __init__(self, cache_file: str = None):
+        self._cache_file = cache_file
+        self._cache = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._cache is None:
+            self._cache = {}
+            if self._cache_file and os.path.exists(self._cache_file):
+                try:
+                    with open(self._cache_file, "r") as cache_file:
+                        self._cache = json.load(cache_file)
+                except ValueError:
+                    logger.warning(f"Ignoring corrupt sniff cache {self._cache_file}")
+        return self._cache
+
+    def sniff(self, fs, filepath: str) -> Optional[str]:
+        """
+        The format of an existing file, or None if it does not exist or is not recognized
+        """
+        try:
+            info = fs.info(filepath)
+        except (OSError, ValueError):
+            return None
+        mtime = info.get("mtime") or info.get("LastModified") or info.get("ETag")
+        signature = [str(mtime), info.get("size")]
+
+        with self._lock:
+            cached = self._load_cache().get(filepath)
+        if cached is not None and cached["signature"] == signature:
+            return cached["format"]
+
+        with fs.open(filepath, mode="rb") as fs_file:
+            file_format = sniff_format(fs_file.read(HEADER_SIZE))
+        with self._lock:
+            self._cache[filepath] = {"signature": signature, "format": file_format}
+            self._changed = True
+        return file_format
+
+    def sniff_config(self, fs, filepath: str) -> Optional[Dict[str, Any]]:
+        file_format = self.sniff(fs, filepath)
+        if file_format is None:
+            return None
+        logger.debug(f"Sniffed {filepath} as {file_format}")
+        return dict(SNIFFED_TYPES[file_format])
+
+    def save(self):
+        """
+        Writes newly sniffed formats to the cache file
+        """
+        if not self._cache_file or not self._changed:
+            return
+        with self._lock:
+            directory = os.path.dirname(self._cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_file = f"{self._cache_file}.tmp"
+            with open(temp_file, "w") as cache_file:
+                json.dump(self._cache, cache_file)
+            os.replace(temp_file, self._cache_file)
+            self._changed = False
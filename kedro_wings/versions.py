@@ -0,0 +1,30 @@
+from typing import Any, Dict, Optional, Tuple
+
+VERSION_SEPARATOR = "~"
+VERSIONED_DATASET_TYPE = "kedro_wings.datasets.versioned.IndexedVersionedDataSet"
+
+
+def split_version(dataset_catalog_name: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits a name such as `06_models/model.pkl~` or `06_models/model.pkl~2020-01-01T00.00.00.000Z`
+    into its wing name and load version.
+    The version is None for names without the marker, and empty for the latest version.
+    """
+    wing_name, separator, version = dataset_catalog_name.rpartition(VERSION_SEPARATOR)
+    if not separator or not wing_name or "/" in version:
+        return dataset_catalog_name, None
+    return wing_name, version
+
+
+def versioned_config(
+    dataset_config: Dict[str, Any], load_version: str = None, keep: int = None
+) -> Dict[str, Any]:
+    """
+    Rewrites a dataset config to save a new version on every save, and to load the latest or a pinned version
+    """
+    return {
+        "type": VERSIONED_DATASET_TYPE,
+        "dataset": dataset_config,
+        "load_version": load_version or None,
+        "keep": keep,
+    }
@@ -1,6 +1,8 @@
 import os
 from typing import NamedTuple, Iterable
 
+MEMBER_SEPARATORS = ("/", "#")
+
 
 class WingInfo(NamedTuple):
     directory: str = ""
@@ -8,14 +10,34 @@ class WingInfo(NamedTuple):
     extension: str = ""
     basename: str = ""
     namespace: str = ""
+    member: str = ""
 
 
 def parse_wing_info(
     dataset_catalog_name: str,
     valid_extensions: Iterable[str],
     namespaces: Iterable[str] = None,
+    container_extensions: Iterable[str] = None,
 ) -> WingInfo:
 
+    for container_extension in sorted(container_extensions or [], key=len, reverse=True):
+        # A member of a container file, such as a table of a database: store.sqlite/customers,
+        # or a sheet of a workbook: budget.xlsx#Q3
+        for member_separator in MEMBER_SEPARATORS:
+            container_name, separator, member = dataset_catalog_name.rpartition(
+                f"{container_extension}{member_separator}"
+            )
+            if separator and member and "/" not in member:
+                break
+        else:
+            continue
+        if parse_wing_info(dataset_catalog_name, valid_extensions, namespaces) != WingInfo():
+            break
+        wing = parse_wing_info(
+            f"{container_name}{container_extension}", [container_extension], namespaces
+        )
+        return wing._replace(member=member)
+
     for valid_extension in sorted(
         sorted(valid_extensions, key=lambda x: len(x), reverse=True),
         key=lambda x: len(x.split(".")),
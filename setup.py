@@ -19,6 +19,16 @@ setup(
     install_requires=[
         'kedro>=0.16.0',
     ],
+    extras_require={
+        'arrow': ['pyarrow>=10.0.0'],
+        'json': ['orjson'],
+        'memory': ['psutil'],
+        'pickle': ['cloudpickle', 'joblib'],
+        'polars': ['polars'],
+    },
+    entry_points={
+        'kedro.project_commands': ['kedro_wings = kedro_wings.plugin:commands'],
+    },
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3.8",
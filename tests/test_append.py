@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.append import append_config
+from kedro_wings.kedro_wings import InvalidAppendWing
+
+
+def _catalog(root, *names, data_sets=None):
+    pipeline = Pipeline([node(lambda *x: None, inputs="in", outputs=list(names))])
+    catalog = DataCatalog(data_sets=data_sets)
+    KedroWings(root=str(root), precreate_dirs=True).before_pipeline_run({}, pipeline, catalog)
+    return catalog
+
+
+def test_append_config():
+    config = append_config({"type": "pandas.CSVDataSet", "filepath": "a.csv"})
+    assert config["type"] == "kedro_wings.datasets.pandas.AppendCSVDataSet"
+    config = append_config({"type": "kedro_wings.datasets.json.JSONLinesDataSet", "filepath": "a.jsonl"})
+    assert config["append"] is True
+    with pytest.raises(ValueError):
+        append_config({"type": "text.TextDataSet", "filepath": "a.txt"})
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_append_dataframes(tmp_path, extension):
+    name = f"03_primary/events{extension}"
+    catalog = _catalog(tmp_path, f"{name}+", name)
+
+    catalog.save(f"{name}+", pd.DataFrame({"a": [1, 2]}))
+    catalog.save(f"{name}+", pd.DataFrame({"a": [3]}))
+    assert sorted(catalog.load(name)["a"].tolist()) == [1, 2, 3]
+
+
+def test_append_json_lines(tmp_path):
+    catalog = _catalog(tmp_path, "03_primary/events.jsonl+", "03_primary/events.jsonl")
+    catalog.save("03_primary/events.jsonl+", [{"a": 1}])
+    catalog.save("03_primary/events.jsonl+", pd.DataFrame({"a": [2]}))
+    assert list(catalog.load("03_primary/events.jsonl")) == [{"a": 1}, {"a": 2}]
+
+
+def test_invalid_append(tmp_path):
+    with pytest.raises(InvalidAppendWing):
+        _catalog(tmp_path, "03_primary/events.txt+")
+    with pytest.raises(InvalidAppendWing):
+        _catalog(tmp_path, "events+")
+
+
+def test_catalog_names_ending_in_plus(tmp_path):
+    events = MemoryDataSet()
+    catalog = _catalog(tmp_path, "events+", data_sets={"events+": events})
+    assert catalog._data_sets["events+"] is events
+
+
+def test_appended_wing_shares_its_file_silently(tmp_path, caplog):
+    _catalog(tmp_path, "03_primary/e.csv+", "03_primary/e.csv")
+    assert "both resolve to" not in caplog.text
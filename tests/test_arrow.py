@@ -0,0 +1,120 @@
+import fsspec
+import pandas as pd
+import pytest
+from kedro.io.core import DataSetError
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets import arrow
+from kedro_wings.datasets.arrow import ArrowCSVDataSet
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+
+def test_round_trip(tmp_path, data):
+    dataset = ArrowCSVDataSet(str(tmp_path / "data.csv"), threads=2, block_size=1 << 20)
+    dataset.save(data)
+    pd.testing.assert_frame_equal(dataset.load(), data)
+    pd.testing.assert_frame_equal(pd.read_csv(str(tmp_path / "data.csv")), data)
+
+
+def test_arrow_table(tmp_path, data):
+    import pyarrow as pa
+
+    dataset = ArrowCSVDataSet(str(tmp_path / "data.csv"), to_pandas=False)
+    dataset.save(data)
+    table = dataset.load()
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["a", "b"]
+
+
+def test_pandas_fallback(tmp_path, data, monkeypatch):
+    monkeypatch.setattr(arrow, "pa", None)
+    dataset = ArrowCSVDataSet(str(tmp_path / "data.csv"))
+    dataset.save(data)
+    pd.testing.assert_frame_equal(dataset.load(), data)
+
+
+def test_threads_do_not_leak_into_the_process(tmp_path, data):
+    import pyarrow as pa
+
+    cpu_count = pa.cpu_count()
+    dataset = ArrowCSVDataSet(str(tmp_path / "data.csv"), threads=cpu_count + 1)
+    dataset.save(data)
+    pd.testing.assert_frame_equal(dataset.load(), data)
+    assert pa.cpu_count() == cpu_count
+
+
+def test_pandas_fallback_options(tmp_path, monkeypatch):
+    monkeypatch.setattr(arrow, "pa", None)
+    (tmp_path / "data.csv").write_text("skipped\n1;x\n2;NA\n")
+    dataset = ArrowCSVDataSet(
+        str(tmp_path / "data.csv"),
+        load_args={
+            "read_options": {"skip_rows": 1, "column_names": ["a", "b"]},
+            "parse_options": {"delimiter": ";"},
+            "convert_options": {"include_columns": ["b"], "null_values": ["NA"]},
+        },
+    )
+    loaded = dataset.load()
+    assert loaded.columns.tolist() == ["b"]
+    assert loaded["b"].tolist()[0] == "x" and pd.isna(loaded["b"].tolist()[1])
+
+    with pytest.raises(DataSetError, match="timestamp_parsers"):
+        ArrowCSVDataSet(
+            str(tmp_path / "data.csv"),
+            load_args={"convert_options": {"timestamp_parsers": ["%Y"]}},
+        ).load()
+    with pytest.raises(DataSetError, match="to_pandas"):
+        ArrowCSVDataSet(str(tmp_path / "data.csv"), to_pandas=False)
+
+
+def test_csv_wing_type():
+    wings = KedroWings(
+        dataset_configs={".csv": {"type": "kedro_wings.datasets.arrow.ArrowCSVDataSet"}}
+    )
+    entry = wings._create_wing_entries(["01_raw/data.csv"])["01_raw/data.csv"]
+    assert isinstance(entry, ArrowCSVDataSet)
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".feather"])
+def test_table_round_trip(tmp_path, data, extension):
+    import pyarrow as pa
+
+    dataset = arrow.ArrowTableDataSet(str(tmp_path / f"data{extension}"))
+    dataset.save(data)
+    loaded = dataset.load()
+    assert isinstance(loaded, pa.Table)
+    assert loaded.to_pandas().equals(data)
+
+    filtered = arrow.ArrowTableDataSet(
+        str(tmp_path / f"data{extension}"), load_args={"columns": ["b"], "filters": [("a", ">", 1)]}
+    ).load()
+    assert filtered.column_names == ["b"]
+    assert filtered["b"].to_pylist() == ["y", "z"]
+
+    # Tables are written a record batch at a time
+    copy = arrow.ArrowTableDataSet(str(tmp_path / f"copy{extension}"))
+    copy.save(loaded.to_reader(max_chunksize=1))
+    assert copy.load().num_rows == 3
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".feather"])
+def test_cached_backend_wings(tmp_path, data, extension):
+    # The arrow backend hands the cached filesystem to pyarrow's dataset scans
+    memory_fs = fsspec.filesystem("memory")
+    wings = KedroWings(
+        root="memory:///wings", cache={"directory": str(tmp_path)}, backend="arrow"
+    )
+    name = f"02_intermediate/data{extension}"
+    entries = wings._create_entries([name, f"{name}!"], {})
+    try:
+        entries[f"{name}!"].save(data)
+        loaded = entries[name].load()
+        assert isinstance(entries[name], arrow.ArrowTableDataSet)
+        assert loaded.to_pandas().equals(data)
+    finally:
+        memory_fs.store.clear()
+        memory_fs.pseudo_dirs[:] = [""]
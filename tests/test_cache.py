@@ -0,0 +1,157 @@
+import os
+import threading
+
+import fsspec
+import pandas as pd
+import pytest
+
+from kedro_wings import KedroWings
+from kedro_wings.cache import CachedFileSystem, LocalCache
+from kedro_wings.kedro_wings import InvalidCacheConfig
+
+
+@pytest.fixture
+def memory_fs():
+    memory_fs = fsspec.filesystem("memory")
+    yield memory_fs
+    memory_fs.store.clear()
+    memory_fs.pseudo_dirs[:] = [""]
+
+
+def _write(fs, path, data):
+    with fs.open(path, "wb") as f:
+        f.write(data)
+
+
+def test_read_through(tmp_path, memory_fs):
+    cache = LocalCache(str(tmp_path))
+    cached_fs = CachedFileSystem(memory_fs, cache)
+    _write(memory_fs, "/raw/data.txt", b"1")
+
+    for _ in range(3):
+        with cached_fs.open("memory:///raw/data.txt", "r") as f:
+            assert f.read() == "1"
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    _write(memory_fs, "/raw/data.txt", b"22")
+    with cached_fs.open("/raw/data.txt", "rb") as f:
+        assert f.read() == b"22"
+    assert cache.misses == 2
+
+
+def test_eviction(tmp_path, memory_fs):
+    cache = LocalCache(str(tmp_path), max_bytes=10)
+    for name in ["a", "b", "c"]:
+        _write(memory_fs, f"/raw/{name}.txt", b"12345")
+        cache.fetch(memory_fs, f"/raw/{name}.txt")
+
+    cached_paths = {path.split("://")[-1] for path in cache._index}
+    assert cached_paths == {"/raw/b.txt", "/raw/c.txt"}
+
+
+def test_parallel_fetches_of_different_files(tmp_path, memory_fs):
+    cache = LocalCache(str(tmp_path))
+    for name in ["a", "b"]:
+        _write(memory_fs, f"/raw/{name}.txt", name.encode())
+
+    # Each download waits for the other one, so serialized downloads break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowFileSystem:
+        def __getattr__(self, item):
+            return getattr(memory_fs, item)
+
+        def get(self, path, local_path):
+            barrier.wait()
+            memory_fs.get(path, local_path)
+
+    slow_fs = SlowFileSystem()
+    fetched = {}
+
+    def fetch(name):
+        fetched[name] = cache.fetch(slow_fs, f"/raw/{name}.txt")
+
+    threads = [threading.Thread(target=fetch, args=(n,)) for n in ["a", "b"]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+    assert sorted(fetched) == ["a", "b"]
+
+
+def test_index_writes_are_batched(tmp_path, memory_fs):
+    cache = LocalCache(str(tmp_path))
+    for name in ["a", "b", "c"]:
+        _write(memory_fs, f"/raw/{name}.txt", b"1")
+        cache.fetch(memory_fs, f"/raw/{name}.txt")
+    index_path = os.path.join(str(tmp_path), "index.json")
+    assert not os.path.exists(index_path)
+
+    cache.save_index()
+    assert len(LocalCache(str(tmp_path))._index) == 3
+
+
+def test_write_back(tmp_path, memory_fs):
+    cache = LocalCache(str(tmp_path), write="back")
+    cached_fs = CachedFileSystem(memory_fs, cache)
+
+    with cached_fs.open("/out/data.txt", "w") as f:
+        f.write("1")
+    assert not memory_fs.exists("/out/data.txt")
+    assert cached_fs.exists("/out/data.txt")
+    with cached_fs.open("/out/data.txt", "r") as f:
+        assert f.read() == "1"
+
+    cache.flush()
+    assert memory_fs.cat("/out/data.txt") == b"1"
+
+
+def test_write_back_directory_operations(tmp_path, memory_fs):
+    cache = LocalCache(str(tmp_path), write="back")
+    cached_fs = CachedFileSystem(memory_fs, cache)
+    with cached_fs.open("/tmp/out/data.txt", "w") as f:
+        f.write("1")
+
+    # Held back files are uploaded before the directory above them is moved
+    cached_fs.mv("/tmp/out", "/out", recursive=True)
+    assert memory_fs.cat("/out/data.txt") == b"1"
+    assert not cache._index
+    assert os.listdir(str(tmp_path)) == ["index.json"]
+
+
+def test_failed_write_is_discarded(tmp_path, memory_fs):
+    cached_fs = CachedFileSystem(memory_fs, LocalCache(str(tmp_path)))
+    with pytest.raises(RuntimeError):
+        with cached_fs.open("/out/data.txt", "w") as f:
+            f.write("1")
+            raise RuntimeError()
+    assert not memory_fs.exists("/out/data.txt")
+
+
+def test_wings_cache(tmp_path, memory_fs):
+    wings = KedroWings(root="memory:///wings", cache={"directory": str(tmp_path)})
+    entries = wings._create_entries(["01_raw/state.txt", "01_raw/state.txt!"], {})
+
+    entries["01_raw/state.txt!"].save("1")
+    assert memory_fs.cat("/wings/01_raw/state.txt") == b"1"
+    assert entries["01_raw/state.txt"].load() == "1"
+
+    with pytest.raises(InvalidCacheConfig):
+        KedroWings(cache={"directory": str(tmp_path), "write": "sometimes"})
+
+
+@pytest.mark.parametrize("write", ["through", "back"])
+@pytest.mark.parametrize("extension", [".parquet", ".feather"])
+def test_wings_cache_arrow_formats(tmp_path, memory_fs, write, extension):
+    # pyarrow only writes to fsspec filesystems
+    wings = KedroWings(root="memory:///wings", cache={"directory": str(tmp_path), "write": write})
+    name = f"03_primary/sales{extension}"
+    entries = wings._create_entries([name, f"{name}!"], {})
+    sales = pd.DataFrame({"region": ["eu", "us"], "amount": [1.0, 2.0]})
+
+    entries[f"{name}!"].save(sales)
+    pd.testing.assert_frame_equal(entries[name].load(), sales)
+    wings._filesystems.flush()
+    assert memory_fs.exists(f"/wings/{name}")
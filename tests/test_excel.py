@@ -0,0 +1,96 @@
+import threading
+
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog
+from kedro.io.core import DataSetError
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets import excel
+from kedro_wings.datasets.excel import ExcelWorkbookDataSet
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    filepath = str(tmp_path / "budget.xlsx")
+    ExcelWorkbookDataSet(filepath, sheet_name=None).save(
+        {
+            "Q3": pd.DataFrame({"item": ["a", "b"], "cost": [1.5, 2.5]}),
+            "Q4": pd.DataFrame({"item": ["c"], "cost": [3.5]}),
+        }
+    )
+    return filepath
+
+
+@pytest.mark.parametrize("engine", [None, "openpyxl"])
+def test_load_sheets(workbook, engine):
+    q3 = ExcelWorkbookDataSet(workbook, sheet_name="Q3", engine=engine).load()
+    assert q3["cost"].tolist() == [1.5, 2.5]
+    assert ExcelWorkbookDataSet(workbook, sheet_name=1, engine=engine).load()["item"].tolist() == ["c"]
+    assert sorted(ExcelWorkbookDataSet(workbook, sheet_name=None, engine=engine).load()) == ["Q3", "Q4"]
+
+
+def test_shared_workbook(workbook, monkeypatch):
+    parsed = []
+    excel_file = pd.ExcelFile
+    monkeypatch.setattr(excel.pd, "ExcelFile", lambda *a, **k: parsed.append(a) or excel_file(*a, **k))
+    ExcelWorkbookDataSet(workbook, sheet_name="Q3").load()
+    ExcelWorkbookDataSet(workbook, sheet_name="Q4").load()
+    assert len(parsed) == 1
+
+    # Saving a sheet keeps the others, and the workbook is parsed again
+    ExcelWorkbookDataSet(workbook, sheet_name="Q4").save(pd.DataFrame({"item": ["d"], "cost": [4.5]}))
+    assert ExcelWorkbookDataSet(workbook, sheet_name="Q4").load()["item"].tolist() == ["d"]
+    assert ExcelWorkbookDataSet(workbook, sheet_name="Q3").load()["item"].tolist() == ["a", "b"]
+    assert len(parsed) == 2
+
+
+def test_sheet_wings(tmp_path, workbook):
+    pipeline = Pipeline(
+        [node(lambda a, b: pd.concat([a, b]), ["budget.xlsx#Q3", "budget.xlsx#Q4"], "totals.xlsx#All")]
+    )
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path)).before_pipeline_run({}, pipeline, catalog)
+
+    assert catalog._data_sets["budget.xlsx#Q3"]._sheet_name == "Q3"
+    catalog.save("totals.xlsx#All", pd.concat([catalog.load("budget.xlsx#Q3"), catalog.load("budget.xlsx#Q4")]))
+    totals = ExcelWorkbookDataSet(str(tmp_path / "totals.xlsx"), sheet_name="All").load()
+    assert totals["item"].tolist() == ["a", "b", "c"]
+
+
+def test_save_sheet_index(workbook, tmp_path):
+    ExcelWorkbookDataSet(workbook, sheet_name=1).save(pd.DataFrame({"item": ["d"], "cost": [4.5]}))
+    sheets = ExcelWorkbookDataSet(workbook, sheet_name=None).load()
+    assert sorted(sheets) == ["Q3", "Q4"]
+    assert sheets["Q4"]["item"].tolist() == ["d"]
+
+    with pytest.raises(DataSetError, match="out of range"):
+        ExcelWorkbookDataSet(workbook, sheet_name=2).save(pd.DataFrame({"a": [1]}))
+
+    new_workbook = str(tmp_path / "new.xlsx")
+    ExcelWorkbookDataSet(new_workbook).save(pd.DataFrame({"a": [1]}))
+    assert ExcelWorkbookDataSet(new_workbook).load()["a"].tolist() == [1]
+
+
+def test_workbooks_load_in_parallel(workbook, tmp_path, monkeypatch):
+    other = str(tmp_path / "other.xlsx")
+    ExcelWorkbookDataSet(other, sheet_name="Q1").save(pd.DataFrame({"a": [1]}))
+
+    # Each workbook waits for the other one to be opened, so serialized loads break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    excel_file = pd.ExcelFile
+
+    def _excel_file(*args, **kwargs):
+        barrier.wait()
+        return excel_file(*args, **kwargs)
+
+    monkeypatch.setattr(excel.pd, "ExcelFile", _excel_file)
+    threads = [
+        threading.Thread(target=ExcelWorkbookDataSet(path).load) for path in [workbook, other]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not barrier.broken
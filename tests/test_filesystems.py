@@ -0,0 +1,40 @@
+from kedro_wings import KedroWings
+from kedro_wings.filesystems import FileSystemPool, _merge, _pool_size_args
+
+
+def test_pool_shares_filesystems_per_credentials():
+    pool = FileSystemPool()
+    memory_fs = pool.get("memory")
+    assert pool.get("memory", {}, {"open_args_load": {"mode": "rb"}}) is memory_fs
+    assert pool.get("memory", {"token": "other"}) is not memory_fs
+
+
+def test_pool_size_args():
+    pool_args = _pool_size_args("s3", 64)
+    assert pool_args == {"config_kwargs": {"max_pool_connections": 64}}
+    assert _pool_size_args("memory", 64) == {}
+
+    fs_args = {"config_kwargs": {"retries": 3}}
+    assert _merge(pool_args, fs_args) == {
+        "config_kwargs": {"max_pool_connections": 64, "retries": 3}
+    }
+
+
+def test_wings_share_remote_filesystem():
+    wings = KedroWings(root="memory:///wings")
+    entries = wings._create_entries(
+        ["01_raw/state.txt", "02_intermediate/state.txt", "02_intermediate/state.txt!"],
+        {},
+    )
+    shared_fs = wings._filesystems.get("memory")
+    assert all(dataset._fs is shared_fs for dataset in entries.values())
+
+    entries["02_intermediate/state.txt!"].save("1")
+    assert entries["02_intermediate/state.txt"].load() == "1"
+
+
+def test_local_wings_are_not_pooled():
+    wings = KedroWings()
+    entries = wings._create_entries(["01_raw/state.txt"], {})
+    assert not wings._filesystems._filesystems
+    assert entries["01_raw/state.txt"]._protocol == "file"
@@ -0,0 +1,104 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from kedro_wings import KedroWings
+from kedro_wings.history import (
+    DEFAULT_HISTORY,
+    ChronocodeHistoryDataSet,
+    compact,
+    history_dir,
+    list_generations,
+    snapshot,
+)
+from kedro_wings.kedro_wings import InvalidChronocodeHistory
+
+
+def test_snapshot_keeps_previous_state(tmp_path):
+    filepath = str(tmp_path / "state.txt")
+    assert snapshot(filepath) == (None, False)
+
+    with open(filepath, "w") as f:
+        f.write("1")
+    generation, _ = snapshot(filepath)
+    assert os.path.dirname(generation) == history_dir(filepath)
+    assert generation.endswith(".txt")
+    with open(generation) as f:
+        assert f.read() == "1"
+
+
+def test_compact_generations(tmp_path):
+    filepath = str(tmp_path / "state.txt")
+    with open(filepath, "w") as f:
+        f.write("1")
+    for _ in range(4):
+        snapshot(filepath)
+
+    generations = list_generations(filepath)
+    assert len(generations) == 4
+
+    removed = compact(filepath, generations=2)
+    assert removed == generations[2:]
+    assert list_generations(filepath) == generations[:2]
+
+    compact(filepath, days=0)
+    assert list_generations(filepath) == []
+
+
+def test_chronocode_history_entries(tmp_path):
+    (tmp_path / "01_raw").mkdir()
+    wings = KedroWings(root=str(tmp_path), chronocode_history={"generations": 2})
+
+    entries = wings._create_entries(["01_raw/state.txt", "01_raw/state.txt!"], {})
+    chrono_dataset = entries["01_raw/state.txt!"]
+    assert isinstance(chrono_dataset, ChronocodeHistoryDataSet)
+
+    for i in range(4):
+        chrono_dataset.save(str(i))
+    assert entries["01_raw/state.txt"].load() == "3"
+
+    generations = chrono_dataset.list_generations()
+    assert len(generations) == 2
+    with open(generations[0]) as f:
+        assert f.read() == "2"
+
+    chrono_dataset.restore()
+    assert entries["01_raw/state.txt"].load() == "2"
+
+
+def test_invalid_chronocode_history():
+    with pytest.raises(InvalidChronocodeHistory):
+        KedroWings(chronocode_history={"generation": 2})
+
+
+@pytest.mark.parametrize(
+    "chronocode_history",
+    [{"generations": 0}, {"generations": 1.5}, {"days": -1}, {"days": "7"}, ["generations"]],
+)
+def test_invalid_chronocode_history_values(chronocode_history):
+    with pytest.raises(InvalidChronocodeHistory):
+        KedroWings(chronocode_history=chronocode_history)
+
+
+def test_default_chronocode_history():
+    assert KedroWings(chronocode_history=True)._chronocode_history == DEFAULT_HISTORY
+    assert KedroWings(chronocode_history=False)._chronocode_history is None
+
+
+def test_generations_sort_past_ten_in_the_same_stamp(tmp_path, monkeypatch):
+    filepath = str(tmp_path / "state.txt")
+    with open(filepath, "w") as f:
+        f.write("1")
+
+    class FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2020, 1, 1, tzinfo=tz)
+
+    monkeypatch.setattr("kedro_wings.history.datetime", FrozenDateTime)
+    created = [snapshot(filepath)[0] for _ in range(12)]
+
+    assert list_generations(filepath) == created[::-1]
+    compact(filepath, generations=3)
+    assert list_generations(filepath) == created[:-4:-1]
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+# The time spent importing the kedro_wings modules themselves, excluding their dependencies
+IMPORT_BUDGET_US = 100000
+HEAVY_MODULES = {
+    "anyconfig",
+    "fsspec",
+    "kedro.framework.context",
+    "numpy",
+    "pandas",
+    "PIL",
+    "pyarrow",
+}
+
+
+def _import_times(statement: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times[module.strip()] = int(self_us)
+    return times
+
+
+def test_package_import_is_lazy():
+    times = _import_times("import kedro_wings")
+    assert "kedro_wings.kedro_wings" not in times
+    assert "kedro" not in times
+
+
+def test_hook_import_budget():
+    times = _import_times("from kedro_wings import KedroWings")
+    assert "kedro_wings.kedro_wings" in times
+    assert not HEAVY_MODULES & set(times)
+    assert not [m for m in times if m.startswith("kedro_wings.datasets")]
+    assert sum(t for m, t in times.items() if m.startswith("kedro_wings")) < IMPORT_BUDGET_US
@@ -0,0 +1,83 @@
+import json
+import math
+
+import pandas as pd
+import pytest
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets import json as wings_json
+from kedro_wings.datasets.json import FastJSONDataSet, JSONLinesDataSet
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(wings_json, "orjson", None)
+    return request.param
+
+
+def test_fast_json_round_trip(tmp_path, json_backend):
+    filepath = str(tmp_path / "data.json")
+    data = {"a": [1, 2.5, None], "b": {"c": "d"}, 1: True}
+
+    dataset = FastJSONDataSet(filepath)
+    dataset.save(data)
+    assert dataset.load() == {"a": [1, 2.5, None], "b": {"c": "d"}, "1": True}
+    with open(filepath) as f:
+        assert json.load(f) == dataset.load()
+
+
+def test_fast_json_unsupported_save_args(tmp_path):
+    filepath = str(tmp_path / "data.json")
+    dataset = FastJSONDataSet(filepath, save_args={"indent": 4})
+    dataset.save({"a": 1})
+    with open(filepath) as f:
+        assert f.read() == json.dumps({"a": 1}, indent=4)
+
+
+def test_json_lines_streams_records(tmp_path, json_backend):
+    filepath = str(tmp_path / "events.jsonl")
+    dataset = JSONLinesDataSet(filepath, lazy=True)
+    dataset.save(({"i": i} for i in range(3)))
+
+    records = dataset.load()
+    assert not isinstance(records, list)
+    assert next(records) == {"i": 0}
+    assert list(records) == [{"i": 1}, {"i": 2}]
+
+    assert JSONLinesDataSet(filepath).load() == [{"i": i} for i in range(3)]
+
+
+def test_fast_json_matches_the_json_module(tmp_path, json_backend):
+    import numpy as np
+
+    filepath = str(tmp_path / "data.json")
+    with open(filepath, "w") as f:
+        json.dump({"a": float("nan"), "b": float("inf")}, f)
+    dataset = FastJSONDataSet(filepath)
+    loaded = dataset.load()
+    assert math.isnan(loaded["a"]) and loaded["b"] == float("inf")
+
+    dataset.save({"a": [None, float("nan")], "b": 2 ** 70})
+    with open(filepath) as f:
+        saved = json.load(f)
+    assert saved["a"][0] is None and math.isnan(saved["a"][1])
+    assert saved["b"] == 2 ** 70
+
+    if json_backend == "orjson":
+        dataset.save({"a": np.array([1.0, np.nan]), "b": None})
+        loaded = dataset.load()
+        assert loaded["b"] is None and math.isnan(loaded["a"][1])
+
+
+def test_json_lines_dataframe(tmp_path):
+    dataset = JSONLinesDataSet(str(tmp_path / "events.jsonl"), lazy=False)
+    dataset.save(pd.DataFrame({"i": [0, 1]}))
+    assert dataset.load() == [{"i": 0}, {"i": 1}]
+
+
+def test_json_wings():
+    wings = KedroWings()
+    entries = wings._create_wing_entries(["01_raw/data.json", "01_raw/events.jsonl"])
+    assert isinstance(entries["01_raw/data.json"], FastJSONDataSet)
+    assert isinstance(entries["01_raw/events.jsonl"], JSONLinesDataSet)
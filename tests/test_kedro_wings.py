@@ -31,11 +31,13 @@ def test_wing_info_to_config():
         wings._wing_to_dataset_config(info)
 
 
-def test_kedro_wings_and_context():
+def test_kedro_wings_and_context(tmp_path):
     from kedro.pipeline import Pipeline, node
     from kedro.io import DataCatalog
 
     class FakeContext:
+        project_path = tmp_path
+
         def _get_catalog(self):
             return DataCatalog()
 
@@ -64,6 +66,9 @@ def test_kedro_wings_and_context():
         "01_raw/data.csv",
         "02_intermediate/data.csv",
     }
+    # Without a KedroWings hook, wings are still under the project's data directory
+    raw_dataset = mock_context.catalog._data_sets["01_raw/data.csv"]
+    assert str(raw_dataset._filepath) == str(tmp_path / "data" / "01_raw" / "data.csv")
 
 
 def test_create_chrono_entries():
@@ -125,15 +130,117 @@ def test_create_wing_entries():
     catalog_name = "02_intermediate/data.xls"
     catalog_entry = wings._create_wing_entries([catalog_name])[catalog_name]
 
-    from kedro.extras.datasets.pandas import ExcelDataSet
+    from kedro_wings.datasets.excel import ExcelWorkbookDataSet
 
-    assert isinstance(catalog_entry, ExcelDataSet)
+    assert isinstance(catalog_entry, ExcelWorkbookDataSet)
     assert str(catalog_entry._filepath) == os.path.join("data", catalog_name)
 
     catalog_name = "02_intermediate/data.pkl"
     catalog_entry = wings._create_wing_entries([catalog_name])[catalog_name]
 
-    from kedro.extras.datasets.pickle import PickleDataSet
+    from kedro_wings.datasets.pickle import PickleDataSet
 
     assert isinstance(catalog_entry, PickleDataSet)
     assert str(catalog_entry._filepath) == os.path.join("data", catalog_name)
+
+
+def test_precreate_output_directories(tmp_path):
+    from kedro.pipeline import Pipeline, node
+    from kedro.io import DataCatalog
+
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, inputs="01_raw/data.txt", outputs="02_intermediate/a.txt"),
+            node(lambda x: x, inputs="02_intermediate/a.txt", outputs="03_primary/b.txt"),
+            node(lambda x: x, inputs="03_primary/b.txt", outputs="01_raw/data.txt!"),
+        ]
+    )
+    wings = KedroWings(root=str(tmp_path), precreate_dirs=True)
+    catalog = DataCatalog()
+    wings.before_pipeline_run({}, pipeline, catalog)
+
+    assert sorted(os.listdir(str(tmp_path))) == ["01_raw", "02_intermediate", "03_primary"]
+
+    dataset = catalog._data_sets["03_primary/b.txt"]
+    assert str(dataset._filepath) == os.path.join(str(tmp_path), "03_primary/b.txt")
+    assert dataset._fs.auto_mkdir is False
+    dataset.save("b")
+    assert dataset.load() == "b"
+
+
+def test_shared_datasets(tmp_path, caplog):
+    from kedro.pipeline import Pipeline, node
+    from kedro.io import DataCatalog
+
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, inputs="01_raw/data.csv", outputs="01_raw/data.csv!"),
+            node(lambda x: x, inputs="02_int/data.txt", outputs="02_intermediate/data.txt"),
+            node(lambda x: x, inputs="02_intermediate/data.txt", outputs="03_primary/data.txt"),
+        ]
+    )
+    wings = KedroWings(
+        root=str(tmp_path),
+        paths={"02_int": "02_intermediate"},
+        layer_configs={"03_primary": {".txt": "pandas.CSVDataSet"}},
+    )
+    catalog = DataCatalog()
+    wings.before_pipeline_run({}, pipeline, catalog)
+
+    datasets = catalog._data_sets
+    assert datasets["01_raw/data.csv"] is datasets["01_raw/data.csv!"]
+    assert datasets["02_int/data.txt"] is datasets["02_intermediate/data.txt"]
+    assert "both resolve to" not in caplog.text
+
+    KedroWings(
+        root=str(tmp_path),
+        paths={"03_primary": "02_intermediate"},
+        layer_configs={"03_primary": {".txt": "pandas.CSVDataSet"}},
+    ).before_pipeline_run({}, pipeline, DataCatalog())
+    assert "both resolve to" in caplog.text
+
+
+def test_refresh_context():
+    from kedro.pipeline import Pipeline, node
+    from kedro.io import DataCatalog
+
+    class FakeContext:
+        hooks = (KedroWings(),)
+        project_path = "."
+
+        def __init__(self):
+            self.pipelines = {
+                "__default__": Pipeline(
+                    [node(lambda x: x, inputs="01_raw/data.csv", outputs="02_intermediate/a.csv")]
+                )
+            }
+
+        def _get_catalog(self):
+            return DataCatalog()
+
+        @property
+        def catalog(self):
+            return self._get_catalog()
+
+    context = FakeContext()
+    wings = KedroWings(context=context)
+    raw_dataset = context.catalog._data_sets["01_raw/data.csv"]
+
+    # Creating KedroWings again refreshes instead of doing nothing
+    context.pipelines["__default__"] += Pipeline(
+        [node(lambda x: x, inputs="02_intermediate/a.csv", outputs="03_primary/b.pkl")]
+    )
+    KedroWings(context=context)
+    assert "03_primary/b.pkl" in context.catalog.list()
+
+    context.pipelines["__default__"] = Pipeline(
+        [node(lambda x: x, inputs="01_raw/data.csv", outputs="02_intermediate/a.pkl")]
+    )
+    changes = wings.refresh()
+    assert changes == {
+        "added": ["02_intermediate/a.pkl"],
+        "removed": ["02_intermediate/a.csv", "03_primary/b.pkl"],
+        "replaced": [],
+    }
+    assert set(context.catalog.list()) == {"01_raw/data.csv", "02_intermediate/a.pkl"}
+    assert context.catalog._data_sets["01_raw/data.csv"] is raw_dataset
@@ -0,0 +1,55 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.kedro_wings import InvalidMemoryProfileConfig
+from kedro_wings.memory import current_rss, deep_sizeof
+
+
+def test_deep_sizeof():
+    array = np.zeros(1000)
+    assert deep_sizeof(array) == 8000
+    assert deep_sizeof([array, array]) < 16000
+    assert deep_sizeof({"a": array, "b": np.zeros(1000)}) > 16000
+    frame = pd.DataFrame({"a": np.zeros(1000), "b": ["x" * 100] * 1000})
+    assert deep_sizeof(frame) > 100000
+    assert current_rss() > 0
+
+
+def test_memory_profile(tmp_path):
+    def expand(x):
+        big = np.ones((2000, 2000))
+        return big.sum() + x
+
+    wings = KedroWings(
+        root=str(tmp_path),
+        memory_profile={"interval": 0.001, "report": str(tmp_path / "memory.json")},
+    )
+    pipeline = Pipeline([node(expand, "01_raw/a.pkl", "02_intermediate/b.pkl!", name="expand")])
+    catalog = DataCatalog()
+    wings.before_pipeline_run({}, pipeline, catalog)
+    n = pipeline.nodes[0]
+
+    wings.before_node_run(n, {"01_raw/a.pkl": np.zeros(10000)})
+    outputs = {"02_intermediate/b.pkl!": expand(1)}
+    wings.after_node_run(n, outputs)
+    wings.after_pipeline_run({}, pipeline, catalog)
+
+    with open(tmp_path / "memory.json") as report_file:
+        report = json.load(report_file)
+    assert report["nodes"][0]["node"] == "expand"
+    assert report["nodes"][0]["peak_rss"] >= report["nodes"][0]["rss_before"]
+    datasets = {d["name"]: d for d in report["datasets"]}
+    assert datasets["01_raw/a.pkl"] == {
+        "name": "01_raw/a.pkl", "layer": "01_raw", "loaded_bytes": 80000, "saved_bytes": 0
+    }
+    assert datasets["02_intermediate/b.pkl"]["layer"] == "02_intermediate"
+    assert list(report["layers"]) == ["01_raw", "02_intermediate"]
+
+    with pytest.raises(InvalidMemoryProfileConfig):
+        KedroWings(memory_profile={"every": 1})
@@ -0,0 +1,106 @@
+import json
+
+import pandas as pd
+import pytest
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets.pandas import SchemaCSVDataSet, infer_schema
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "value": [0.5, 1.5, 2.5, 3.5],
+            "species": ["setosa", "setosa", "virginica", "setosa"],
+            "name": ["a", "b", "c", "d"],
+            "when": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"]),
+            "when_utc": pd.to_datetime(["2020-01-01"] * 4).tz_localize("UTC"),
+            "flag": [True, False, True, True],
+        }
+    )
+
+
+def test_infer_schema(data):
+    schema = infer_schema(data, downcast=["integer", "float"], category_threshold=0.5)
+    columns = schema["columns"]
+    assert columns["id"] == {"dtype": "int8"}
+    assert columns["value"] == {"dtype": "float32"}
+    assert columns["species"] == {
+        "dtype": "category",
+        "categories": ["setosa", "virginica"],
+        "ordered": False,
+    }
+    assert columns["name"]["dtype"] != "category"
+    assert columns["when"] == {"dtype": str(data.dtypes["when"])}
+
+
+def test_round_trip_with_sidecar(tmp_path, data):
+    filepath = str(tmp_path / "data.csv")
+    dataset = SchemaCSVDataSet(filepath, downcast=["integer"], category_threshold=0.5)
+    dataset.save(data)
+
+    with open(f"{filepath}.schema.json") as f:
+        assert json.load(f)["columns"]["id"] == {"dtype": "int8"}
+
+    loaded = dataset.load()
+    assert loaded.dtypes["id"] == "int8"
+    assert loaded.dtypes["value"] == "float64"
+    assert isinstance(loaded.dtypes["species"], pd.CategoricalDtype)
+    assert loaded.dtypes["flag"] == "bool"
+    pd.testing.assert_series_equal(loaded["when"], data["when"])
+    pd.testing.assert_series_equal(loaded["when_utc"], data["when_utc"])
+
+
+def test_load_without_sidecar(tmp_path, data):
+    filepath = str(tmp_path / "data.csv")
+    data[["id", "name"]].to_csv(filepath, index=False)
+    loaded = SchemaCSVDataSet(filepath).load()
+    assert loaded.dtypes["id"] == "int64"
+
+
+def test_open_args(tmp_path):
+    filepath = str(tmp_path / "data.csv")
+    data = pd.DataFrame({"name": ["café", "naïve"]})
+    fs_args = {
+        "open_args_load": {"encoding": "latin-1"},
+        "open_args_save": {"encoding": "latin-1"},
+    }
+    dataset = SchemaCSVDataSet(filepath, save_args={"index": False}, fs_args=fs_args)
+    dataset.save(data)
+    assert pd.read_csv(filepath, encoding="latin-1").equals(data)
+    pd.testing.assert_frame_equal(dataset.load(), data, check_dtype=False)
+
+
+def test_invalid_downcast(tmp_path):
+    with pytest.raises(ValueError):
+        SchemaCSVDataSet(str(tmp_path / "data.csv"), downcast=["complex"])
+
+
+def test_layer_configs():
+    wings = KedroWings(
+        layer_configs={
+            "02_intermediate": {
+                ".csv": {
+                    "type": "kedro_wings.datasets.pandas.SchemaCSVDataSet",
+                    "downcast": ["integer"],
+                },
+                ".intermediate": {"type": "text.TextDataSet"},
+            }
+        }
+    )
+    entries = wings._create_wing_entries(
+        [
+            "01_raw/data.csv",
+            "02_intermediate/data.csv",
+            "02_intermediate/sub/data.csv",
+            "02_intermediate/data.intermediate",
+            "03_primary/data.intermediate",
+        ]
+    )
+    assert type(entries["01_raw/data.csv"]) is not SchemaCSVDataSet
+    assert isinstance(entries["02_intermediate/data.csv"], SchemaCSVDataSet)
+    assert entries["02_intermediate/sub/data.csv"]._downcast == ("integer",)
+    assert "02_intermediate/data.intermediate" in entries
+    assert "03_primary/data.intermediate" not in entries
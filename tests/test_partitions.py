@@ -0,0 +1,139 @@
+import os
+
+import fsspec
+import pandas as pd
+import polars as pl
+import pytest
+from kedro.io import DataCatalog, DataSetError
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets.arrow import PartitionedParquetDataSet
+from kedro_wings.kedro_wings import InvalidPartitionWing
+from kedro_wings.partitions import split_partitions
+
+
+@pytest.fixture
+def sales():
+    return pd.DataFrame(
+        {"region": ["eu", "us", "eu", "ap"], "day": [1, 1, 2, 2], "amount": [1.0, 2.0, 3.0, 4.0]}
+    )
+
+
+def test_split_partitions():
+    assert split_partitions("03_primary/sales.parquet@region, day") == (
+        "03_primary/sales.parquet", ["region", "day"]
+    )
+    assert split_partitions("03_primary/sales.parquet@") == ("03_primary/sales.parquet", [])
+    assert split_partitions("03_primary/sales.parquet") == ("03_primary/sales.parquet", None)
+    assert split_partitions("team@corp/sales.parquet") == ("team@corp/sales.parquet", None)
+    # Other wings, and parquet wings transcoded to a format, keep their kedro transcoding suffix
+    assert split_partitions("01_raw/sales.csv@region") == ("01_raw/sales.csv@region", None)
+    assert split_partitions("01_raw/sales.parquet@spark") == ("01_raw/sales.parquet@spark", None)
+
+
+def test_partitioned_dataset(tmp_path, sales):
+    filepath = str(tmp_path / "sales.parquet")
+    PartitionedParquetDataSet(filepath, partition_cols=["region", "day"]).save(sales)
+    assert sorted(os.listdir(filepath)) == ["region=ap", "region=eu", "region=us"]
+
+    eu = PartitionedParquetDataSet(
+        filepath, load_args={"filters": [("region", "=", "eu")], "columns": ["day", "amount"]}
+    ).load()
+    assert eu.sort_values("day")["amount"].tolist() == [1.0, 3.0]
+
+    # Saving replaces every partition
+    PartitionedParquetDataSet(filepath, partition_cols=["region"]).save(sales.iloc[:1])
+    assert os.listdir(filepath) == ["region=eu"]
+    assert os.listdir(tmp_path) == ["sales.parquet"]
+
+
+def test_partitioned_save_of_its_own_scan(tmp_path, sales):
+    filepath = str(tmp_path / "sales.parquet")
+    PartitionedParquetDataSet(filepath, partition_cols=["region"]).save(sales)
+    # The frame streams from the dataset being replaced
+    scan = pl.scan_parquet(os.path.join(filepath, "**", "*.parquet"), hive_partitioning=True)
+    PartitionedParquetDataSet(filepath, partition_cols=["day"]).save(scan)
+
+    assert sorted(os.listdir(filepath)) == ["day=1", "day=2"]
+    loaded = PartitionedParquetDataSet(filepath).load()
+    assert sorted(loaded["amount"].tolist()) == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_failed_partitioned_save_keeps_the_dataset(tmp_path, sales):
+    filepath = str(tmp_path / "sales.parquet")
+    PartitionedParquetDataSet(filepath, partition_cols=["region"]).save(sales)
+    with pytest.raises(DataSetError):
+        PartitionedParquetDataSet(filepath, partition_cols=["missing"]).save(sales)
+
+    assert sorted(os.listdir(tmp_path)) == ["sales.parquet"]
+    assert len(PartitionedParquetDataSet(filepath).load()) == 4
+
+
+def test_partitioned_wings(tmp_path, sales):
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, "01_raw/sales.csv", "03_primary/sales.parquet@region"),
+            node(lambda x: x, "03_primary/sales.parquet@", "04_feature/out.pkl"),
+        ]
+    )
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path)).before_pipeline_run({}, pipeline, catalog)
+
+    catalog.save("03_primary/sales.parquet@region", sales)
+    assert os.path.isdir(tmp_path / "03_primary" / "sales.parquet" / "region=us")
+    loaded = catalog.load("03_primary/sales.parquet@")
+    assert sorted(loaded["amount"].tolist()) == [1.0, 2.0, 3.0, 4.0]
+
+    # The plain name of a partitioned output is read as a partitioned dataset, pruned by its filters
+    wings = KedroWings(root=str(tmp_path), dataset_configs={
+        ".parquet": {"type": "pandas.ParquetDataSet", "load_args": {"filters": [("region", "=", "eu")]}}
+    })
+    wings._track_outputs(["03_primary/sales.parquet@region"])
+    reader = wings._create_wing_entries(["03_primary/sales.parquet"])["03_primary/sales.parquet"]
+    assert isinstance(reader, PartitionedParquetDataSet)
+    assert reader.load()["amount"].tolist() == [1.0, 3.0]
+
+    # Only parquet wings are partitioned, other transcoded names are left to the catalog
+    entries = KedroWings(root=str(tmp_path))._create_wing_entries(
+        ["01_raw/sales.csv@pandas", "01_raw/sales.parquet@spark"]
+    )
+    assert entries == {}
+
+    with pytest.raises(InvalidPartitionWing):
+        KedroWings(root=str(tmp_path), dataset_configs={
+            ".parquet": {"type": "pandas.CSVDataSet"}
+        })._create_wing_entries(["01_raw/sales.parquet@region"])
+
+
+@pytest.mark.parametrize("write", ["through", "back"])
+def test_cached_partitioned_wings(tmp_path, sales, write):
+    memory_fs = fsspec.filesystem("memory")
+    wings = KedroWings(root="memory:///wings", cache={"directory": str(tmp_path), "write": write})
+    wings._track_outputs(["03_primary/sales.parquet@region"])
+    entries = wings._create_entries(
+        ["03_primary/sales.parquet@region", "03_primary/sales.parquet@"], {}
+    )
+    try:
+        entries["03_primary/sales.parquet@region"].save(sales)
+        entries["03_primary/sales.parquet@region"].save(sales.iloc[:1])
+        assert entries["03_primary/sales.parquet@"].load()["amount"].tolist() == [1.0]
+        wings._filesystems.flush()
+        assert memory_fs.find("/wings/03_primary") == [
+            "/wings/03_primary/sales.parquet/region=eu/part-0.parquet"
+        ]
+    finally:
+        memory_fs.store.clear()
+        memory_fs.pseudo_dirs[:] = [""]
+
+
+def test_sampled_partitioned_wings(tmp_path, sales):
+    PartitionedParquetDataSet(
+        str(tmp_path / "03_primary" / "sales.parquet"), partition_cols=["region"]
+    ).save(sales)
+    pipeline = Pipeline([node(lambda x: x, "03_primary/sales.parquet@", "04_feature/out.pkl")])
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path), sample={"03_primary": 2}).before_pipeline_run(
+        {}, pipeline, catalog
+    )
+    assert len(catalog.load("03_primary/sales.parquet@")) == 2
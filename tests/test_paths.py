@@ -0,0 +1,61 @@
+from kedro_wings import KedroWings
+from kedro_wings.paths import PathRemapper, is_pattern
+
+
+def test_is_pattern():
+    assert not is_pattern("06_models")
+    assert is_pattern("0*_*")
+    assert is_pattern("re:(.*)/scratch")
+
+
+def test_exact_paths_take_priority():
+    remapper = PathRemapper({"06_models": "new_models", "0*": "other"})
+    assert remapper.remap("06_models") == "new_models"
+    assert remapper.remap("05_model_input") == "other"
+    assert remapper.remap("data") == "data"
+
+
+def test_glob_and_regex_rules():
+    remapper = PathRemapper(
+        {
+            "*/scratch/*": "/mnt/nvme/{directory}",
+            r"re:(\d\d)_(\w+)": r"layers/\2/\1",
+        }
+    )
+    assert remapper.remap("02_intermediate/scratch/a") == "/mnt/nvme/02_intermediate/scratch/a"
+    assert remapper.remap("02_intermediate") == "layers/intermediate/02"
+    assert remapper.remap("02_intermediate/a") == "02_intermediate/a"
+
+
+def test_rules_are_tried_in_order():
+    remapper = PathRemapper({"02_*": "first", "0*": "second"})
+    assert remapper.remap("02_intermediate") == "first"
+    assert remapper.remap("03_primary") == "second"
+
+
+def test_clashing_group_names():
+    remapper = PathRemapper(
+        {r"re:(?P<layer>01_\w+)": r"a/\g<layer>", r"re:(?P<layer>02_\w+)": r"b/\g<layer>"}
+    )
+    assert remapper._matcher is None
+    assert remapper.remap("02_intermediate") == "b/02_intermediate"
+
+
+def test_numbered_backreferences():
+    # Combined into one matcher, the second rule's \1 would refer to the first rule's group
+    remapper = PathRemapper({r"re:(a+)_x": "A", r"re:(\w+)/\1": "dup"})
+    assert remapper._matcher is None
+    assert remapper.remap("foo/foo") == "dup"
+    assert remapper.remap("foo/bar") == "foo/bar"
+    assert remapper.remap("aa_x") == "A"
+
+
+def test_dated_run_folders():
+    remapper = PathRemapper({"0*_*": "runs/{date}/{directory}"})
+    assert remapper.remap("02_intermediate") == f"runs/{remapper._date}/02_intermediate"
+
+
+def test_wings_pattern_paths():
+    wings = KedroWings(paths={"0[2-4]_*": "fast/{directory}"})
+    entry = wings._create_wing_entries(["03_primary/data.csv"])["03_primary/data.csv"]
+    assert str(entry._filepath) == "data/fast/03_primary/data.csv"
@@ -0,0 +1,109 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+from kedro.io.core import DataSetError
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets.pickle import MAGIC, PickleDataSet
+
+
+@pytest.fixture
+def data():
+    return {"weights": np.arange(1000, dtype="float64").reshape(10, 100), "name": "model"}
+
+
+def _assert_equal(loaded, data):
+    assert loaded["name"] == data["name"]
+    np.testing.assert_array_equal(loaded["weights"], data["weights"])
+
+
+def test_out_of_band_round_trip(tmp_path, data):
+    filepath = str(tmp_path / "model.pkl")
+    dataset = PickleDataSet(filepath)
+    dataset.save(data)
+
+    with open(filepath, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+
+    loaded = dataset.load()
+    _assert_equal(loaded, data)
+    # Buffers are memory-mapped, not copied
+    assert not loaded["weights"].flags.writeable
+    assert loaded["weights"].ctypes.data % 64 == 0
+
+
+def test_copied_buffers_are_writeable(tmp_path, data):
+    dataset = PickleDataSet(str(tmp_path / "model.pkl"), mmap=False)
+    dataset.save(data)
+    loaded = dataset.load()
+    _assert_equal(loaded, data)
+    assert loaded["weights"].flags.writeable
+
+
+def test_load_plain_pickle(tmp_path, data):
+    filepath = str(tmp_path / "model.pkl")
+    with open(filepath, "wb") as f:
+        pickle.dump(data, f)
+    _assert_equal(PickleDataSet(filepath).load(), data)
+
+
+@pytest.mark.parametrize(
+    "backend,compression",
+    [("pickle", "gzip"), ("cloudpickle", None), ("cloudpickle", "lzma"), ("joblib", 3)],
+)
+def test_backends(tmp_path, data, backend, compression):
+    dataset = PickleDataSet(
+        str(tmp_path / "model.pkl"), backend=backend, compression=compression
+    )
+    dataset.save(data)
+    _assert_equal(dataset.load(), data)
+
+
+def test_invalid_compression(tmp_path):
+    with pytest.raises(ValueError):
+        PickleDataSet(str(tmp_path / "model.pkl"), compression="zip")
+
+
+def test_pickle_wings():
+    entries = KedroWings()._create_wing_entries(
+        ["06_models/a.pkl", "06_models/b.cpkl", "06_models/c.joblib"]
+    )
+    assert entries["06_models/a.pkl"]._backend == "pickle"
+    assert entries["06_models/b.cpkl"]._backend == "cloudpickle"
+    assert entries["06_models/c.joblib"]._backend == "joblib"
+
+
+def test_save_over_memory_mapped_load(tmp_path, data):
+    (tmp_path / "06_models").mkdir()
+    data = {"weights": np.arange(100000, dtype="float64"), "name": "model"}
+    entries = KedroWings(root=str(tmp_path))._create_entries(
+        ["06_models/m.pkl", "06_models/m.pkl!"], {}
+    )
+    entries["06_models/m.pkl!"].save(data)
+    loaded = entries["06_models/m.pkl"].load()
+    assert not loaded["weights"].flags.writeable
+
+    entries["06_models/m.pkl!"].save(loaded)
+    _assert_equal(loaded, data)
+    _assert_equal(entries["06_models/m.pkl"].load(), data)
+    assert os.listdir(str(tmp_path / "06_models")) == ["m.pkl"]
+
+
+def test_plain_pickles(tmp_path, data):
+    filepath = str(tmp_path / "model.pkl")
+    PickleDataSet(filepath, out_of_band=False, save_args={"protocol": 4}).save(data)
+    with open(filepath, "rb") as f:
+        _assert_equal(pickle.load(f), data)
+
+    with pytest.raises(ValueError, match="out_of_band"):
+        PickleDataSet(filepath, save_args={"protocol": 4})
+
+
+def test_out_of_band_load_args(tmp_path):
+    filepath = str(tmp_path / "model.pkl")
+    PickleDataSet(filepath).save({"a": 1})
+    with pytest.raises(DataSetError, match="unknown"):
+        PickleDataSet(filepath, load_args={"unknown": True}).load()
+    assert PickleDataSet(filepath, load_args={"encoding": "latin-1"}).load() == {"a": 1}
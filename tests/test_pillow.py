@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pytest
+from kedro.io.core import DataSetError
+from PIL import Image
+
+from kedro_wings.datasets.pillow import CACHE_SUFFIX, ImageDirectoryDataSet
+
+
+def _write_images(directory, count, size=(8, 6)):
+    os.makedirs(directory, exist_ok=True)
+    for i in range(count):
+        array = np.full((size[1], size[0], 3), i, dtype=np.uint8)
+        Image.fromarray(array).save(os.path.join(directory, f"{i:02d}.png"))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_directory(tmp_path, executor):
+    directory = str(tmp_path / "cats.images")
+    _write_images(directory, 5)
+
+    dataset = ImageDirectoryDataSet(directory, workers=2, executor=executor)
+    images = dataset.load()
+    assert images.shape == (5, 6, 8, 3)
+    assert [int(image[0, 0, 0]) for image in images] == [0, 1, 2, 3, 4]
+    assert isinstance(images, np.memmap)
+    assert os.path.exists(f"{directory}{CACHE_SUFFIX}")
+
+
+def test_cache_invalidation(tmp_path):
+    directory = str(tmp_path / "cats")
+    _write_images(directory, 3)
+    dataset = ImageDirectoryDataSet(directory, mode="L")
+    assert dataset.load().shape == (3, 6, 8)
+
+    _write_images(directory, 4)
+    assert dataset.load().shape == (4, 6, 8)
+
+    os.remove(os.path.join(directory, "00.png"))
+    assert int(dataset.load()[0, 0, 0]) == 1
+
+
+def test_resize_and_mixed_sizes(tmp_path):
+    directory = str(tmp_path / "cats")
+    _write_images(directory, 2)
+    Image.new("RGB", (4, 4)).save(os.path.join(directory, "small.png"))
+
+    with pytest.raises(DataSetError):
+        ImageDirectoryDataSet(directory, cache=False).load()
+    images = ImageDirectoryDataSet(directory, size=(4, 2), cache=False).load()
+    assert images.shape == (3, 2, 4, 3)
+    assert not isinstance(images, np.memmap)
+
+
+def test_save(tmp_path):
+    directory = str(tmp_path / "out")
+    dataset = ImageDirectoryDataSet(directory)
+    dataset.save(np.zeros((2, 3, 3, 3), dtype=np.uint8))
+    assert sorted(os.listdir(directory)) == ["000000.png", "000001.png"]
+    assert dataset.load().shape == (2, 3, 3, 3)
+
+
+def test_rebuilt_cache_keeps_earlier_loads(tmp_path):
+    directory = str(tmp_path / "cats")
+    _write_images(directory, 3)
+    dataset = ImageDirectoryDataSet(directory, mode="L")
+    earlier = dataset.load()
+
+    _write_images(directory, 5)
+    assert dataset.load().shape == (5, 6, 8)
+    assert earlier.shape == (3, 6, 8)
+    assert [int(image[0, 0]) for image in earlier] == [0, 1, 2]
+    assert sorted(os.listdir(str(tmp_path))) == sorted(["cats", f"cats{CACHE_SUFFIX}", "cats.cache.json"])
+
+
+def test_save_removes_earlier_images(tmp_path):
+    directory = str(tmp_path / "out")
+    dataset = ImageDirectoryDataSet(directory, mode="L")
+    dataset.save(np.zeros((3, 3, 3), dtype=np.uint8))
+    dataset.save(np.ones((2, 3, 3), dtype=np.uint8))
+    assert sorted(os.listdir(directory)) == ["000000.png", "000001.png"]
+    assert dataset.load().shape == (2, 3, 3)
@@ -0,0 +1,72 @@
+import json
+import os
+
+from click.testing import CliRunner
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings import plugin
+
+
+def _pipeline():
+    return Pipeline(
+        [
+            node(lambda x: x, inputs="01_raw/data.csv", outputs="02_intermediate/data.pkl"),
+            node(lambda x: x, inputs="02_intermediate/data.pkl", outputs="01_raw/data.csv!"),
+            node(lambda x: x, inputs="params", outputs="catalogued"),
+            node(lambda x: x, inputs="catalogued", outputs="catalogued!"),
+        ]
+    )
+
+
+def test_plan_rows(tmp_path):
+    raw = tmp_path / "01_raw"
+    raw.mkdir()
+    (raw / "data.csv").write_text("a\n1\n")
+
+    wings = KedroWings(root=str(tmp_path), paths={"02_intermediate": "02_int"})
+    catalog_config = {"catalogued": {"type": "pandas.CSVDataSet", "filepath": "x.csv"}}
+    rows = {row["name"]: row for row in _plan_rows(wings, catalog_config)}
+
+    assert set(rows) == {"01_raw/data.csv", "01_raw/data.csv!", "02_intermediate/data.pkl", "catalogued!"}
+    assert rows["01_raw/data.csv"]["filepath"] == os.path.join(str(tmp_path), "01_raw/data.csv")
+    assert rows["01_raw/data.csv"]["size"] == 4
+    assert rows["01_raw/data.csv!"]["filepath"] == rows["01_raw/data.csv"]["filepath"]
+    assert rows["02_intermediate/data.pkl"] == {
+        "name": "02_intermediate/data.pkl",
+        "type": "kedro_wings.datasets.pickle.PickleDataSet",
+        "filepath": os.path.join(str(tmp_path), "02_int/data.pkl"),
+        "size": None,
+        "mtime": None,
+    }
+    assert rows["catalogued!"]["filepath"] == "x.csv"
+
+
+def _plan_rows(wings, catalog_config):
+    return plugin.plan_rows(wings, _pipeline(), catalog_config)
+
+
+def test_plan_command(tmp_path, monkeypatch):
+    class FakeContext:
+        hooks = (KedroWings(root=str(tmp_path)),)
+        pipelines = {"__default__": _pipeline()}
+
+        class config_loader:
+            @staticmethod
+            def get(*patterns):
+                return {}
+
+    monkeypatch.setattr(plugin, "load_context", lambda path, env=None: FakeContext())
+    runner = CliRunner()
+
+    result = runner.invoke(plugin.commands, ["wings", "plan"])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[0].split() == list(plugin.PLAN_COLUMNS)
+    assert "02_intermediate/data.pkl" in result.output
+
+    result = runner.invoke(plugin.commands, ["wings", "plan", "--format", "json", "--no-stat"])
+    assert result.exit_code == 0, result.output
+    assert len(json.loads(result.output)) == 3
+
+    result = runner.invoke(plugin.commands, ["wings", "plan", "--pipeline", "missing"])
+    assert result.exit_code != 0
@@ -0,0 +1,101 @@
+import fsspec
+import pandas as pd
+import polars as pl
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets.arrow import PartitionedParquetDataSet
+from kedro_wings.datasets.polars import LazyPolarsDataSet
+from kedro_wings.kedro_wings import InvalidBackend
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".feather"])
+def test_round_trip(tmp_path, data, extension):
+    dataset = LazyPolarsDataSet(str(tmp_path / "sub" / f"data{extension}"))
+    dataset.save(data)
+    loaded = dataset.load()
+    assert isinstance(loaded, pl.LazyFrame)
+    assert loaded.filter(pl.col("a") > 2).select("b").collect()["b"].to_list() == ["y", "z"]
+
+    # Lazy frames are streamed to the file
+    copy = LazyPolarsDataSet(str(tmp_path / f"copy{extension}"))
+    copy.save(loaded.filter(pl.col("a") % 2 == 0))
+    assert copy.load().collect()["a"].to_list() == [2, 4]
+
+
+def test_backend_wings(tmp_path, data):
+    wings = KedroWings(root=str(tmp_path), backend={"02_intermediate": "polars"})
+    entries = wings._create_wing_entries(
+        ["02_intermediate/a.parquet", "01_raw/a.parquet", "02_intermediate/a.pkl"]
+    )
+    assert isinstance(entries["02_intermediate/a.parquet"], LazyPolarsDataSet)
+    assert not isinstance(entries["01_raw/a.parquet"], LazyPolarsDataSet)
+
+    # Configs given by the user are kept
+    wings = KedroWings(
+        root=str(tmp_path), backend="polars", dataset_configs={".csv": {"type": "pandas.CSVDataSet"}}
+    )
+    entries = wings._create_wing_entries(["01_raw/a.csv", "01_raw/a.feather"])
+    assert not isinstance(entries["01_raw/a.csv"], LazyPolarsDataSet)
+    assert isinstance(entries["01_raw/a.feather"], LazyPolarsDataSet)
+
+    with pytest.raises(InvalidBackend):
+        KedroWings(backend="spark")
+
+
+def test_sampled_backend_wings(tmp_path, data):
+    LazyPolarsDataSet(str(tmp_path / "01_raw" / "a.parquet")).save(data)
+    pipeline = Pipeline([node(lambda x: x.collect(), "01_raw/a.parquet", "out")])
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path), backend="polars", sample={"01_raw": 2}).before_pipeline_run(
+        {}, pipeline, catalog
+    )
+    assert catalog.load("01_raw/a.parquet").collect()["a"].to_list() == [1, 2]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".feather"])
+def test_save_over_scanned_file(tmp_path, extension):
+    (tmp_path / "02_intermediate").mkdir()
+    name = f"02_intermediate/x{extension}"
+    entries = KedroWings(root=str(tmp_path), backend="polars")._create_entries(
+        [name, f"{name}!"], {}
+    )
+    data = pd.DataFrame({"a": list(range(1000))})
+    entries[f"{name}!"].save(data)
+
+    scanned = entries[name].load()
+    entries[f"{name}!"].save(scanned.filter(pl.col("a") % 2 == 0))
+    assert entries[name].load().collect()["a"].to_list() == list(range(0, 1000, 2))
+    assert sorted(p.name for p in (tmp_path / "02_intermediate").iterdir()) == [f"x{extension}"]
+
+
+@pytest.fixture
+def memory_fs():
+    memory_fs = fsspec.filesystem("memory")
+    yield memory_fs
+    memory_fs.store.clear()
+    memory_fs.pseudo_dirs[:] = [""]
+
+
+def test_remote_load_args(memory_fs, data):
+    memory_fs.pipe("/raw/a.csv", b"a;b\n1;w\n2;x\n3;y\n")
+    dataset = LazyPolarsDataSet(
+        "memory:///raw/a.csv", load_args={"separator": ";", "n_rows": 2}
+    )
+    assert dataset.load().collect().to_dict(as_series=False) == {"a": [1, 2], "b": ["w", "x"]}
+
+
+def test_remote_partitioned_directory(memory_fs, data):
+    PartitionedParquetDataSet("memory:///primary/a.parquet", partition_cols=["b"]).save(data)
+    dataset = LazyPolarsDataSet(
+        "memory:///primary/a.parquet", load_args={"hive_partitioning": True}
+    )
+    loaded = dataset.load().filter(pl.col("b") == "y").collect()
+    assert loaded["a"].to_list() == [3]
@@ -0,0 +1,114 @@
+import os
+
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.kedro_wings import InvalidSample
+from kedro_wings.sampling import RowSampler, parse_sample, sample_config
+
+
+def test_parse_sample():
+    assert parse_sample("01_raw=10000, 02_intermediate=0.1") == {
+        "01_raw": 10000,
+        "02_intermediate": 0.1,
+    }
+    assert parse_sample("") == {}
+    with pytest.raises(ValueError):
+        parse_sample("01_raw=many")
+
+
+def test_invalid_sample(monkeypatch):
+    with pytest.raises(InvalidSample):
+        KedroWings(sample={"01_raw": 1.5})
+    monkeypatch.setenv("KEDRO_WINGS_SAMPLE", "01_raw=ten")
+    with pytest.raises(InvalidSample):
+        KedroWings()
+
+
+def test_sample_config():
+    csv = sample_config({"type": "pandas.CSVDataSet", "filepath": "a.csv"}, 10)
+    assert csv["load_args"] == {"nrows": 10}
+
+    csv = sample_config({"type": "pandas.CSVDataSet", "filepath": "a.csv"}, 0.5, seed=1)
+    sampler = csv["load_args"]["skiprows"]
+    assert isinstance(sampler, RowSampler)
+    assert sampler(0) is False
+
+    parquet = sample_config({"type": "pandas.ParquetDataSet", "filepath": "a.parquet"}, 10)
+    assert parquet["type"] == "kedro_wings.datasets.arrow.SampledParquetDataSet"
+    assert parquet["rows"] == 10
+
+    text = sample_config({"type": "text.TextDataSet", "filepath": "a.txt"}, 10)
+    assert text["type"] == "kedro_wings.datasets.sample.SampledDataSet"
+    assert text["dataset"] == {"type": "text.TextDataSet", "filepath": "a.txt"}
+
+
+def test_sampled_pipeline(tmp_path):
+    raw = tmp_path / "data" / "01_raw"
+    raw.mkdir(parents=True)
+    data = pd.DataFrame({"a": range(1000)})
+    data.to_csv(str(raw / "data.csv"), index=False)
+    data.to_parquet(str(raw / "data.parquet"), row_group_size=100)
+
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, inputs="01_raw/data.csv", outputs="02_intermediate/a.csv"),
+            node(lambda x: x, inputs="01_raw/data.parquet", outputs="02_intermediate/b.parquet"),
+        ]
+    )
+    root = str(tmp_path / "data")
+    wings = KedroWings(root=root, sample={"01_raw": 10, "02_intermediate": 10}, precreate_dirs=True)
+    catalog = DataCatalog()
+    wings.before_pipeline_run({}, pipeline, catalog)
+
+    assert len(catalog.load("01_raw/data.csv")) == 10
+    assert catalog.load("01_raw/data.parquet")["a"].tolist() == list(range(10))
+
+    catalog.save("02_intermediate/a.csv", catalog.load("01_raw/data.csv"))
+    assert os.path.exists(os.path.join(f"{root}_sample", "02_intermediate", "a.csv"))
+    assert not os.path.exists(os.path.join(root, "02_intermediate"))
+    # Outputs of the sampled run are read back in full
+    assert len(catalog.load("02_intermediate/a.csv")) == 10
+
+
+def test_sampled_chronocoded_wing(tmp_path):
+    raw = tmp_path / "data" / "01_raw"
+    raw.mkdir(parents=True)
+    pd.DataFrame({"a": range(100)}).to_csv(str(raw / "state.csv"), index=False)
+    pipeline = Pipeline(
+        [node(lambda x: x.assign(a=x["a"] + 1), "01_raw/state.csv", "01_raw/state.csv!")]
+    )
+    root = str(tmp_path / "data")
+    sample_path = os.path.join(f"{root}_sample", "01_raw", "state.csv")
+
+    for run in range(2):
+        catalog = DataCatalog()
+        wings = KedroWings(root=root, sample={"01_raw": 10}, precreate_dirs=True)
+        wings.before_pipeline_run({}, pipeline, catalog)
+        # The first run reads a sample of the full data, the next ones the sampled output
+        state = catalog.load("01_raw/state.csv")
+        assert state["a"].tolist() == list(range(run, run + 10))
+        catalog.save("01_raw/state.csv!", state.assign(a=state["a"] + 1))
+        assert os.path.exists(sample_path)
+
+    assert len(pd.read_csv(str(raw / "state.csv"))) == 100
+
+
+def test_sampled_fraction(tmp_path):
+    data = pd.DataFrame({"a": range(1000)})
+    data.to_csv(str(tmp_path / "data.csv"), index=False)
+    data.to_parquet(str(tmp_path / "data.parquet"), row_group_size=100)
+
+    wings = KedroWings(root=str(tmp_path), sample={"": 0.2}, sample_seed=3)
+    catalog = DataCatalog()
+    wings.before_pipeline_run(
+        {}, Pipeline([node(lambda x, y: x, inputs=["data.csv", "data.parquet"], outputs="out")]), catalog
+    )
+
+    sampled_csv = catalog.load("data.csv")
+    assert 100 < len(sampled_csv) < 300
+    assert sampled_csv.equals(catalog.load("data.csv"))
+    assert len(catalog.load("data.parquet")) == 200
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings import plugin
+from kedro_wings.kedro_wings import InvalidShardConfig
+from kedro_wings.sharding import migrate_shards, shard_prefix
+
+
+def test_sharded_wings(tmp_path):
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, "01_raw/a.txt", "02_intermediate/b.txt"),
+            node(lambda x: x, "02_intermediate/b.txt", "02_intermediate/b.txt!"),
+        ]
+    )
+    wings = KedroWings(root=str(tmp_path), shard={"02_intermediate": 2}, precreate_dirs=True)
+    catalog = DataCatalog()
+    wings.before_pipeline_run({}, pipeline, catalog)
+
+    prefix = shard_prefix("b.txt", 2)
+    assert os.path.isdir(tmp_path / "02_intermediate" / prefix)
+    catalog.save("02_intermediate/b.txt", "b")
+    assert (tmp_path / "02_intermediate" / prefix / "b.txt").read_text() == "b"
+    assert catalog.load("02_intermediate/b.txt!") == "b"
+
+    rows = plugin.plan_rows(wings, pipeline, stat=False)
+    assert {r["filepath"] for r in rows if r["name"] == "02_intermediate/b.txt"} == {
+        os.path.join(str(tmp_path), "02_intermediate", prefix, "b.txt")
+    }
+
+    with pytest.raises(InvalidShardConfig):
+        KedroWings(shard={"02_intermediate": 0})
+
+
+def test_migrate_shards(tmp_path):
+    layer = tmp_path / "02_intermediate"
+    (layer / ".history" / "a.csv").mkdir(parents=True)
+    (layer / ".history" / "a.csv" / "20200101T000000000000.csv").write_text("old")
+    for name in ("a.csv", "a.csv.schema.json", "b.pkl"):
+        (layer / name).write_text(name)
+
+    assert len(migrate_shards(str(layer), 2, dry_run=True)) == 4
+    assert (layer / "a.csv").exists()
+
+    migrate_shards(str(layer), 2)
+    a_shard = layer / shard_prefix("a.csv", 2)
+    assert sorted(os.listdir(a_shard)) == [".history", "a.csv", "a.csv.schema.json"]
+    assert (a_shard / ".history" / "a.csv" / "20200101T000000000000.csv").read_text() == "old"
+    assert (layer / shard_prefix("b.pkl", 2) / "b.pkl").read_text() == "b.pkl"
+    assert migrate_shards(str(layer), 2) == []
+
+    # Back to the flat layout
+    migrate_shards(str(layer), 0, from_width=2)
+    assert sorted(os.listdir(layer)) == [".history", "a.csv", "a.csv.schema.json", "b.pkl"]
+    assert (layer / ".history" / "a.csv" / "20200101T000000000000.csv").read_text() == "old"
+
+
+def test_shard_command(tmp_path, monkeypatch):
+    class FakeContext:
+        hooks = (KedroWings(root=str(tmp_path), shard={"02_intermediate": 1}),)
+
+    (tmp_path / "02_intermediate").mkdir()
+    (tmp_path / "02_intermediate" / "b.pkl").write_text("b")
+    monkeypatch.setattr(plugin, "load_context", lambda path, env=None: FakeContext())
+    result = CliRunner().invoke(plugin.commands, ["wings", "shard", "02_intermediate"])
+    assert result.exit_code == 0, result.output
+    assert "Moved 1 files" in result.output
+    assert (tmp_path / "02_intermediate" / shard_prefix("b.pkl", 1) / "b.pkl").exists()
+
+
+def test_migrate_nested_wings(tmp_path):
+    layer = tmp_path / "02_intermediate"
+    (layer / "sub").mkdir(parents=True)
+    (layer / "sub" / "x.txt").write_text("x")
+    (layer / "20200101").mkdir()
+    (layer / "20200101" / "y.txt").write_text("y")
+    (layer / "cats.images").mkdir()
+    (layer / "cats.images" / "0.png").write_text("0")
+
+    migrate_shards(str(layer), 2)
+    assert (layer / "sub" / shard_prefix("x.txt", 2) / "x.txt").read_text() == "x"
+    assert (layer / "20200101" / shard_prefix("y.txt", 2) / "y.txt").read_text() == "y"
+    assert (layer / shard_prefix("cats.images", 2) / "cats.images" / "0.png").exists()
+
+    # Nested wings resolve to the same place at runtime
+    pipeline = Pipeline([node(lambda x: x, "02_intermediate/sub/x.txt", "out")])
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path), shard={"02_intermediate": 2}).before_pipeline_run(
+        {}, pipeline, catalog
+    )
+    assert catalog.load("02_intermediate/sub/x.txt") == "x"
+
+    migrate_shards(str(layer), 0, from_width=2)
+    assert (layer / "sub" / "x.txt").exists()
+    assert sorted(os.listdir(layer / "sub")) == ["x.txt"]
+    assert sorted(os.listdir(layer)) == ["20200101", "cats.images", "sub"]
@@ -0,0 +1,77 @@
+import gzip
+import json
+import pickle
+
+import fsspec
+import pandas as pd
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.sniff import SNIFF_CACHE_NAME, FormatSniffer, sniff_format
+
+
+def test_sniff_format():
+    assert sniff_format(b"PAR1\x15\x04") == "parquet"
+    assert sniff_format(b"ARROW1\x00\x00") == "arrow"
+    assert sniff_format(b"\x89PNG\r\n\x1a\n\x00") == "png"
+    assert sniff_format(b"\xff\xd8\xff\xe0") == "jpeg"
+    assert sniff_format(b"\x28\xb5\x2f\xfd\x00") == "zstd"
+    assert sniff_format(pickle.dumps({"a": 1}, protocol=4)) == "pickle"
+    assert sniff_format(gzip.compress(pickle.dumps([1]))) == "gzip+pickle"
+    assert sniff_format(gzip.compress(b"a,b\n1,2\n")) == "gzip"
+    assert sniff_format(b'  {"a": [1, 2]}') == "json"
+    assert sniff_format(b'{"a": 1}\n{"a": 2}\n') == "jsonl"
+    assert sniff_format(b"a,b\n1,2\n") is None
+
+
+def test_sniff_cache(tmp_path):
+    path = str(tmp_path / "data.bin")
+    with open(path, "wb") as f:
+        f.write(b"PAR1")
+    cache_file = str(tmp_path / "cache.json")
+    fs = fsspec.filesystem("file")
+
+    sniffer = FormatSniffer(cache_file)
+    assert sniffer.sniff(fs, path) == "parquet"
+    assert sniffer.sniff(fs, str(tmp_path / "missing.bin")) is None
+    sniffer.save()
+
+    with open(cache_file) as f:
+        cache = json.load(f)
+    cache[path]["format"] = "png"
+    with open(cache_file, "w") as f:
+        json.dump(cache, f)
+    # Unchanged files are not read again
+    assert FormatSniffer(cache_file).sniff(fs, path) == "png"
+
+    # Changed files are sniffed again
+    with open(path, "ab") as f:
+        f.write(b"\x00")
+    assert FormatSniffer(cache_file).sniff(fs, path) == "parquet"
+
+
+def test_sniffed_wings(tmp_path):
+    raw = tmp_path / "01_raw"
+    raw.mkdir()
+    pd.DataFrame({"a": [1, 2]}).to_parquet(str(raw / "vendor.dat"))
+    (raw / "vendor.bin").write_bytes(pickle.dumps({"a": 1}))
+    (raw / "unknown.bin").write_bytes(b"a,b\n")
+
+    pipeline = Pipeline(
+        [
+            node(
+                lambda a, b, c: a,
+                inputs=["01_raw/vendor.dat", "01_raw/vendor.bin", "01_raw/unknown.bin"],
+                outputs="02_intermediate/out.bin",
+            )
+        ]
+    )
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path), sniff=True).before_pipeline_run({}, pipeline, catalog)
+
+    assert catalog.load("01_raw/vendor.dat")["a"].tolist() == [1, 2]
+    assert catalog.load("01_raw/vendor.bin") == {"a": 1}
+    assert "01_raw/unknown.bin" not in catalog.list()
+    assert "02_intermediate/out.bin" not in catalog.list()
+    assert (tmp_path / SNIFF_CACHE_NAME).exists()
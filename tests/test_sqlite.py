@@ -0,0 +1,117 @@
+import threading
+
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets.sqlite import SQLiteTableDataSet, connection_pool
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", "b", None],
+            "score": [0.5, 1.5, float("nan")],
+            "active": [True, False, True],
+            "created": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+        }
+    )
+
+
+def test_save_and_load(tmp_path, data):
+    filepath = str(tmp_path / "store.sqlite")
+    dataset = SQLiteTableDataSet(filepath, table="customers", chunksize=2, indexes=["id"])
+    assert not dataset.exists()
+    dataset.save(data)
+    assert dataset.exists()
+
+    loaded = dataset.load()
+    assert loaded["id"].tolist() == [1, 2, 3]
+    assert loaded["active"].tolist() == [True, False, True]
+    assert loaded["created"].tolist() == data["created"].tolist()
+    assert loaded["name"].isna().tolist() == [False, False, True]
+
+    filtered = SQLiteTableDataSet(
+        filepath, table="customers", load_args={"columns": ["id"], "where": "id > ?", "params": [1]}
+    ).load()
+    assert filtered.to_dict("list") == {"id": [2, 3]}
+
+    chunks = SQLiteTableDataSet(
+        filepath, table="customers", chunksize=2, load_args={"iterator": True}
+    ).load()
+    assert [len(c) for c in chunks] == [2, 1]
+
+    with connection_pool(filepath).connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = connection.execute("PRAGMA index_list(customers)").fetchall()
+        assert len(indexes) == 1
+
+
+def test_append_and_tables(tmp_path, data):
+    filepath = str(tmp_path / "store.db")
+    appended = SQLiteTableDataSet(filepath, table="events", save_args={"if_exists": "append"})
+    appended.save(data)
+    appended.save(data)
+    assert len(appended.load()) == 6
+
+    everything = SQLiteTableDataSet(filepath)
+    everything.save({"customers": data})
+    assert sorted(everything.load()) == ["customers", "events"]
+
+
+def test_failed_save_is_rolled_back(tmp_path, data):
+    dataset = SQLiteTableDataSet(str(tmp_path / "store.sqlite"), table="customers")
+    dataset.save(data)
+    with pytest.raises(Exception):
+        dataset.save(pd.DataFrame({"a": [object()]}))
+    assert len(dataset.load()) == 3
+
+
+def test_closed_iterator_returns_its_connection(tmp_path, data):
+    filepath = str(tmp_path / "store.sqlite")
+    SQLiteTableDataSet(filepath, table="customers").save(data)
+    pool = connection_pool(filepath)
+    pool.close()
+
+    chunks = SQLiteTableDataSet(
+        filepath, table="customers", chunksize=1, load_args={"iterator": True}
+    ).load()
+    next(chunks)
+    assert pool._idle == []
+    chunks.close()
+    assert len(pool._idle) == 1
+
+    # The closed iterator's read snapshot is released, so a checkpoint can complete
+    with pool.connection() as connection:
+        assert connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0] == 0
+
+
+def test_sqlite_wings(tmp_path, data):
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, inputs="in", outputs="05_model_input/store.sqlite/customers"),
+            node(lambda x: x, inputs="in", outputs="05_model_input/store.sqlite/orders"),
+        ]
+    )
+    catalog = DataCatalog()
+    KedroWings(root=str(tmp_path)).before_pipeline_run({}, pipeline, catalog)
+
+    customers = catalog._data_sets["05_model_input/store.sqlite/customers"]
+    orders = catalog._data_sets["05_model_input/store.sqlite/orders"]
+    assert customers is not orders
+    assert customers._pool() is orders._pool()
+
+    threads = [
+        threading.Thread(target=catalog.save, args=(name, data))
+        for name in ("05_model_input/store.sqlite/customers", "05_model_input/store.sqlite/orders")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(catalog.load("05_model_input/store.sqlite/orders")) == 3
+    assert len(catalog.load("05_model_input/store.sqlite/customers")) == 3
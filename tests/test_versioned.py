@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+
+import fsspec
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+
+from kedro_wings import KedroWings
+from kedro_wings.datasets.versioned import (
+    INDEX_NAME,
+    LOCK_NAME,
+    IndexedVersionedDataSet,
+    VersionIndex,
+)
+from kedro_wings.kedro_wings import InvalidVersionConfig, InvalidVersionedWing
+from kedro_wings.versions import split_version
+
+
+def _dataset(tmp_path, **kwargs):
+    return IndexedVersionedDataSet(
+        {"type": "text.TextDataSet", "filepath": str(tmp_path / "model.txt")}, **kwargs
+    )
+
+
+def test_split_version():
+    assert split_version("06_models/model.pkl~") == ("06_models/model.pkl", "")
+    assert split_version("06_models/model.pkl~2020-01-01T00.00.00.000Z") == (
+        "06_models/model.pkl", "2020-01-01T00.00.00.000Z"
+    )
+    assert split_version("06_models/model.pkl") == ("06_models/model.pkl", None)
+
+
+def test_indexed_versions(tmp_path, monkeypatch):
+    dataset = _dataset(tmp_path, keep=2)
+    assert not dataset.exists()
+    for i in range(3):
+        dataset.save(str(i))
+    versions = dataset.versions()
+    assert len(versions) == 2 and versions == sorted(versions)
+    assert sorted(os.listdir(tmp_path / "model.txt")) == sorted([INDEX_NAME, LOCK_NAME] + versions)
+    with open(tmp_path / "model.txt" / INDEX_NAME) as index_file:
+        assert json.load(index_file)["latest"] == versions[-1]
+
+    # The latest version is read from the index, without listing the versions
+    monkeypatch.setattr(dataset._fs, "glob", None)
+    assert dataset.load() == "2"
+    assert _dataset(tmp_path, load_version=versions[0]).load() == "1"
+
+    assert dataset.prune(1) == versions[:1]
+    assert dataset.versions() == versions[1:]
+
+
+def test_concurrent_index_writers(tmp_path):
+    # Writers with their own index, like the processes of a ParallelRunner
+    def add(writer):
+        index = VersionIndex(fsspec.filesystem("file"), str(tmp_path))
+        for i in range(50):
+            index.add(f"2020-01-01T00.00.{i:02d}.{writer:03d}Z")
+
+    threads = [threading.Thread(target=add, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    versions = VersionIndex(fsspec.filesystem("file"), str(tmp_path)).versions()
+    assert len(versions) == 200 and versions == sorted(versions)
+
+
+def test_index_without_a_lock_recovers_versions():
+    memory_fs = fsspec.filesystem("memory")
+    memory_fs.pipe("/model.txt/2020-01-01T00.00.00.000Z/model.txt", b"0")
+    memory_fs.pipe("/model.txt/2020-01-01T00.00.01.000Z/model.txt", b"1")
+    try:
+        # The first version was overwritten by a concurrent writer's index
+        index = VersionIndex(memory_fs, "/model.txt", "memory")
+        index.add("2020-01-01T00.00.01.000Z")
+        assert index.versions() == ["2020-01-01T00.00.00.000Z", "2020-01-01T00.00.01.000Z"]
+    finally:
+        memory_fs.store.clear()
+        memory_fs.pseudo_dirs[:] = [""]
+
+
+def test_save_after_a_version_from_the_future(tmp_path):
+    dataset = _dataset(tmp_path)
+    future = "2999-12-31T23.59.59.999Z"
+    VersionIndex(dataset._fs, str(tmp_path / "model.txt")).add(future)
+
+    dataset.save("1")
+    assert dataset.versions() == [future, "3000-01-01T00.00.00.000Z"]
+    assert dataset.load() == "1"
+
+
+def test_versioned_wings(tmp_path):
+    pipeline = Pipeline(
+        [
+            node(lambda x: x, "01_raw/a.txt", "06_models/model.txt"),
+            node(lambda x: x, "06_models/model.txt", "07_model_output/out.txt~"),
+        ]
+    )
+    catalog = DataCatalog()
+    wings = KedroWings(root=str(tmp_path), versioned={"layers": ["06_models"], "keep": 3})
+    wings.before_pipeline_run({}, pipeline, catalog)
+
+    catalog.save("06_models/model.txt", "v1")
+    catalog.save("06_models/model.txt", "v2")
+    catalog.save("07_model_output/out.txt~", "out")
+    assert catalog.load("06_models/model.txt") == "v2"
+    assert catalog.load("07_model_output/out.txt~") == "out"
+    first, _ = catalog._data_sets["06_models/model.txt"].versions()
+
+    # Pinned by the name, or by kedro's --load-version
+    pinned = wings._create_wing_entries([f"06_models/model.txt~{first}"])
+    assert pinned[f"06_models/model.txt~{first}"].load() == "v1"
+    catalog = DataCatalog()
+    wings.before_pipeline_run({"load_versions": {"06_models/model.txt": first}}, pipeline, catalog)
+    assert catalog.load("06_models/model.txt") == "v1"
+
+    with pytest.raises(InvalidVersionedWing):
+        wings._create_wing_entries(["06_models/store.sqlite/table~"])
+    with pytest.raises(InvalidVersionConfig):
+        KedroWings(versioned={"keep": 0})
+
+
+def test_remote_versioned_wings_share_the_pool(tmp_path):
+    memory_fs = fsspec.filesystem("memory")
+    wings = KedroWings(
+        root="memory:///wings", cache={"directory": str(tmp_path)}, versioned={"layers": ["06_models"]}
+    )
+    dataset = wings._create_wing_entries(["06_models/model.txt"])["06_models/model.txt"]
+    try:
+        dataset.save("v1")
+        assert dataset.load() == "v1"
+        shared_fs = wings._filesystems.get("memory")
+        assert dataset._fs is shared_fs and dataset._index._fs is shared_fs
+        assert all(version._fs is shared_fs for version in dataset._datasets.values())
+        # Loads are served by the cache
+        assert shared_fs._cache.hits + shared_fs._cache.misses > 0
+    finally:
+        memory_fs.store.clear()
+        memory_fs.pseudo_dirs[:] = [""]
+
+
+def test_sampled_versioned_wings(tmp_path):
+    _dataset(tmp_path / "06_models", keep=None).save("a\nb\nc")
+    wings = KedroWings(root=str(tmp_path), versioned={"layers": ["06_models"]}, sample={"06_models": 1})
+    dataset = wings._create_wing_entries(["06_models/model.txt"])["06_models/model.txt"]
+    assert dataset.load() == "a"
@@ -83,3 +83,20 @@ def test_managing_namespaces():
                     f"{parsed_wing.directory}/{parsed_wing.name}{parsed_wing.extension}"
                     == valid_catalog_name
             )
+
+
+def test_parse_container_members():
+    extensions = {".sqlite", ".csv"}
+    containers = {".sqlite"}
+    assert parse_wing_info(
+        "05_model_input/store.sqlite/customers", extensions, ["ns"], containers
+    ) == WingInfo("05_model_input", "store", ".sqlite", "store.sqlite", "", "customers")
+    assert parse_wing_info(
+        "ns.05_model_input/store.sqlite/customers", extensions, ["ns"], containers
+    ) == WingInfo("05_model_input", "store", ".sqlite", "store.ns.sqlite", "ns", "customers")
+    # Files in a directory named like a container are still plain wings
+    assert parse_wing_info("01_raw/dump.sqlite/data.csv", extensions, [], containers).extension == ".csv"
+    assert parse_wing_info("01_raw/store.sqlite/a/b", extensions, [], containers) == WingInfo()
+    assert parse_wing_info(
+        "01_raw/budget.xlsx#Q3 Plan", {".xlsx"}, [], {".xlsx"}
+    ) == WingInfo("01_raw", "budget", ".xlsx", "budget.xlsx", "", "Q3 Plan")
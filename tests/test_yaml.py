@@ -0,0 +1,15 @@
+from kedro_wings.datasets.yaml import FastYAMLDataSet
+
+
+def test_fast_yaml_round_trip(tmp_path):
+    dataset = FastYAMLDataSet(str(tmp_path / "data.yml"))
+    data = {"a": [1, 2], "b": {"c": "d"}}
+    dataset.save(data)
+    assert dataset.load() == data
+
+
+def test_fast_yaml_python_objects(tmp_path):
+    dataset = FastYAMLDataSet(str(tmp_path / "data.yml"))
+    dataset.save({"a": 1 + 2j})
+    with open(str(tmp_path / "data.yml")) as f:
+        assert "python/complex" in f.read()